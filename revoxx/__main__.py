@@ -1,6 +1,9 @@
 """Main entry point for running revoxx as a module."""
 
-from .app import main
+# Import the lightweight package entry point rather than the app module:
+# processes started with "spawn" re-import this module, and the audio
+# processes do not need Tk or matplotlib.
+from . import main
 
 if __name__ == "__main__":
     main()
@@ -1,12 +1,17 @@
 """Main application for Revoxx"""
 
-# Set matplotlib backend before any matplotlib imports
+# Set matplotlib backend before any matplotlib imports. All figures are
+# embedded explicitly via FigureCanvasTkAgg, so the global (pyplot) backend
+# only needs to be the non-interactive Agg renderer.
 import matplotlib
 
-matplotlib.use("TkAgg")
+matplotlib.use("Agg")
 
 import argparse
+import platform
 import sys
+from dataclasses import replace
+from functools import cached_property, partial
 from pathlib import Path
 from typing import Optional
 import traceback
@@ -21,10 +26,10 @@ from .utils.process_cleanup import ProcessCleanupManager
 from .ui.window_manager import WindowManager
 from .ui.menus.application_menu import ApplicationMenu
 from .ui.themes import theme_manager, ThemePreset
-from .utils.device_manager import get_device_manager
 from .audio.buffer_manager import BufferManager
 from .audio.shared_state import SharedState
-from .session import SessionManager, Session
+from .audio.audio_ring_buffer import AudioRingBuffer
+from .session import SessionManager, Session, SessionConfig
 
 # Import all controllers
 from .controllers import (
@@ -40,6 +45,25 @@ from .controllers import (
     ProcessManager,
 )
 
+# Platform is fixed for the lifetime of the process
+_IS_MACOS = platform.system() == "Darwin"
+
+
+class _KeyAction:
+    """Tk event handler that invokes an action without the event argument.
+
+    The action's return value is passed back to Tk, so actions returning
+    "break" still stop event propagation.
+    """
+
+    __slots__ = ("action",)
+
+    def __init__(self, action):
+        self.action = action
+
+    def __call__(self, event):
+        return self.action()
+
 
 class Revoxx:
     """Main application class for Revoxx - Refactored version.
@@ -114,47 +138,37 @@ class Revoxx:
         # Initialize shared state for audio
         self.shared_state = SharedState(create=True)
 
-        # Initialize audio settings in shared state
-        format_type = 1 if FileConstants.AUDIO_FILE_EXTENSION == ".flac" else 0
-        self.shared_state.update_audio_settings(
+        # Initialize audio settings, recording (STOPPED) and playback (IDLE)
+        # state in shared memory
+        self.shared_state.initialize(
             sample_rate=self.config.audio.sample_rate,
             bit_depth=self.config.audio.bit_depth,
             channels=self.config.audio.channels,
-            format_type=format_type,
+            format_type=FileConstants.AUDIO_FORMAT_TYPE,
         )
 
-        # Initialize recording state to STOPPED
-        self.shared_state.stop_recording()
-
-        # Initialize playback state to IDLE
-        self.shared_state.stop_playback()
+        # Ring buffer for streaming recorded audio to the live spectrogram
+        self.audio_ring = AudioRingBuffer(create=True)
 
         # Initialize buffer manager
         self.buffer_manager = BufferManager()
 
-        # Initialize device state flags
-        self._default_input_in_effect = False
-        self._default_output_in_effect = False
-        self._notified_default_input = False
-        self._notified_default_output = False
+        # Set when opening the output stream failed
         self.last_output_error = False
 
         # Initialize process manager first (creates queues and shared resources)
         self.process_manager = ProcessManager(self)
 
         # Copy references for compatibility
-        self.manager_dict = self.process_manager.manager_dict
         self.shutdown_event = self.process_manager.shutdown_event
         self.queue_manager = self.process_manager.queue_manager
 
-        # Initialize manager_dict state
-        self.manager_dict["recording"] = False
-        self.manager_dict["playing"] = False
-        self.process_manager.set_audio_queue_active(
+        # Flags read by the record process live in shared memory, so the
+        # audio callback only does plain memory reads
+        self.shared_state.set_audio_queue_active(
             self.settings_manager.settings.show_meters
         )
-        self.process_manager.set_save_path(None)
-        self.manager_dict["debug"] = self.debug
+        self.shared_state.set_debug(self.debug)
 
         # Start background processes BEFORE UI initialization (like in original)
         self.process_manager.start_processes()
@@ -216,27 +230,27 @@ class Revoxx:
         # Show window
         self.window.window.deiconify()
 
-        # Initial display update
+        # Initial display update now that the window has real dimensions.
+        # load_session() has already resumed the last position and scheduled
+        # showing its recording, so that is not repeated here.
         self.display_controller.update_display()
 
-        # Resume at last position if available
-        if self.current_session:
-            self.navigation_controller.resume_session_position()
-            self.display_controller.show_saved_recording_when_ready()
-
-        # Start audio queue processing transfer thread
-        # This thread runs continuously and transfers audio data from the recording process
-        # to the UI widgets when they are available. It polls every 100ms.
-        # The thread will discard data if no widget is available to display it.
-        self.audio_controller.start_audio_queue_processing()
+        # Start the audio transfer thread if any window shows its meters.
+        # The thread transfers audio data from the recording process's ring
+        # buffer to the UI widgets and wakes up when the recorder signals new
+        # data. It is started and stopped as the meters are toggled.
+        self.audio_controller.update_audio_queue_state()
 
         # Bind keyboard shortcuts
         self._bind_keys()
 
     def _init_controllers(self):
-        """Initialize all controllers."""
-        from .controllers.asr_auto_controller import ASRAutoController
+        """Initialize controllers needed during startup.
 
+        The ASR auto-verification controller is only needed once a
+        recording has been saved or the ASR menu is opened, so it is
+        created on first access (see asr_auto_controller).
+        """
         self.audio_controller = AudioController(self)
         self.navigation_controller = NavigationController(self)
         self.flag_controller = FlagController(self)
@@ -246,7 +260,13 @@ class Revoxx:
         self.file_operations_controller = FileOperationsController(self)
         self.dialog_controller = DialogController(self)
         self.edit_controller = EditController(self)
-        self.asr_auto_controller = ASRAutoController(self)
+
+    @cached_property
+    def asr_auto_controller(self):
+        """Get the ASR auto-verification controller, creating it on first use."""
+        from .controllers.asr_auto_controller import ASRAutoController
+
+        return ASRAutoController(self)
 
     def _populate_app_callbacks(self):
         """Populate app_callbacks dictionary with controller methods."""
@@ -296,11 +316,13 @@ class Revoxx:
         """Apply saved settings to configuration."""
         settings = self.settings_manager.settings
 
-        # Audio settings
-        self.config.audio.sample_rate = settings.sample_rate
-        self.config.audio.bit_depth = settings.bit_depth
-        self.config.audio.sync_response_time_ms = settings.audio_sync_response_time_ms
-        self.config.audio.__post_init__()  # Update dtype and subtype
+        # Audio settings (replace() derives dtype and subtype once)
+        self.config.audio = replace(
+            self.config.audio,
+            sample_rate=settings.sample_rate,
+            bit_depth=settings.bit_depth,
+            sync_response_time_ms=settings.audio_sync_response_time_ms,
+        )
 
         # Apply device settings through controller
         self.device_controller.apply_saved_settings()
@@ -311,263 +333,128 @@ class Revoxx:
 
     def _bind_keys(self):
         """Bind keyboard shortcuts."""
-        # Recording controls
-        self.window.window.bind(
-            f"<{KeyBindings.RECORD}>",
-            lambda e: self.audio_controller.toggle_recording(),
-        )
-        self.window.window.bind(
-            f"<{KeyBindings.PLAY}>", lambda e: self.audio_controller.play_current()
-        )
-        self.window.window.bind(
-            f"<{KeyBindings.STOP}>",
-            lambda e: self.audio_controller.stop_all_playback_activities(),
-        )
-        self.window.window.bind(
-            "<Control-d>",
-            lambda e: self._handle_delete(),
-        )
-        self.window.window.bind(
-            "<Control-D>",
-            lambda e: self._handle_delete(),
-        )
-
-        # Navigation keys
-        self.window.window.bind(
-            f"<{KeyBindings.NAVIGATE_UP}>",
-            lambda e: self.navigation_controller.navigate(-1),
-        )
-        self.window.window.bind(
-            f"<{KeyBindings.NAVIGATE_DOWN}>",
-            lambda e: self.navigation_controller.navigate(1),
-        )
-
-        # Browse takes
-        self.window.window.bind(
-            f"<{KeyBindings.BROWSE_TAKES_LEFT}>",
-            lambda e: self.navigation_controller.browse_takes(-1),
-        )
-        self.window.window.bind(
-            f"<{KeyBindings.BROWSE_TAKES_RIGHT}>",
-            lambda e: self.navigation_controller.browse_takes(1),
-        )
-
-        # Toggle displays
+        window = self.window.window
+
+        # Single-key shortcuts: (sequence, action)
+        key_bindings = [
+            # Recording controls
+            (f"<{KeyBindings.RECORD}>", self.audio_controller.toggle_recording),
+            (f"<{KeyBindings.PLAY}>", self.audio_controller.play_current),
+            (
+                f"<{KeyBindings.STOP}>",
+                self.audio_controller.stop_all_playback_activities,
+            ),
+            # Navigation and take browsing
+            (
+                f"<{KeyBindings.NAVIGATE_UP}>",
+                partial(self.navigation_controller.navigate, -1),
+            ),
+            (
+                f"<{KeyBindings.NAVIGATE_DOWN}>",
+                partial(self.navigation_controller.navigate, 1),
+            ),
+            (
+                f"<{KeyBindings.BROWSE_TAKES_LEFT}>",
+                partial(self.navigation_controller.browse_takes, -1),
+            ),
+            (
+                f"<{KeyBindings.BROWSE_TAKES_RIGHT}>",
+                partial(self.navigation_controller.browse_takes, 1),
+            ),
+            # Displays, monitoring, help and info
+            (
+                f"<{KeyBindings.TOGGLE_MONITORING}>",
+                self.audio_controller.toggle_monitoring,
+            ),
+            (f"<{KeyBindings.TOGGLE_FULLSCREEN}>", self._toggle_fullscreen),
+            (f"<{KeyBindings.SHOW_HELP}>", self.dialog_controller.show_help),
+            (f"<{KeyBindings.SHOW_INFO}>", self.display_controller.toggle_info_panel),
+            (f"<{KeyBindings.TOGGLE_ASR_DISPLAY}>", self._toggle_asr_display),
+            # Escape: clear selection
+            ("<Escape>", self._handle_escape),
+            # Second window shortcuts (Shift + key)
+            ("<Shift-M>", self._toggle_second_window_meters),
+            ("<Shift-I>", self._toggle_second_window_info_panel),
+            ("<Shift-F10>", self._toggle_second_window_fullscreen),
+            # Flagging shortcuts (Shift+key to toggle flags)
+            (
+                f"<Shift-{KeyBindings.FLAG_NEEDS_EDIT}>",
+                self.flag_controller.toggle_needs_edit,
+            ),
+            (
+                f"<Shift-{KeyBindings.FLAG_REJECTED}>",
+                self.flag_controller.toggle_rejected,
+            ),
+            (f"<Shift-{KeyBindings.FLAG_CLEAR}>", self.flag_controller.clear_flag),
+        ]
+        toggle_meters = partial(self.display_controller.toggle_meters, "main")
         for key in KeyBindings.TOGGLE_SPECTROGRAM:
-            self.window.window.bind(
-                f"<{key}>", lambda e: self.display_controller.toggle_meters("main")
-            )
-
-        # Dialog keys
-        self.window.window.bind(
-            "<Control-f>", lambda e: self.dialog_controller.show_find_dialog()
-        )
-        self.window.window.bind(
-            "<Control-F>", lambda e: self.dialog_controller.show_find_dialog()
-        )
-        self.window.window.bind(
-            "<Control-u>",
-            lambda e: self.dialog_controller.show_utterance_order_dialog(),
-        )
-        self.window.window.bind(
-            "<Control-U>",
-            lambda e: self.dialog_controller.show_utterance_order_dialog(),
-        )
-        self.window.window.bind("<Control-q>", lambda e: self._quit())
-        self.window.window.bind("<Control-Q>", lambda e: self._quit())
-
-        # Additional key bindings
-        self.window.window.bind(
-            f"<{KeyBindings.TOGGLE_MONITORING}>",
-            lambda e: self.audio_controller.toggle_monitoring(),
-        )
-        self.window.window.bind(
-            f"<{KeyBindings.TOGGLE_FULLSCREEN}>", lambda e: self._toggle_fullscreen()
-        )
-
-        # Delete recording (both Control and no modifier variants)
-        import platform
-
-        if platform.system() == "Darwin":  # macOS
-            modifier = "Command"
-        else:
-            modifier = "Control"
-        self.window.window.bind(
-            f"<{modifier}-{KeyBindings.DELETE_RECORDING}>",
-            lambda e: self._handle_delete(),
-        )
-
-        # Help and info
-        self.window.window.bind(
-            f"<{KeyBindings.SHOW_HELP}>", lambda e: self.dialog_controller.show_help()
-        )
-        self.window.window.bind(
-            f"<{KeyBindings.SHOW_INFO}>",
-            lambda e: self.display_controller.toggle_info_panel(),
-        )
-
-        # Toggle ASR transcription display
-        self.window.window.bind(
-            f"<{KeyBindings.TOGGLE_ASR_DISPLAY}>",
-            lambda e: self._toggle_asr_display(),
-        )
-
-        # Escape: clear selection
-        self.window.window.bind("<Escape>", lambda e: self._handle_escape())
-
-        # Second window shortcuts (Shift + key)
-        self.window.window.bind(
-            "<Shift-M>",
-            lambda e: self._toggle_second_window_meters(),
-        )
-        self.window.window.bind(
-            "<Shift-I>",
-            lambda e: self._toggle_second_window_info_panel(),
-        )
-        self.window.window.bind(
-            "<Shift-F10>",
-            lambda e: self._toggle_second_window_fullscreen(),
-        )
-
-        # Flagging shortcuts (Shift+key to toggle flags)
-        self.window.window.bind(
-            f"<Shift-{KeyBindings.FLAG_NEEDS_EDIT}>",
-            lambda e: self.flag_controller.toggle_needs_edit(),
-        )
-        self.window.window.bind(
-            f"<Shift-{KeyBindings.FLAG_REJECTED}>",
-            lambda e: self.flag_controller.toggle_rejected(),
-        )
-        self.window.window.bind(
-            f"<Shift-{KeyBindings.FLAG_CLEAR}>",
-            lambda e: self.flag_controller.clear_flag(),
-        )
-
-        # Jump to flagged (Ctrl+key)
-        self.window.window.bind(
-            "<Control-e>",
-            lambda e: self.flag_controller.jump_to_next("needs_edit"),
-        )
-        self.window.window.bind(
-            "<Control-E>",
-            lambda e: self.flag_controller.jump_to_next("needs_edit"),
-        )
-        self.window.window.bind(
-            "<Control-x>",
-            lambda e: self.flag_controller.jump_to_next("rejected"),
-        )
-        self.window.window.bind(
-            "<Control-X>",
-            lambda e: self.flag_controller.jump_to_next("rejected"),
-        )
-        self.window.window.bind(
-            "<Control-a>",
-            lambda e: self.flag_controller.jump_to_next_asr_mismatch(),
-        )
-        self.window.window.bind(
-            "<Control-A>",
-            lambda e: self.flag_controller.jump_to_next_asr_mismatch(),
-        )
-        self.window.window.bind(
-            "<Shift-Control-a>",
-            lambda e: self.flag_controller.toggle_asr_match(),
-        )
-        self.window.window.bind(
-            "<Shift-Control-A>",
-            lambda e: self.flag_controller.toggle_asr_match(),
-        )
-
-        # Session management with platform-specific modifiers
-        if platform.system() == "Darwin":  # macOS uses Command
-            self.window.window.bind("<Command-n>", lambda e: self._new_session())
-            self.window.window.bind("<Command-N>", lambda e: self._new_session())
-            self.window.window.bind("<Command-o>", lambda e: self._open_session())
-            self.window.window.bind("<Command-O>", lambda e: self._open_session())
-            self.window.window.bind(
-                "<Command-i>", lambda e: self.dialog_controller.show_settings_dialog()
-            )
-            self.window.window.bind(
-                "<Command-I>", lambda e: self.dialog_controller.show_settings_dialog()
-            )
-            self.window.window.bind(
-                "<Command-f>", lambda e: self.dialog_controller.show_find_dialog()
-            )
-            self.window.window.bind(
-                "<Command-F>", lambda e: self.dialog_controller.show_find_dialog()
-            )
-            self.window.window.bind(
-                "<Command-u>",
-                lambda e: self.dialog_controller.show_utterance_order_dialog(),
-            )
-            self.window.window.bind(
-                "<Command-U>",
-                lambda e: self.dialog_controller.show_utterance_order_dialog(),
-            )
-            # Override macOS Cmd+Q behavior
-            self.window.window.bind("<Command-q>", lambda e: self._handle_cmd_q())
-            self.window.window.bind("<Command-Q>", lambda e: self._handle_cmd_q())
-            # Also try to catch it with createcommand
-            self.window.window.createcommand("::tk::mac::Quit", self._handle_cmd_q)
-            # Undo/Redo
-            self.window.window.bind("<Command-z>", lambda e: self._undo())
-            self.window.window.bind("<Command-Z>", lambda e: self._undo())
-            self.window.window.bind("<Shift-Command-z>", lambda e: self._redo())
-            self.window.window.bind("<Shift-Command-Z>", lambda e: self._redo())
-            # Replace with reference silence
-            self.window.window.bind(
-                "<Command-0>", lambda e: self._replace_with_reference_silence()
-            )
-            # Jump to flagged (Command+key on macOS)
-            self.window.window.bind(
-                "<Command-e>",
-                lambda e: self.flag_controller.jump_to_next("needs_edit"),
-            )
-            self.window.window.bind(
-                "<Command-E>",
-                lambda e: self.flag_controller.jump_to_next("needs_edit"),
-            )
-            self.window.window.bind(
-                "<Command-x>",
-                lambda e: self.flag_controller.jump_to_next("rejected"),
-            )
-            self.window.window.bind(
-                "<Command-X>",
-                lambda e: self.flag_controller.jump_to_next("rejected"),
-            )
-            self.window.window.bind(
-                "<Command-a>",
-                lambda e: self.flag_controller.jump_to_next_asr_mismatch(),
-            )
-            self.window.window.bind(
-                "<Command-A>",
-                lambda e: self.flag_controller.jump_to_next_asr_mismatch(),
-            )
-            self.window.window.bind(
-                "<Shift-Command-a>",
-                lambda e: self.flag_controller.toggle_asr_match(),
-            )
-            self.window.window.bind(
-                "<Shift-Command-A>",
-                lambda e: self.flag_controller.toggle_asr_match(),
-            )
-
-        # Session keys
-        self.window.window.bind("<Control-n>", lambda e: self._new_session())
-        self.window.window.bind("<Control-N>", lambda e: self._new_session())
-        self.window.window.bind("<Control-o>", lambda e: self._open_session())
-        self.window.window.bind("<Control-O>", lambda e: self._open_session())
-        # Undo/Redo (Control for Linux/Windows)
-        self.window.window.bind("<Control-z>", lambda e: self._undo())
-        self.window.window.bind("<Control-Z>", lambda e: self._undo())
-        self.window.window.bind("<Shift-Control-z>", lambda e: self._redo())
-        self.window.window.bind("<Shift-Control-Z>", lambda e: self._redo())
-        # Replace with reference silence (Control for Linux/Windows)
-        self.window.window.bind(
-            "<Control-0>", lambda e: self._replace_with_reference_silence()
-        )
+            key_bindings.append((f"<{key}>", toggle_meters))
+
+        # Modifier shortcuts, bound for lower- and upper-case letters:
+        # (modifiers, letter, action). Control works on all platforms.
+        shortcut_actions = [
+            (KeyBindings.DELETE_RECORDING, self._handle_delete),
+            (KeyBindings.FIND_UTTERANCE, self.dialog_controller.show_find_dialog),
+            ("u", self.dialog_controller.show_utterance_order_dialog),
+            (
+                KeyBindings.JUMP_NEEDS_EDIT,
+                partial(self.flag_controller.jump_to_next, "needs_edit"),
+            ),
+            (
+                KeyBindings.JUMP_REJECTED,
+                partial(self.flag_controller.jump_to_next, "rejected"),
+            ),
+            ("a", self.flag_controller.jump_to_next_asr_mismatch),
+            (KeyBindings.NEW_SESSION, self._new_session),
+            (KeyBindings.OPEN_SESSION, self._open_session),
+            ("z", self._undo),
+            ("0", self._replace_with_reference_silence),
+        ]
+        shifted_actions = [
+            ("a", self.flag_controller.toggle_asr_match),
+            ("z", self._redo),
+        ]
+        shortcuts = [("Control", key, action) for key, action in shortcut_actions]
+        shortcuts += [("Shift-Control", key, action) for key, action in shifted_actions]
+        shortcuts.append(("Control", KeyBindings.QUIT, self._quit))
+
+        if _IS_MACOS:
+            # macOS uses Command in addition to Control
+            shortcuts += [("Command", key, action) for key, action in shortcut_actions]
+            shortcuts += [
+                ("Shift-Command", key, action) for key, action in shifted_actions
+            ]
+            shortcuts += [
+                ("Command", "i", self.dialog_controller.show_settings_dialog),
+                # Override macOS Cmd+Q behavior
+                ("Command", KeyBindings.QUIT, self._handle_cmd_q),
+            ]
+
+        for modifiers, key, action in shortcuts:
+            key_bindings.append((f"<{modifiers}-{key.lower()}>", action))
+            if key.upper() != key.lower():
+                key_bindings.append((f"<{modifiers}-{key.upper()}>", action))
+
+        # Bind each action once; actions with several key sequences are
+        # dispatched through a virtual event carrying all of them
+        sequences_by_action = {}
+        for sequence, action in key_bindings:
+            sequences_by_action.setdefault(action, []).append(sequence)
+
+        for index, (action, sequences) in enumerate(sequences_by_action.items()):
+            if len(sequences) > 1:
+                virtual_event = f"<<KeyAction{index}>>"
+                window.event_add(virtual_event, *sequences)
+                sequences = [virtual_event]
+            window.bind(sequences[0], _KeyAction(action))
+
+        if _IS_MACOS:
+            # Also try to catch Cmd+Q with createcommand
+            window.createcommand("::tk::mac::Quit", self._handle_cmd_q)
 
         # Window close event
-        self.window.window.protocol("WM_DELETE_WINDOW", self._quit)
+        window.protocol("WM_DELETE_WINDOW", self._quit)
 
     def _new_session(self, default_script=None):
         """Create a new session.
@@ -575,8 +462,6 @@ class Revoxx:
         Args:
             default_script: Optional path to a script file to use for the new session
         """
-        from .session import SessionConfig
-
         result = self.dialog_controller.show_new_session_dialog(
             default_script=default_script
         )
@@ -666,6 +551,10 @@ class Revoxx:
     def _perform_cleanup(self):
         """Perform cleanup when signals are received or on emergency exit."""
         # Only do critical cleanup - no UI interactions
+        if hasattr(self, "audio_controller"):
+            # Stop the transfer thread before shared memory is released
+            self.audio_controller.stop_audio_queue_processing()
+
         if hasattr(self, "process_manager"):
             if self.debug:
                 print("[App] Shutting down process manager...")
@@ -685,6 +574,11 @@ class Revoxx:
             self.shared_state.close()
             self.shared_state.unlink()
 
+        # Clean up visualization ring buffer
+        if hasattr(self, "audio_ring"):
+            self.audio_ring.close()
+            self.audio_ring.unlink()
+
     def _quit(self):
         """Quit the application."""
         if self.debug:
@@ -783,6 +677,7 @@ class Revoxx:
     def _update_second_window_content(self) -> None:
         """Update second window with current content from main window."""
         if self.has_active_second_window:
+            self.display_controller.invalidate_display()
             self.display_controller.update_display()
             self.display_controller.update_info_panel()
             self.display_controller.show_saved_recording()
@@ -815,31 +710,21 @@ class Revoxx:
         Args:
             device_type: Either 'output' or 'input'
         """
-        if device_type == "output":
-            # If default output device is in effect and not yet notified, inform user once
-            if self._default_output_in_effect and not self._notified_default_output:
-                self.display_controller.set_status(
-                    "Using system default output device (no saved/available selection)",
-                    MsgType.TEMPORARY,
-                )
-                self._notified_default_output = True
-
-            # Additionally, warn once if last stream open failed
-            if hasattr(self, "last_output_error") and self.last_output_error:
-                self.display_controller.set_status(
-                    "Output device unavailable. Using system default if possible.",
-                    MsgType.TEMPORARY,
-                )
-                self.last_output_error = False
+        # The device controller tracks which default device is in effect
+        if self.device_controller.claim_default_device_notice(device_type):
+            self.display_controller.set_status(
+                f"Using system default {device_type} device "
+                "(no saved/available selection)",
+                MsgType.TEMPORARY,
+            )
 
-        elif device_type == "input":
-            # If default input device is in effect and not yet notified, inform user once
-            if self._default_input_in_effect and not self._notified_default_input:
-                self.display_controller.set_status(
-                    "Using system default input device (no saved/available selection)",
-                    MsgType.TEMPORARY,
-                )
-                self._notified_default_input = True
+        # Additionally, warn once if last output stream open failed
+        if device_type == "output" and self.last_output_error:
+            self.display_controller.set_status(
+                "Output device unavailable. Using system default if possible.",
+                MsgType.TEMPORARY,
+            )
+            self.last_output_error = False
 
     @property
     def has_active_second_window(self) -> bool:
@@ -914,6 +799,9 @@ def parse_arguments() -> argparse.Namespace:
 
 def _handle_show_devices() -> None:
     """Display available audio devices and exit."""
+    # Imported here so device enumeration is only set up when requested
+    from .utils.device_manager import get_device_manager
+
     device_manager = get_device_manager()
     print("\nInput Devices:")
     for device in device_manager.get_input_devices():
@@ -935,19 +823,20 @@ def _apply_command_line_overrides(args, config) -> None:
         args: Parsed command line arguments
         config: Application configuration to modify
     """
+    audio_overrides = {}
     if args.audio_device:
         # Set both input and output to the same device
-        config.audio.input_device = args.audio_device
-        config.audio.output_device = args.audio_device
+        audio_overrides["input_device"] = args.audio_device
+        audio_overrides["output_device"] = args.audio_device
     if args.audio_in is not None:
-        config.audio.input_device = args.audio_in
+        audio_overrides["input_device"] = args.audio_in
     if args.audio_out is not None:
-        config.audio.output_device = args.audio_out
+        audio_overrides["output_device"] = args.audio_out
+    if audio_overrides:
+        config.audio = replace(config.audio, **audio_overrides)
 
-    # Set display defaults to True (configurable in app)
-    config.display.show_spectrogram = True
-    config.display.show_info_overlay = True
-    config.display.show_level_meter = True
+    # Spectrogram is shown by default (configurable in app)
+    config.display = replace(config.display, show_spectrogram=True)
 
 
 def _load_session_from_args(args, session_manager):
@@ -1,27 +1,32 @@
 """Audio queue processor for handling real-time audio data transfer to UI.
 
-This module processes audio data from the queue and updates UI components
-in a thread-safe manner.
+This module reads recorded audio from the shared memory ring buffer and
+updates UI components in a thread-safe manner.
 """
 
 import threading
-import queue
 import time
-from typing import Any, Optional, TYPE_CHECKING
+from typing import Optional, Tuple, TYPE_CHECKING
+
+import numpy as np
 
 if TYPE_CHECKING:
     from ..app import Revoxx
 
 
 class AudioQueueProcessor:
-    """Processes audio data from queue and updates UI components.
+    """Processes audio data from the ring buffer and updates UI components.
 
     This class handles the low-level details of:
     - Managing the audio transfer thread
-    - Processing different audio data formats
+    - Draining the record process's AudioRingBuffer
     - Updating UI components in a thread-safe manner
     """
 
+    # Minimum time between dispatches to the widgets (~one display frame);
+    # samples arriving in between are coalesced by the ring buffer
+    MIN_DISPATCH_INTERVAL = 0.016
+
     def __init__(self, app: "Revoxx"):
         """Initialize the audio queue processor.
 
@@ -30,6 +35,9 @@ class AudioQueueProcessor:
         """
         self.app = app
         self.transfer_thread: Optional[threading.Thread] = None
+        self._data_ready = None
+        self._last_dispatch = 0.0
+        self._debug_reported = False
         self._running = False
 
     def start(self) -> None:
@@ -38,6 +46,9 @@ class AudioQueueProcessor:
             return
 
         self._running = True
+        # Samples left over from an earlier run are stale
+        self.app.audio_ring.discard()
+        self._data_ready = self.app.process_manager.data_ready
         self.app.process_manager.set_audio_queue_active(True)
 
         self.transfer_thread = threading.Thread(target=self._worker_loop)
@@ -47,28 +58,31 @@ class AudioQueueProcessor:
     def stop(self) -> None:
         """Stop the audio queue processing thread."""
         self._running = False
-        if self.app.manager_dict:
-            self.app.process_manager.set_audio_queue_active(False)
+        self.app.process_manager.set_audio_queue_active(False)
+
+        # Wake the worker so it notices the stop request immediately
+        if self._data_ready is not None:
+            self._data_ready.set()
 
         if self.transfer_thread and self.transfer_thread.is_alive():
             self.transfer_thread.join(timeout=1.0)
             self.transfer_thread = None
 
     def update_state(self) -> None:
-        """Update processing state based on UI visibility."""
-        # Check any window setting
-        needs_audio = False
+        """Start or stop processing depending on UI visibility.
 
-        if hasattr(self.app, "window_manager") and self.app.window_manager:
-            active_windows = self.app.window_manager.get_active_windows()
-            for window in active_windows:
-                meters_vis = getattr(window, "meters_visible", False)
-                if meters_vis:
-                    needs_audio = True
-                    break
+        The transfer thread only runs while at least one window shows its
+        meters, so hidden meters cost no wake-ups.
+        """
+        needs_audio = any(
+            window.meters_visible
+            for window in self.app.window_manager.get_active_windows()
+        )
 
-        if self.app.manager_dict:
-            self.app.process_manager.set_audio_queue_active(needs_audio)
+        if needs_audio:
+            self.start()
+        else:
+            self.stop()
 
     def _worker_loop(self) -> None:
         """Main worker loop for processing audio queue."""
@@ -85,36 +99,34 @@ class AudioQueueProcessor:
         Returns:
             True if processing should continue, False otherwise
         """
-        # Only check _running - thread should keep running even when meters are off
-        if not self._running:
-            return False
-
-        # Thread keeps running regardless of audio_queue_active
-        return True
+        return self._running
 
     def _process_queue_item(self) -> None:
-        """Process a single item from the audio queue."""
-        # Check if we should process audio data
-        is_active = self.app.process_manager.is_audio_queue_active()
-        if not is_active:
-            # Meters are off - just sleep a bit to avoid busy waiting
-            time.sleep(0.1)
-            return
-
-        # Meters are on - process normally
+        """Wait for new audio in the ring buffer and dispatch it."""
         try:
-            audio_data = self.app.queue_manager.get_audio_data(timeout=0.1)
-
-            # Process audio data based on its type
-            if isinstance(audio_data, dict):
-                self._handle_dict_format(audio_data)
-            else:
-                # Raw numpy array format
-                self._handle_raw_format(audio_data)
-        except queue.Empty:
-            pass  # Timeout is normal
-        except queue.Full:
-            pass  # Output queue full, skip
+            # Block until the record process signals new data or stop()
+            # wakes the thread; there is no polling timeout
+            self._data_ready.wait()
+            self._data_ready.clear()
+
+            if not self.app.process_manager.is_audio_queue_active():
+                # Meters are off - drop stale samples
+                self.app.audio_ring.discard()
+                return
+
+            # Let recorder blocks accumulate into one chunk per display frame
+            elapsed = time.monotonic() - self._last_dispatch
+            if elapsed < self.MIN_DISPATCH_INTERVAL:
+                time.sleep(self.MIN_DISPATCH_INTERVAL - elapsed)
+
+            segments = self.app.audio_ring.read_views()
+            if not segments:
+                return
+
+            self._last_dispatch = time.monotonic()
+            # The segments are views into shared memory; widgets copy the
+            # samples into their own buffers before returning
+            self._update_spectrograms(segments)
         except (BrokenPipeError, OSError, EOFError):
             self._running = False
             raise  # Re-raise to exit worker loop
@@ -124,76 +136,32 @@ class AudioQueueProcessor:
             self._running = False
             raise
 
-    def _handle_dict_format(self, data: dict) -> None:
-        """Handle dictionary-formatted audio data.
-
-        Args:
-            data: Dictionary with 'type' key indicating data type
-        """
-        data_type = data.get("type")
-
-        if data_type == "audio":
-            audio_array = data.get("data")
-            if audio_array is not None:
-                self._update_spectrogram(audio_array)
-        elif data_type == "level":
-            level = data.get("level", 0.0)
-            self._update_level_meter(level)
-
-    def _handle_raw_format(self, audio_data: Any) -> None:
-        """Handle raw numpy array format.
-
-        Args:
-            audio_data: Raw audio data array
-        """
-        self._update_spectrogram(audio_data)
+    def _update_spectrograms(self, segments: Tuple[np.ndarray, ...]) -> None:
+        """Pass new audio to the mel spectrograms.
 
-    def _update_spectrogram(self, audio_array: Any) -> None:
-        """Update mel spectrogram with audio data.
+        The receiving spectrograms are looked up once per dispatch, not
+        once per segment.
 
         Args:
-            audio_array: Audio data to display in spectrogram
+            segments: Consecutive chunks of mono samples
         """
         # Broadcast to ALL active windows with visible meters
-        if hasattr(self.app, "window_manager") and self.app.window_manager:
-            active_windows = self.app.window_manager.get_active_windows()
-
-            if not hasattr(self, "_spec_debug_count"):
-                self._spec_debug_count = 0
-            self._spec_debug_count += 1
-            if self._spec_debug_count == 1 and getattr(self.app, "debug", False):
-                for window in active_windows:
-                    has_spec = (
-                        hasattr(window, "mel_spectrogram") and window.mel_spectrogram
-                    )
-                    m_vis = getattr(window, "meters_visible", False)
-                    print(
-                        f"[AudioQueueProcessor] window has_spectrogram={has_spec} meters_visible={m_vis}"
-                    )
+        active_windows = self.app.window_manager.get_active_windows()
 
+        if not self._debug_reported and self.app.debug:
+            self._debug_reported = True
             for window in active_windows:
-                has_spectrogram = (
-                    hasattr(window, "mel_spectrogram") and window.mel_spectrogram
+                print(
+                    f"[AudioQueueProcessor] window has_spectrogram="
+                    f"{window.mel_spectrogram is not None} "
+                    f"meters_visible={window.meters_visible}"
                 )
-                meters_visible = getattr(window, "meters_visible", False)
-
-                if has_spectrogram and meters_visible:
-                    try:
-                        window.mel_spectrogram.audio_queue.put_nowait(audio_array)
-                    except queue.Full:
-                        pass
-                    except AttributeError:
-                        pass  # Widget not ready
-
-    def _update_level_meter(self, level: float) -> None:
-        """Update level meter with new level.
 
-        Args:
-            level: Audio level value
-        """
-        # Use after() to update in main thread
-        # Widget must exist when keyboard bindings are active
-        if self.app.window and self.app.window.embedded_level_meter:
-            self.app.window.window.after(
-                0, self.app.window.embedded_level_meter.update_level, level
-            )
+        spectrograms = [
+            window.mel_spectrogram
+            for window in active_windows
+            if window.mel_spectrogram is not None and window.meters_visible
+        ]
+        for segment in segments:
+            for spectrogram in spectrograms:
+                spectrogram.update_audio(segment)
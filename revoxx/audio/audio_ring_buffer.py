@@ -0,0 +1,208 @@
+"""Shared memory ring buffer for streaming audio to the UI process.
+
+This module provides a single-producer/single-consumer ring buffer in
+shared memory. The record process writes normalized mono samples and the
+main process reads them for the live spectrogram, without pickling
+audio frames through a multiprocessing queue. The same ring can also be
+backed by process-local memory to pass samples between threads.
+"""
+
+import struct
+from multiprocessing import shared_memory
+from typing import Optional, Tuple
+
+import numpy as np
+
+_HEADER_FORMAT = "QI4x"  # Q=write position (total samples written), I=capacity
+_HEADER_SIZE = struct.calcsize(_HEADER_FORMAT)
+
+
+class AudioRingBuffer:
+    """Lock-free single-producer/single-consumer audio ring buffer.
+
+    Layout of the shared memory block:
+    - Header: monotonically increasing write position (uint64) and capacity
+    - Data: float32 samples, indexed by position modulo capacity
+
+    The producer copies samples into the data area first and then publishes
+    them by advancing the write position with a single aligned 64-bit store.
+    The read position is private to the (single) consumer, so the producer
+    never blocks. If the consumer falls behind by more than the capacity,
+    the oldest samples are dropped.
+
+    With shared=False the ring lives in ordinary process memory and is used
+    to hand samples from one thread to another.
+    """
+
+    # ~1.4 seconds at 192 kHz, so the recorder keeps filling while the
+    # UI thread is busy rendering
+    DEFAULT_CAPACITY = 2**18
+
+    def __init__(
+        self,
+        create: bool = True,
+        capacity: int = DEFAULT_CAPACITY,
+        shared: bool = True,
+    ):
+        """Initialize the ring buffer.
+
+        Args:
+            create: If True, create new shared memory. If False, call
+                attach_to_existing() before use.
+            capacity: Number of float32 samples the ring can hold
+            shared: If False, back the ring with process-local memory
+                instead of shared memory
+        """
+        self.shm: Optional[shared_memory.SharedMemory] = None
+        self.capacity = capacity
+        self._local: Optional[bytearray] = None
+        self._write_pos: Optional[np.ndarray] = None
+        self._data: Optional[np.ndarray] = None
+        self._read_pos = 0
+        self._unlinked = False
+
+        if create:
+            size = _HEADER_SIZE + capacity * np.dtype(np.float32).itemsize
+            if shared:
+                self.shm = shared_memory.SharedMemory(create=True, size=size)
+                buffer = self.shm.buf
+            else:
+                self._local = bytearray(size)
+                buffer = self._local
+            struct.pack_into(_HEADER_FORMAT, buffer, 0, 0, capacity)
+            self._map_views(buffer)
+
+    def _map_views(self, buffer) -> None:
+        """Create numpy views onto the header counter and the sample area.
+
+        Args:
+            buffer: Memory holding the header and the sample area
+        """
+        self._write_pos = np.ndarray((1,), dtype=np.uint64, buffer=buffer)
+        self._data = np.ndarray(
+            (self.capacity,),
+            dtype=np.float32,
+            buffer=buffer,
+            offset=_HEADER_SIZE,
+        )
+
+    def attach_to_existing(self, name: str) -> None:
+        """Attach to an existing ring buffer.
+
+        Args:
+            name: Name of existing shared memory block
+        """
+        self.close()
+        self.shm = shared_memory.SharedMemory(name=name)
+        _, self.capacity = struct.unpack_from(_HEADER_FORMAT, self.shm.buf, 0)
+        self._map_views(self.shm.buf)
+        self._read_pos = int(self._write_pos[0])
+
+    def write(self, samples: np.ndarray) -> None:
+        """Append samples to the ring (producer side).
+
+        Args:
+            samples: Mono float32 samples
+        """
+        n = len(samples)
+        if n == 0:
+            return
+
+        position = int(self._write_pos[0])
+        if n > self.capacity:
+            # Only the most recent samples fit
+            position += n - self.capacity
+            samples = samples[-self.capacity :]
+            n = self.capacity
+
+        start = position % self.capacity
+        first = min(n, self.capacity - start)
+        self._data[start : start + first] = samples[:first]
+        if first < n:
+            self._data[: n - first] = samples[first:]
+
+        # Publish only after the samples are in place
+        self._write_pos[0] = position + n
+
+    def read_into(self, out: np.ndarray) -> int:
+        """Read pending samples into a caller-provided buffer (consumer side).
+
+        Avoids allocating a new array per read. If more samples are pending
+        than fit into out, the oldest ones are read and the rest stay
+        pending for the next call.
+
+        Args:
+            out: Float32 buffer to copy samples into
+
+        Returns:
+            Number of samples written to the start of out
+        """
+        write_pos = int(self._write_pos[0])
+        available = write_pos - self._read_pos
+        if available <= 0:
+            return 0
+
+        if available > self.capacity:
+            # Consumer fell behind, drop the overwritten samples
+            self._read_pos = write_pos - self.capacity
+            available = self.capacity
+
+        n = min(available, len(out))
+        start = self._read_pos % self.capacity
+        first = min(n, self.capacity - start)
+        out[:first] = self._data[start : start + first]
+        if first < n:
+            out[first:n] = self._data[: n - first]
+
+        self._read_pos += n
+        return n
+
+    def read_views(self) -> Tuple[np.ndarray, ...]:
+        """Return views of all samples written since the last read (consumer side).
+
+        The views alias the ring itself and stay valid only until the
+        producer wraps around to them, so callers must copy the samples
+        out promptly.
+
+        Returns:
+            Zero, one or two views in chronological order
+        """
+        write_pos = int(self._write_pos[0])
+        available = write_pos - self._read_pos
+        if available <= 0:
+            return ()
+
+        if available > self.capacity:
+            # Consumer fell behind, drop the overwritten samples
+            available = self.capacity
+
+        start = (write_pos - available) % self.capacity
+        end = start + available
+        self._read_pos = write_pos
+        if end <= self.capacity:
+            return (self._data[start:end],)
+        return (self._data[start:], self._data[: end - self.capacity])
+
+    def discard(self) -> None:
+        """Skip all pending samples (consumer side)."""
+        if self._write_pos is not None:
+            self._read_pos = int(self._write_pos[0])
+
+    def close(self) -> None:
+        """Close shared memory connection."""
+        # Views must be released before the mapping can be closed
+        self._write_pos = None
+        self._data = None
+        if self.shm:
+            self.shm.close()
+
+    def unlink(self) -> None:
+        """Unlink (delete) shared memory. Calling it again does nothing."""
+        if self.shm and not self._unlinked:
+            self.shm.unlink()
+            self._unlinked = True
+
+    @property
+    def name(self) -> Optional[str]:
+        """Get shared memory name for passing to other processes."""
+        return self.shm.name if self.shm else None
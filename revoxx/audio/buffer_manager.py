@@ -8,10 +8,12 @@ having multiple valid buffers makes smoother transitions possible.
 """
 
 import threading
-from typing import Optional
+from typing import Dict, Optional
 from collections import deque
 import time
 
+import numpy as np
+
 from .audio_buffer import AudioBuffer
 
 
@@ -33,28 +35,46 @@ class BufferManager:
         self.lock = threading.Lock()
         self._active_buffer: Optional[AudioBuffer] = None
         self._shutdown = False
+        # Read-only source arrays of the buffers in the ring, by buffer name
+        self._sources: Dict[str, np.ndarray] = {}
 
-    def create_buffer(self, audio_data) -> AudioBuffer:
+    def create_buffer(self, audio_data: np.ndarray) -> AudioBuffer:
         """Create a new audio buffer and add to ring.
 
+        Read-only arrays cannot change after they were copied, so if
+        audio_data is the source of a buffer still in the ring (e.g. a
+        take played again), that buffer is returned instead of a new copy.
+
         Args:
             audio_data: Audio data to store in buffer
 
         Returns:
-            Created AudioBuffer instance
+            AudioBuffer holding the audio data
         """
         with self.lock:
+            if not audio_data.flags.writeable:
+                for buffer in self.buffers:
+                    if self._sources.get(buffer.name) is audio_data:
+                        # Move to the end so it is evicted last
+                        self.buffers.remove(buffer)
+                        self.buffers.append(buffer)
+                        self._active_buffer = buffer
+                        return buffer
+
             # Create new buffer
             buffer = AudioBuffer.create_from_array(audio_data)
 
             # If ring is full, clean up oldest buffer
             if len(self.buffers) >= self.max_buffers:
                 old_buffer = self.buffers[0]  # Will be removed by append
+                self._sources.pop(old_buffer.name, None)
                 # Schedule cleanup after a delay to ensure processes are done
                 threading.Timer(0.5, self._cleanup_buffer, args=[old_buffer]).start()
 
             # Add to ring
             self.buffers.append(buffer)
+            if not audio_data.flags.writeable:
+                self._sources[buffer.name] = audio_data
             self._active_buffer = buffer
             return buffer
 
@@ -101,4 +121,5 @@ class BufferManager:
                 buffer = self.buffers.popleft()
                 self._cleanup_buffer(buffer)
 
+            self._sources.clear()
             self._active_buffer = None
@@ -65,32 +65,37 @@ class EditCommand(ABC):
         pass
 
 
-class AudioSnapshotCommand(EditCommand):
-    """Command that stores complete audio snapshots for undo/redo.
-
-    This approach ensures exact restoration without re-applying cross-fade.
-    Stores both the audio before and after the operation.
+class AudioDiffCommand(EditCommand):
+    """Command that stores only the changed region of the audio for undo/redo.
+
+    An edit (delete, insert, replace) changes one contiguous region of the
+    recording, including its cross-fades. The command keeps the samples of
+    that region before and after the edit and splices them into the file,
+    so restoring is exact without re-applying the cross-fade, while memory
+    grows with the edit length instead of the recording length.
     """
 
     def __init__(
         self,
         filepath: Path,
         sample_rate: int,
-        audio_before: np.ndarray,
-        audio_after: np.ndarray,
+        start: int,
+        old_segment: np.ndarray,
+        new_segment: np.ndarray,
         subtype: Optional[str] = None,
         selection_start_time: Optional[float] = None,
         selection_end_time: Optional[float] = None,
         marker_after_edit: Optional[float] = None,
         operation_description: str = "Edit",
     ):
-        """Initialize audio snapshot command.
+        """Initialize audio diff command.
 
         Args:
             filepath: Path to the audio file
             sample_rate: Sample rate of the audio
-            audio_before: Complete audio data before the operation
-            audio_after: Complete audio data after the operation
+            start: First sample of the changed region
+            old_segment: Samples of the region before the operation
+            new_segment: Samples of the region after the operation
             subtype: Audio subtype for saving
             selection_start_time: Selection to restore on undo
             selection_end_time: Selection to restore on undo
@@ -98,30 +103,89 @@ class AudioSnapshotCommand(EditCommand):
             operation_description: Description of the operation
         """
         super().__init__(filepath, sample_rate, subtype)
-        self.audio_before = audio_before
-        self.audio_after = audio_after
+        self.start = start
+        self.old_segment = old_segment
+        self.new_segment = new_segment
         self.selection_start_time = selection_start_time
         self.selection_end_time = selection_end_time
         self.marker_after_edit = marker_after_edit
         self.operation_description = operation_description
 
+    @classmethod
+    def from_snapshots(
+        cls,
+        filepath: Path,
+        sample_rate: int,
+        audio_before: np.ndarray,
+        audio_after: np.ndarray,
+        **kwargs,
+    ) -> "AudioDiffCommand":
+        """Create a command from the mono audio before and after an edit.
+
+        Samples shared at the start and end of both versions are dropped,
+        only the region in between is copied into the command.
+
+        Args:
+            filepath: Path to the audio file
+            sample_rate: Sample rate of the audio
+            audio_before: Complete audio data before the operation
+            audio_after: Complete audio data after the operation
+            **kwargs: Further arguments for the command
+
+        Returns:
+            Command holding only the changed region
+        """
+        common = min(len(audio_before), len(audio_after))
+        differs = np.flatnonzero(audio_before[:common] != audio_after[:common])
+        start = int(differs[0]) if len(differs) else common
+
+        # Common tail, limited so it does not overlap the common head
+        tail = common - start
+        differs = np.flatnonzero(
+            audio_before[len(audio_before) - tail :][::-1]
+            != audio_after[len(audio_after) - tail :][::-1]
+        )
+        tail = int(differs[0]) if len(differs) else tail
+
+        return cls(
+            filepath=filepath,
+            sample_rate=sample_rate,
+            start=start,
+            old_segment=audio_before[start : len(audio_before) - tail].copy(),
+            new_segment=audio_after[start : len(audio_after) - tail].copy(),
+            **kwargs,
+        )
+
     def execute(self, file_manager: "FileManager") -> bool:
-        """Write audio_after to file (for redo)."""
+        """Splice new_segment into the file in place of old_segment (for redo)."""
+        if len(self.new_segment) == len(self.old_segment):
+            # Same length: only the changed frames need to be written
+            if file_manager.write_audio_region(
+                self.filepath, self.start, self.new_segment
+            ):
+                return True
+
         try:
+            audio, _ = file_manager.load_audio(self.filepath)
+            end = self.start + len(self.old_segment)
+            if end > len(audio):
+                return False
+            audio = np.concatenate((audio[: self.start], self.new_segment, audio[end:]))
             file_manager.save_audio(
-                self.filepath, self.audio_after, self.sample_rate, self.subtype
+                self.filepath, audio, self.sample_rate, self.subtype
             )
             return True
         except (OSError, ValueError):
             return False
 
-    def inverse(self) -> "AudioSnapshotCommand":
-        """Create inverse command that restores audio_before."""
-        return AudioSnapshotCommand(
+    def inverse(self) -> "AudioDiffCommand":
+        """Create inverse command that restores old_segment."""
+        return AudioDiffCommand(
             filepath=self.filepath,
             sample_rate=self.sample_rate,
-            audio_before=self.audio_after,
-            audio_after=self.audio_before,
+            start=self.start,
+            old_segment=self.new_segment,
+            new_segment=self.old_segment,
             subtype=self.subtype,
             selection_start_time=self.selection_start_time,
             selection_end_time=self.selection_end_time,
@@ -134,10 +198,10 @@ class AudioSnapshotCommand(EditCommand):
         return self.operation_description
 
 
-# Convenience aliases for specific operations (all use AudioSnapshotCommand internally)
-DeleteRangeCommand = AudioSnapshotCommand
-InsertCommand = AudioSnapshotCommand
-ReplaceRangeCommand = AudioSnapshotCommand
+# Convenience aliases for specific operations (all use AudioDiffCommand internally)
+DeleteRangeCommand = AudioDiffCommand
+InsertCommand = AudioDiffCommand
+ReplaceRangeCommand = AudioDiffCommand
 
 
 class TrashClipCommand(EditCommand):
@@ -214,125 +278,3 @@ class RestoreFromTrashCommand(EditCommand):
     def description(self) -> str:
         """Get description of this command."""
         return f"Restore Clip (take {self.take})"
-
-
-class DeleteClipCommand(EditCommand):
-    """Command for deleting an entire audio clip.
-
-    Stores the complete audio data so it can be restored on undo.
-    Note: For trash-based deletion, use TrashClipCommand instead.
-    """
-
-    def __init__(
-        self,
-        filepath: Path,
-        sample_rate: int,
-        audio_data: np.ndarray,
-        subtype: Optional[str] = None,
-    ):
-        """Initialize delete clip command.
-
-        Args:
-            filepath: Path to the audio file
-            sample_rate: Sample rate of the audio
-            audio_data: The complete audio data of the deleted clip
-            subtype: Audio subtype for saving (e.g., "PCM_16")
-        """
-        super().__init__(filepath, sample_rate)
-        self.audio_data = audio_data
-        self.subtype = subtype
-
-    def execute(self, file_manager: "FileManager") -> bool:
-        """Execute the delete clip operation (delete the file).
-
-        Args:
-            file_manager: FileManager instance for audio I/O
-
-        Returns:
-            True if successful, False otherwise
-        """
-        try:
-            if self.filepath.exists():
-                self.filepath.unlink()
-            return True
-        except OSError:
-            return False
-
-    def inverse(self) -> "RestoreClipCommand":
-        """Create a restore command to undo this deletion.
-
-        Returns:
-            RestoreClipCommand that recreates the deleted file
-        """
-        return RestoreClipCommand(
-            filepath=self.filepath,
-            sample_rate=self.sample_rate,
-            audio_data=self.audio_data,
-            subtype=self.subtype,
-        )
-
-    def description(self) -> str:
-        """Get description of this command."""
-        duration = len(self.audio_data) / self.sample_rate
-        return f"Delete Clip ({duration:.2f}s)"
-
-
-class RestoreClipCommand(EditCommand):
-    """Command for restoring a deleted audio clip.
-
-    Used as the inverse of DeleteClipCommand.
-    """
-
-    def __init__(
-        self,
-        filepath: Path,
-        sample_rate: int,
-        audio_data: np.ndarray,
-        subtype: Optional[str] = None,
-    ):
-        """Initialize restore clip command.
-
-        Args:
-            filepath: Path to the audio file
-            sample_rate: Sample rate of the audio
-            audio_data: The audio data to restore
-            subtype: Audio subtype for saving (e.g., "PCM_16")
-        """
-        super().__init__(filepath, sample_rate)
-        self.audio_data = audio_data
-        self.subtype = subtype
-
-    def execute(self, file_manager: "FileManager") -> bool:
-        """Execute the restore operation (recreate the file).
-
-        Args:
-            file_manager: FileManager instance for audio I/O
-
-        Returns:
-            True if successful, False otherwise
-        """
-        try:
-            file_manager.save_audio(
-                self.filepath, self.audio_data, self.sample_rate, self.subtype
-            )
-            return True
-        except (OSError, ValueError):
-            return False
-
-    def inverse(self) -> "DeleteClipCommand":
-        """Create a delete command to undo this restoration.
-
-        Returns:
-            DeleteClipCommand that deletes the file again
-        """
-        return DeleteClipCommand(
-            filepath=self.filepath,
-            sample_rate=self.sample_rate,
-            audio_data=self.audio_data,
-            subtype=self.subtype,
-        )
-
-    def description(self) -> str:
-        """Get description of this command."""
-        duration = len(self.audio_data) / self.sample_rate
-        return f"Restore Clip ({duration:.2f}s)"
@@ -4,11 +4,35 @@ This module provides audio editing functions for deleting, inserting,
 and replacing audio segments with smooth cross-fade transitions.
 """
 
+from functools import lru_cache
+from typing import Tuple
+
 import numpy as np
 
 from ..constants import AudioConstants
 
 
+@lru_cache(maxsize=16)
+def _fade_curves(fade_samples: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Get the equal-power fade-out and fade-in gain curves.
+
+    The fade length only depends on the sample rate and the selection
+    length, so the same few curves are reused across edits.
+
+    Args:
+        fade_samples: Length of the curves in samples
+
+    Returns:
+        Tuple of (fade-out, fade-in) gains, read-only
+    """
+    t = np.linspace(0, np.pi / 2, fade_samples)
+    gain_out = np.cos(t)
+    gain_in = np.sin(t)
+    gain_out.flags.writeable = False
+    gain_in.flags.writeable = False
+    return gain_out, gain_in
+
+
 class AudioEditor:
     """Provides audio editing operations with cross-fade support.
 
@@ -29,15 +53,14 @@ class AudioEditor:
             sample_rate: Audio sample rate in Hz
 
         Returns:
-            New audio array with the range deleted and cross-faded
+            New audio array with the range deleted and cross-faded, or
+            audio itself if the range is empty
         """
         if start_sample >= end_sample:
-            return audio.copy()
+            return audio
 
-        if start_sample < 0:
-            start_sample = 0
-        if end_sample > len(audio):
-            end_sample = len(audio)
+        start_sample = max(start_sample, 0)
+        end_sample = min(end_sample, len(audio))
 
         # Calculate fade samples
         selection_samples = end_sample - start_sample
@@ -88,15 +111,13 @@ class AudioEditor:
             sample_rate: Audio sample rate in Hz
 
         Returns:
-            New audio array with the inserted content cross-faded
+            New audio array with the inserted content cross-faded, or
+            original itself if there is nothing to insert
         """
         if len(insert) == 0:
-            return original.copy()
+            return original
 
-        if position < 0:
-            position = 0
-        if position > len(original):
-            position = len(original)
+        position = min(max(position, 0), len(original))
 
         # Calculate fade samples based on insert length
         fade_samples = AudioEditor._calculate_fade_samples(sample_rate, len(insert))
@@ -131,15 +152,14 @@ class AudioEditor:
             sample_rate: Audio sample rate in Hz
 
         Returns:
-            New audio array with the range replaced and cross-faded
+            New audio array with the range replaced and cross-faded, or
+            original itself if the range is empty
         """
         if start_sample >= end_sample:
-            return original.copy()
+            return original
 
-        if start_sample < 0:
-            start_sample = 0
-        if end_sample > len(original):
-            end_sample = len(original)
+        start_sample = max(start_sample, 0)
+        end_sample = min(end_sample, len(original))
 
         # Calculate fade samples
         selection_samples = end_sample - start_sample
@@ -185,11 +205,10 @@ class AudioEditor:
             return np.array([])
 
         # Equal power cross-fade using sine/cosine curves
-        t = np.linspace(0, np.pi / 2, actual_samples)
-        gain_a = np.cos(t)  # Fade out
-        gain_b = np.sin(t)  # Fade in
+        gain_a, gain_b = _fade_curves(actual_samples)
 
-        result = audio_a[:actual_samples] * gain_a + audio_b[:actual_samples] * gain_b
+        result = audio_a[:actual_samples] * gain_a
+        result += audio_b[:actual_samples] * gain_b
 
         return result
 
@@ -298,155 +317,41 @@ class AudioEditor:
             sample_rate: Audio sample rate in Hz
 
         Returns:
-            Audio array of exactly target_samples length
+            Float32 audio array of exactly target_samples length. A
+            float32 source that is long enough is returned as a view.
         """
         if len(audio) == 0:
             return np.zeros(target_samples, dtype=np.float32)
 
         if len(audio) >= target_samples:
-            return audio[:target_samples].astype(np.float32)
+            return audio[:target_samples].astype(np.float32, copy=False)
 
         fade_samples = AudioEditor._calculate_fade_samples(sample_rate, len(audio))
 
         if fade_samples < 2:
             repeats = (target_samples // len(audio)) + 1
-            return np.tile(audio, repeats)[:target_samples].astype(np.float32)
-
-        # Build looped audio with crossfades
-        result = []
-        remaining = target_samples
-        is_first = True
-
-        while remaining > 0:
-            if is_first:
-                remaining = AudioEditor._append_first_segment(
-                    result, audio, fade_samples, remaining
-                )
-                is_first = False
-            elif remaining >= len(audio):
-                remaining = AudioEditor._append_full_loop(
-                    result, audio, fade_samples, remaining
-                )
-            else:
-                remaining = AudioEditor._append_final_segment(
-                    result, audio, fade_samples, remaining
-                )
-
-        output = np.concatenate(result)
-        return AudioEditor._ensure_exact_length(output, target_samples)
-
-    @staticmethod
-    def _append_first_segment(
-        result: list, audio: np.ndarray, fade_samples: int, remaining: int
-    ) -> int:
-        """Append first segment of looped audio.
-
-        The first segment excludes the final fade_samples to leave room
-        for crossfading with the next loop iteration.
-
-        Args:
-            result: List to append audio segments to
-            audio: Source audio array to loop
-            fade_samples: Number of samples reserved for crossfade
-            remaining: Number of samples still needed
-
-        Returns:
-            Updated remaining sample count
-        """
-        if remaining >= len(audio):
-            result.append(audio[:-fade_samples].copy())
-            return remaining - (len(audio) - fade_samples)
-        else:
-            result.append(audio[:remaining].copy())
-            return 0
-
-    @staticmethod
-    def _append_full_loop(
-        result: list, audio: np.ndarray, fade_samples: int, remaining: int
-    ) -> int:
-        """Append a full loop iteration with crossfade.
-
-        Creates a seamless loop by crossfading the end of the previous
-        iteration with the beginning of this one, then appends the
-        middle portion of the audio.
-
-        Args:
-            result: List to append audio segments to
-            audio: Source audio array to loop
-            fade_samples: Number of samples for crossfade region
-            remaining: Number of samples still needed
-
-        Returns:
-            Updated remaining sample count
-        """
+            looped = np.tile(audio, repeats)[:target_samples]
+            return looped.astype(np.float32, copy=False)
+
+        # Every repetition after the first starts with a cross-fade from the
+        # end of the source back to its beginning, so the output is the
+        # first pass (without its fade-out tail) followed by copies of one
+        # repetition. Only the last repetition may run into the tail.
+        period = len(audio) - fade_samples
         crossfade = AudioEditor._equal_power_crossfade(
             audio[-fade_samples:], audio[:fade_samples], fade_samples
         )
-        result.append(crossfade)
-        remaining -= fade_samples
+        repetition = np.concatenate((crossfade, audio[fade_samples:]))
 
-        middle_samples = len(audio) - 2 * fade_samples
-        if middle_samples > 0:
-            if remaining >= middle_samples:
-                result.append(audio[fade_samples:-fade_samples].copy())
-                remaining -= middle_samples
-            else:
-                result.append(audio[fade_samples : fade_samples + remaining].copy())
-                remaining = 0
-
-        return remaining
-
-    @staticmethod
-    def _append_final_segment(
-        result: list, audio: np.ndarray, fade_samples: int, remaining: int
-    ) -> int:
-        """Append the final partial segment with crossfade.
-
-        Handles the case where the remaining samples are less than a full
-        loop iteration. Crossfades at the loop point and takes only the
-        needed portion.
-
-        Args:
-            result: List to append audio segments to
-            audio: Source audio array to loop
-            fade_samples: Number of samples for crossfade region
-            remaining: Number of samples still needed
-
-        Returns:
-            Updated remaining sample count (always 0 after this)
-        """
-        crossfade = AudioEditor._equal_power_crossfade(
-            audio[-fade_samples:], audio[:fade_samples], fade_samples
-        )
-
-        if remaining >= fade_samples:
-            result.append(crossfade)
-            remaining -= fade_samples
-            if remaining > 0:
-                take = min(remaining, len(audio) - fade_samples)
-                result.append(audio[fade_samples : fade_samples + take].copy())
-                remaining -= take
-        else:
-            result.append(crossfade[:remaining].copy())
-            remaining = 0
-
-        return remaining
-
-    @staticmethod
-    def _ensure_exact_length(audio: np.ndarray, target_samples: int) -> np.ndarray:
-        """Ensure audio has exactly the target length.
-
-        Trims if too long, zero-pads if too short.
-
-        Args:
-            audio: Audio array to adjust
-            target_samples: Exact number of samples required
-
-        Returns:
-            Audio array with exactly target_samples length as float32
-        """
-        if len(audio) > target_samples:
-            return audio[:target_samples].astype(np.float32)
-        elif len(audio) < target_samples:
-            return np.pad(audio, (0, target_samples - len(audio))).astype(np.float32)
-        return audio.astype(np.float32)
+        remaining = target_samples - period
+        full_loops = 0
+        if remaining >= len(audio):
+            full_loops = (remaining - len(audio)) // period + 1
+        remaining -= full_loops * period
+
+        output = np.empty(target_samples, dtype=np.float32)
+        output[:period] = audio[:period]
+        loops_end = period * (full_loops + 1)
+        output[period:loops_end] = np.tile(repetition[:period], full_loops)
+        output[loops_end:] = repetition[:remaining]
+        return output
@@ -6,7 +6,6 @@ shared memory for inter-process communication.
 
 import time
 import numpy as np
-import sounddevice as sd
 from typing import Optional, Any
 import multiprocessing as mp
 from multiprocessing.synchronize import Event
@@ -23,6 +22,10 @@ from ..utils.process_cleanup import ProcessCleanupManager
 from ..utils.device_manager import get_device_manager
 from ..constants import UIConstants
 
+# sounddevice loads PortAudio on import. Only the playback process needs
+# it, so playback_process() imports it; the main process never loads PortAudio.
+sd = None
+
 
 class AudioPlayer:
     """Audio player with synchronized position updates."""
@@ -34,7 +37,8 @@ class AudioPlayer:
             config: Audio configuration
             shared_state_name: Name of shared memory block
         """
-        self._playback_output_channel_index = None
+        self._playback_output_channel_index = 0
+        self._output_channel_mapping: Optional[list] = None
         self.config = config
 
         # Attach to existing shared state
@@ -161,7 +165,7 @@ class AudioPlayer:
             target_channel_index is the 0-based output channel and
             num_stream_channels is the total channels to open.
         """
-        output_mapping = getattr(self, "_output_channel_mapping", None)
+        output_mapping = self._output_channel_mapping
         if isinstance(output_mapping, list) and len(output_mapping) == 1:
             try:
                 target = int(output_mapping[0])
@@ -376,7 +380,7 @@ class AudioPlayer:
         outdata: np.ndarray,
         frames: int,
         time_info: Any,
-        status: Optional[sd.CallbackFlags],
+        status: Optional["sd.CallbackFlags"],
     ) -> None:
         """Audio stream callback with hardware timing.
 
@@ -476,7 +480,7 @@ class AudioPlayer:
             audio_chunk: Audio data to route
             frames: Number of frames to write
         """
-        out_channel_index = getattr(self, "_playback_output_channel_index", 0)
+        out_channel_index = self._playback_output_channel_index
 
         # Only clear buffer if using multichannel output
         if outdata.shape[1] > 1:
@@ -550,7 +554,6 @@ def playback_process(
     config: AudioConfig,
     control_queue: mp.Queue,
     shared_state_name: str,
-    manager_dict: dict,
     shutdown_event: Event,
 ) -> None:
     """Process function for audio playback with hardware synchronization.
@@ -559,9 +562,11 @@ def playback_process(
         config: Audio configuration
         control_queue: Queue for control commands
         shared_state_name: Name of shared memory block
-        manager_dict: Shared manager dict
         shutdown_event: End process ?
     """
+    global sd
+    import sounddevice as sd
+
     # Setup signal handling for child process
     cleanup = ProcessCleanupManager(cleanup_callback=None, debug=False)
     cleanup.ignore_signals_in_child()
@@ -570,7 +575,6 @@ def playback_process(
     queue_manager = AudioQueueManager(
         record_queue=None,  # Not used in playback process
         playback_queue=control_queue,
-        audio_queue=None,  # Not used in playback process
     )
 
     player = None
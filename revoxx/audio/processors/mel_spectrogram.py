@@ -520,6 +520,30 @@ class MelSpectrogramProcessor(AudioProcessor[Tuple[np.ndarray, Optional[float]]]
 
         return mel_db, highest_freq
 
+    def process_frames(self, frames: np.ndarray) -> np.ndarray:
+        """Convert a batch of audio frames to mel-scale dB values.
+
+        Batched counterpart of process() for complete recordings: all frames
+        go through a single windowed FFT and one filterbank product instead
+        of a Python-level loop per frame.
+
+        Args:
+            frames: Normalized audio frames, shape (n_frames, n_fft)
+
+        Returns:
+            Mel-scale magnitudes in dB, shape (n_mels, n_frames)
+        """
+        fft = np.fft.rfft(frames * self.window, n=self.n_fft, axis=1)
+        power = np.real(fft * np.conj(fft))
+
+        mel_power = np.dot(self.mel_filter, power.T)
+
+        mel_db = AudioConstants.POWER_TO_DB_FACTOR * np.log10(
+            mel_power + AudioConstants.DB_REFERENCE
+        )
+        np.clip(mel_db, AudioConstants.DB_MIN, 0, out=mel_db)
+        return mel_db
+
 
 # Global configuration instance
 MEL_CONFIG = MelConfig()
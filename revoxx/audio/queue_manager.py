@@ -6,15 +6,25 @@ audio processing queues.
 
 import multiprocessing as mp
 import queue
+from multiprocessing.context import BaseContext
 from typing import Optional, Any, Dict
 
+# Commands without arguments are built once and reused. put() only hands
+# the object to the queue's feeder thread, which pickles it later, so a
+# change made after put() could leak into a message that is still queued.
+# These dicts must therefore never be modified.
+_MSG_START = {"action": "start"}
+_MSG_STOP = {"action": "stop"}
+_MSG_QUIT = {"action": "quit"}
+_MSG_REFRESH_DEVICES = {"action": "refresh_devices"}
+
 
 class AudioQueueManager:
     """Manages communication with audio processing queues.
 
     This class provides high-level methods for sending commands to the
-    recording and playback processes, as well as managing the audio
-    visualization queue.
+    recording and playback processes. Visualization audio does not go
+    through a queue; it is streamed via the shared AudioRingBuffer.
 
     Can be used in two modes:
     1. Main process mode: Creates queues (no parameters)
@@ -22,24 +32,32 @@ class AudioQueueManager:
 
     """
 
-    def __init__(self, record_queue=None, playback_queue=None, audio_queue=None):
+    def __init__(
+        self,
+        record_queue=None,
+        playback_queue=None,
+        context: Optional[BaseContext] = None,
+    ):
         """Initialize the audio queue manager.
 
         Args:
             record_queue: Optional existing record queue (for child processes)
             playback_queue: Optional existing playback queue (for child processes)
-            audio_queue: Optional existing audio queue (for child processes)
+            context: Multiprocessing context to create queues with (main
+                process mode only, defaults to the global context)
         """
-        if record_queue is None and playback_queue is None and audio_queue is None:
+        if record_queue is None and playback_queue is None:
             # Main process mode - create queues
-            self._record_queue = mp.Queue(maxsize=10)
-            self._playback_queue = mp.Queue(maxsize=10)
-            self._audio_queue = mp.Queue(maxsize=100)
+            ctx = context if context is not None else mp.get_context()
+            self._record_queue = ctx.Queue(maxsize=10)
+            self._playback_queue = ctx.Queue(maxsize=10)
         else:
             # Child process mode - use existing queues
             self._record_queue = record_queue
             self._playback_queue = playback_queue
-            self._audio_queue = audio_queue
+
+        # True once a stop was queued and no play followed it
+        self._playback_stopped = False
 
     # ========== Playback Control Methods ==========
 
@@ -74,7 +92,10 @@ class AudioQueueManager:
             "start_sample": start_sample,
             "end_sample": end_sample,
         }
-        return self._send_playback_command(command)
+        if not self._send_playback_command(command):
+            return False
+        self._playback_stopped = False
+        return True
 
     def _send_playback_command(self, command: Dict[str, Any]) -> bool:
         """Send a command to the playback queue.
@@ -94,10 +115,13 @@ class AudioQueueManager:
     def stop_playback(self) -> None:
         """Stop audio playback.
 
-        The playback process uses a state machine, so sending stop
-        when already stopped is safely ignored.
+        Repeated stops without a play in between are not queued again;
+        navigating with a held key would otherwise wake the playback
+        process for every key repeat.
         """
-        self._send_playback_command({"action": "stop"})
+        if self._playback_stopped:
+            return
+        self._playback_stopped = self._send_playback_command(_MSG_STOP)
 
     def set_output_device(self, device_name: Optional[str]) -> bool:
         """Set the output device for playback.
@@ -141,7 +165,7 @@ class AudioQueueManager:
             True if command was queued, False if queue was full
         """
         try:
-            self._playback_queue.put({"action": "quit"}, block=False)
+            self._playback_queue.put(_MSG_QUIT, block=False)
             return True
         except queue.Full:
             return False
@@ -153,7 +177,7 @@ class AudioQueueManager:
             True if command was queued, False if queue was full
         """
         try:
-            self._playback_queue.put({"action": "refresh_devices"}, block=False)
+            self._playback_queue.put(_MSG_REFRESH_DEVICES, block=False)
             return True
         except queue.Full:
             return False
@@ -184,7 +208,7 @@ class AudioQueueManager:
         Returns:
             True if command was queued, False if queue was full
         """
-        return self._send_record_command({"action": "start"})
+        return self._send_record_command(_MSG_START)
 
     def stop_recording(self) -> None:
         """Stop audio recording.
@@ -192,7 +216,7 @@ class AudioQueueManager:
         The record process uses a state machine, so sending stop
         when already stopped is safely ignored.
         """
-        self._send_record_command({"action": "stop"})
+        self._send_record_command(_MSG_STOP)
 
     def set_input_device(self, device_name: Optional[str]) -> bool:
         """Set the input device for recording.
@@ -235,7 +259,7 @@ class AudioQueueManager:
             True if command was queued, False if queue was full
         """
         try:
-            self._record_queue.put({"action": "quit"}, block=False)
+            self._record_queue.put(_MSG_QUIT, block=False)
             return True
         except queue.Full:
             return False
@@ -247,35 +271,12 @@ class AudioQueueManager:
             True if command was queued, False if queue was full
         """
         try:
-            self._record_queue.put({"action": "refresh_devices"}, block=False)
+            self._record_queue.put(_MSG_REFRESH_DEVICES, block=False)
             return True
         except queue.Full:
             return False
 
-    # ========== Audio Visualization Queue Methods ==========
-
-    def get_audio_data(self, timeout: float = 0.1) -> Any:
-        """Get audio data from the visualization queue.
-
-        Args:
-            timeout: Timeout in seconds for getting data
-
-        Returns:
-            Audio data from the queue
-
-        Raises:
-            queue.Empty: If no data is available within the timeout
-        """
-        return self._audio_queue.get(timeout=timeout)
-
-    @property
-    def audio_queue(self) -> mp.Queue:
-        """Get direct access to audio queue for special cases.
-
-        Returns:
-            The audio visualization queue
-        """
-        return self._audio_queue
+    # ========== Queue Accessors ==========
 
     @property
     def record_queue(self) -> mp.Queue:
@@ -340,18 +341,3 @@ class AudioQueueManager:
             return command
         except queue.Empty:
             return None
-
-    def put_audio_data(self, data: Any) -> bool:
-        """Put audio data into visualization queue.
-
-        Args:
-            data: Audio data to send
-
-        Returns:
-            True if sent, False if queue full
-        """
-        try:
-            self._audio_queue.put_nowait(data)
-            return True
-        except queue.Full:
-            return False
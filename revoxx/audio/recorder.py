@@ -6,7 +6,6 @@ for inter-process communication.
 
 import sys
 import numpy as np
-import sounddevice as sd
 from pathlib import Path
 from typing import Optional, Any
 import multiprocessing as mp
@@ -15,14 +14,19 @@ import traceback
 import soundfile as sf
 
 from .shared_state import SharedState, SHARED_STATUS_INVALID
+from .audio_ring_buffer import AudioRingBuffer
 from .level_calculator import LevelCalculator
 from .queue_manager import AudioQueueManager
 from .worker_state import WorkerState
 from ..utils.config import AudioConfig
-from ..utils.audio_utils import calculate_blocksize
+from ..utils.audio_utils import calculate_blocksize, ensure_mono_normalized
 from ..utils.process_cleanup import ProcessCleanupManager
 from ..utils.device_manager import get_device_manager
 
+# sounddevice loads PortAudio on import. Only the record process needs
+# it, so record_process() imports it; the main process never loads PortAudio.
+sd = None
+
 
 class AudioRecorder:
     """Audio recorder with struct-based synchronized position updates."""
@@ -32,7 +36,8 @@ class AudioRecorder:
         config: AudioConfig,
         shared_state_name: str,
         queue_manager=None,
-        manager_dict: Optional[dict] = None,
+        audio_ring_name: Optional[str] = None,
+        data_ready: Optional[Event] = None,
     ):
         """Initialize synchronized audio recorder.
 
@@ -40,16 +45,30 @@ class AudioRecorder:
             config: Audio configuration
             shared_state_name: Name of shared memory block
             queue_manager: AudioQueueManager for queue communication
-            manager_dict: Shared manager dict
+            audio_ring_name: Name of the visualization ring buffer
+            data_ready: Event signaled after writing to the ring buffer
         """
         self.config = config
         self.queue_manager = queue_manager
-        self.manager_dict = manager_dict
+
+        # Configured input channels and the channels picked from the stream
+        self._input_channel_mapping: Optional[list] = None
+        self._input_channel_pick: Optional[list] = None
+
+        # Error from the last failed attempt to open the input stream
+        self.last_input_error: Optional[str] = None
 
         # Attach to existing shared state
         self.shared_state = SharedState(create=False)
         self.shared_state.attach_to_existing(shared_state_name)
 
+        # Attach to visualization ring buffer
+        self.audio_ring: Optional[AudioRingBuffer] = None
+        if audio_ring_name:
+            self.audio_ring = AudioRingBuffer(create=False)
+            self.audio_ring.attach_to_existing(audio_ring_name)
+        self.data_ready = data_ready
+
         # Recording state - explicit state machine
         self._state = WorkerState.IDLE
         self.audio_chunks = []
@@ -77,7 +96,7 @@ class AudioRecorder:
         Returns:
             bool: True if stream started successfully, False otherwise
         """
-        debug = self.manager_dict and self.manager_dict.get("debug", False)
+        debug = self.shared_state.is_debug()
 
         # Already recording - ignore duplicate start
         if self._state == WorkerState.ACTIVE:
@@ -103,12 +122,10 @@ class AudioRecorder:
                     "[Recorder] _create_stream() returned None - device open FAILED",
                     file=sys.stderr,
                 )
-                last_err = (
-                    self.manager_dict.get("last_input_error", "unknown")
-                    if self.manager_dict
-                    else "N/A"
+                print(
+                    f"[Recorder]   last_input_error={self.last_input_error}",
+                    file=sys.stderr,
                 )
-                print(f"[Recorder]   last_input_error={last_err}", file=sys.stderr)
             self._state = WorkerState.IDLE
             return False
 
@@ -116,7 +133,7 @@ class AudioRecorder:
         self._state = WorkerState.ACTIVE
         if debug:
             print(
-                f"[Recorder] stream started successfully, audio_queue_active={self._is_audio_queue_active()}",
+                f"[Recorder] stream started successfully, audio_queue_active={self.shared_state.is_audio_queue_active()}",
                 file=sys.stderr,
             )
         return True
@@ -170,7 +187,7 @@ class AudioRecorder:
         max_channels = self._get_device_max_channels()
 
         # Get configured mapping
-        input_mapping = getattr(self, "_input_channel_mapping", None)
+        input_mapping = self._input_channel_mapping
 
         if not input_mapping:
             # Simple case - use configured channels limited by device
@@ -251,7 +268,7 @@ class AudioRecorder:
 
     def _create_stream(
         self, sample_rate: int, channels: int
-    ) -> Optional[sd.InputStream]:
+    ) -> Optional["sd.InputStream"]:
         """Create input stream with fallback to default device.
 
         Args:
@@ -299,12 +316,7 @@ class AudioRecorder:
             return sd.InputStream(**stream_params)
         except (sd.PortAudioError, OSError) as e:
             print(f"Error opening InputStream: {e}", file=sys.stderr)
-            # Signal error to main process
-            if self.manager_dict is not None:
-                try:
-                    self.manager_dict["last_input_error"] = str(e)
-                except (KeyError, TypeError):
-                    pass
+            self.last_input_error = str(e)
             return None
 
     def _process_input_channels(self, indata: np.ndarray) -> np.ndarray:
@@ -316,7 +328,7 @@ class AudioRecorder:
         Returns:
             Processed audio data with appropriate channel selection/mixing
         """
-        if not hasattr(self, "_input_channel_pick") or not self._input_channel_pick:
+        if not self._input_channel_pick:
             return indata.copy()
 
         # Guard indices vs delivered channel count
@@ -436,10 +448,10 @@ class AudioRecorder:
             audio_data = self.stop_recording()
 
             # Save if path provided (compatibility with current architecture)
-            save_path = self._get_save_path()
+            save_path = self.shared_state.get_save_path()
             if save_path and len(audio_data) > 0:
                 self.save_recording(audio_data, Path(save_path))
-                self._clear_save_path()
+                self.shared_state.set_save_path(None)
             return audio_data
 
         elif action == "set_input_device":
@@ -480,47 +492,6 @@ class AudioRecorder:
         except (ValueError, TypeError):
             self._input_channel_mapping = None
 
-    def _is_audio_queue_active(self) -> bool:
-        """Check if audio queue should receive data.
-        Same functionality as in ProcessManager, that we cannot access from
-        this OS process ctx.
-
-        Returns:
-            True if audio queue is active, False otherwise
-        """
-        if not self.manager_dict:
-            return False
-        try:
-            return self.manager_dict.get("audio_queue_active", False)
-        except (AttributeError, KeyError):
-            return False
-
-    def _get_save_path(self) -> Optional[str]:
-        """Get the current save path for recording.
-        Same functionality as ProcessManager.get_save_path(), which we cannot
-        access from this separate OS process.
-
-        Returns:
-            Path to save recording or None
-        """
-        if not self.manager_dict:
-            return None
-        try:
-            return self.manager_dict.get("save_path")
-        except (AttributeError, KeyError):
-            return None
-
-    def _clear_save_path(self) -> None:
-        """Clear the save path after recording is saved.
-        Same functionality as ProcessManager.set_save_path(None), which we cannot
-        access from this separate OS process.
-        """
-        if self.manager_dict:
-            try:
-                self.manager_dict["save_path"] = None
-            except (AttributeError, KeyError):
-                pass
-
     def _audio_callback(
         self, indata: np.ndarray, frames: int, time_info, status
     ) -> None:
@@ -566,13 +537,29 @@ class AudioRecorder:
                 frame_count=self.level_calculator.get_frame_count(),
             )
 
-            # Send to visualization queue if active
-            if self._is_audio_queue_active():
-                self.queue_manager.put_audio_data(indata.copy())
+            # Send to visualization ring buffer if active
+            if self.shared_state.is_audio_queue_active():
+                self._send_visualization_data(indata)
 
             # Update position
             self.current_position += frames
 
+    def _send_visualization_data(self, indata: np.ndarray) -> None:
+        """Send audio data to the UI for live visualization.
+
+        Writes normalized mono samples into the shared ring buffer and wakes
+        up the UI transfer thread. Does nothing if no ring buffer is attached.
+
+        Args:
+            indata: Input buffer from the audio callback
+        """
+        if not self.audio_ring:
+            return
+
+        self.audio_ring.write(ensure_mono_normalized(indata))
+        if self.data_ready is not None:
+            self.data_ready.set()
+
     def cleanup(self) -> None:
         """Clean up resources.
 
@@ -586,25 +573,31 @@ class AudioRecorder:
             self.shared_state.stop_recording()
             self.shared_state.close()
 
+        if self.audio_ring:
+            self.audio_ring.close()
+
 
 def record_process(
     config: AudioConfig,
-    audio_queue: mp.Queue,
     shared_state_name: str,
     control_queue: mp.Queue,
-    manager_dict: dict,
     shutdown_event: Event,
+    audio_ring_name: str,
+    data_ready: Optional[Event] = None,
 ) -> None:
     """Process function for audio recording with hardware synchronization.
 
     Args:
         config: Audio configuration
-        audio_queue: Queue for audio visualization
         shared_state_name: Name of shared memory block
         control_queue: Queue for control commands
-        manager_dict: Shared manager dict (for save_path compatibility)
         shutdown_event: Signal for shutting down process
+        audio_ring_name: Name of the visualization ring buffer
+        data_ready: Event signaled when new visualization audio is available
     """
+    global sd
+    import sounddevice as sd
+
     # Setup signal handling for child process
     cleanup = ProcessCleanupManager(cleanup_callback=None, debug=False)
     cleanup.ignore_signals_in_child()
@@ -613,13 +606,18 @@ def record_process(
     queue_manager = AudioQueueManager(
         record_queue=control_queue,
         playback_queue=None,  # Not used in record process
-        audio_queue=audio_queue,
     )
 
     recorder = None
 
     try:
-        recorder = AudioRecorder(config, shared_state_name, queue_manager, manager_dict)
+        recorder = AudioRecorder(
+            config,
+            shared_state_name,
+            queue_manager,
+            audio_ring_name,
+            data_ready,
+        )
 
         while True:
             # Get next command
@@ -104,6 +104,29 @@ class LevelMeterFormat(NamedTuple):
     size: int = struct.calcsize(_LEVEL_METER_FORMAT)
 
 
+# Control flags set by the main process, followed by the save path bytes
+_CONTROL_FORMAT = "BBH"
+SAVE_PATH_MAX_BYTES = 4096
+
+
+class ControlStateFormat(NamedTuple):
+    """Format definition for control flags and the recording save path.
+
+    Unlike the other structures, control fields are written individually
+    (struct.pack_into at their field offset), because the main process and
+    the record process update different fields concurrently.
+    """
+
+    format: str = _CONTROL_FORMAT
+    fields: Tuple[str, ...] = (
+        "audio_queue_active",  # B - unsigned char (1 byte) - visualization on
+        "debug",  # B - unsigned char (1 byte) - debug output enabled
+        "save_path_length",  # H - unsigned short (2 bytes) - 0 = no save path
+    )
+    # Header plus fixed-size UTF-8 save path buffer
+    size: int = struct.calcsize(_CONTROL_FORMAT) + SAVE_PATH_MAX_BYTES
+
+
 class SharedState:
     """Shared state using struct and shared memory.
 
@@ -121,6 +144,7 @@ class SharedState:
         self.recording_format = RecordingStateFormat()
         self.settings_format = AudioSettingsFormat()
         self.level_meter_format = LevelMeterFormat()
+        self.control_format = ControlStateFormat()
 
         # Calculate total size needed
         self.total_size = (
@@ -128,6 +152,7 @@ class SharedState:
             + self.recording_format.size
             + self.settings_format.size
             + self.level_meter_format.size
+            + self.control_format.size
         )
 
         # Offsets for each structure
@@ -135,6 +160,11 @@ class SharedState:
         self.recording_offset = self.playback_format.size
         self.settings_offset = self.recording_offset + self.recording_format.size
         self.level_meter_offset = self.settings_offset + self.settings_format.size
+        self.control_offset = self.level_meter_offset + self.level_meter_format.size
+        self.save_path_offset = self.control_offset + struct.calcsize(
+            self.control_format.format
+        )
+        self._unlinked = False
 
         if create:
             self.shm = shared_memory.SharedMemory(create=True, size=self.total_size)
@@ -192,6 +222,10 @@ class SharedState:
                 self.level_meter_offset : self.level_meter_offset
                 + self.level_meter_format.size
             ] = level_meter_defaults
+            # Control flags off, no save path
+            struct.pack_into(
+                self.control_format.format, self.shm.buf, self.control_offset, 0, 0, 0
+            )
         else:
             # Will attach later with attach_to_existing()
             self.shm = None
@@ -212,15 +246,56 @@ class SharedState:
             self.shm.close()
 
     def unlink(self) -> None:
-        """Unlink (delete) shared memory."""
-        if self.shm:
+        """Unlink (delete) shared memory.
+
+        Only the creating process should call this, after the other
+        processes have exited. Calling it again does nothing.
+        """
+        if self.shm and not self._unlinked:
             self.shm.unlink()
+            self._unlinked = True
 
     @property
     def name(self) -> Optional[str]:
         """Get shared memory name for passing to other processes."""
         return self.shm.name if self.shm else None
 
+    def initialize(
+        self, sample_rate: int, bit_depth: int, channels: int = 1, format_type: int = 0
+    ) -> None:
+        """Initialize playback, recording and audio settings in one write.
+
+        Sets playback to IDLE, recording to STOPPED and stores valid audio
+        settings. The three structures are contiguous, so they are packed
+        together and written with a single buffer assignment.
+
+        Args:
+            sample_rate: Sample rate in Hz
+            bit_depth: Bit depth (16 or 24)
+            channels: Number of channels
+            format_type: Format type (0=WAV, 1=FLAC)
+        """
+        update_counter = self.get_audio_settings()["update_counter"] + 1
+        data = (
+            struct.pack(
+                self.playback_format.format, PLAYBACK_STATUS_IDLE, 0.0, 0, 0, 0.0, 0
+            )
+            + struct.pack(
+                self.recording_format.format, RECORDING_STATUS_STOPPED, 0.0, 0, 0.0, 0
+            )
+            + struct.pack(
+                self.settings_format.format,
+                SETTINGS_STATUS_VALID,
+                sample_rate,
+                bit_depth,
+                channels,
+                format_type,
+                0,  # reserved
+                update_counter,
+            )
+        )
+        self.shm.buf[self.playback_offset : self.level_meter_offset] = data
+
     # Playback state methods
     def set_playback_state(self, **kwargs) -> None:
         """Set playback state fields.
@@ -530,3 +605,69 @@ class SharedState:
             update_time=time.time(),
             frame_count=next_frame,
         )
+
+    # Control methods
+    def set_audio_queue_active(self, active: bool) -> None:
+        """Set whether recorded audio should be sent for visualization.
+
+        Args:
+            active: True if the visualization pipeline is active
+        """
+        struct.pack_into("B", self.shm.buf, self.control_offset, int(active))
+
+    def is_audio_queue_active(self) -> bool:
+        """Check whether recorded audio should be sent for visualization.
+
+        Returns:
+            True if the visualization pipeline is active
+        """
+        return bool(self.shm.buf[self.control_offset])
+
+    def set_debug(self, debug: bool) -> None:
+        """Set the debug output flag for the audio processes.
+
+        Args:
+            debug: True to enable debug output
+        """
+        struct.pack_into("B", self.shm.buf, self.control_offset + 1, int(debug))
+
+    def is_debug(self) -> bool:
+        """Check whether debug output is enabled.
+
+        Returns:
+            True if debug output is enabled
+        """
+        return bool(self.shm.buf[self.control_offset + 1])
+
+    def set_save_path(self, path: Optional[str]) -> None:
+        """Set the path the next recording is saved to.
+
+        The path bytes are written before their length, so a reader never
+        sees a length that covers unwritten bytes.
+
+        Args:
+            path: Path to save recording or None
+
+        Raises:
+            ValueError: If the encoded path exceeds SAVE_PATH_MAX_BYTES
+        """
+        encoded = path.encode("utf-8") if path is not None else b""
+        if len(encoded) > SAVE_PATH_MAX_BYTES:
+            raise ValueError(f"Save path exceeds {SAVE_PATH_MAX_BYTES} bytes: {path}")
+        self.shm.buf[self.save_path_offset : self.save_path_offset + len(encoded)] = (
+            encoded
+        )
+        struct.pack_into("H", self.shm.buf, self.control_offset + 2, len(encoded))
+
+    def get_save_path(self) -> Optional[str]:
+        """Get the path the current recording is saved to.
+
+        Returns:
+            Path to save recording or None
+        """
+        (length,) = struct.unpack_from("H", self.shm.buf, self.control_offset + 2)
+        if length == 0:
+            return None
+        return bytes(
+            self.shm.buf[self.save_path_offset : self.save_path_offset + length]
+        ).decode("utf-8")
@@ -4,7 +4,8 @@ This module provides the UndoStack class that manages undo and redo
 operations using the command pattern.
 """
 
-from typing import TYPE_CHECKING, List, Optional
+from collections import deque
+from typing import TYPE_CHECKING, Deque, List, Optional
 
 from .edit_commands import EditCommand
 
@@ -30,7 +31,8 @@ class UndoStack:
                       Older commands are discarded when the limit is reached.
         """
         self._max_size = max_size
-        self._undo_stack: List[EditCommand] = []
+        # The deque drops the oldest command itself once max_size is reached
+        self._undo_stack: Deque[EditCommand] = deque(maxlen=max_size)
         self._redo_stack: List[EditCommand] = []
 
     def push(self, command: EditCommand) -> None:
@@ -45,9 +47,6 @@ class UndoStack:
         self._undo_stack.append(command)
         self._redo_stack.clear()
 
-        if len(self._undo_stack) > self._max_size:
-            self._undo_stack.pop(0)
-
     def undo(self, file_manager: "FileManager") -> Optional[EditCommand]:
         """Undo the most recent command.
 
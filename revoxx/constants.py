@@ -199,7 +199,8 @@ class UIConstants:
     # Timing (milliseconds)
     ANIMATION_UPDATE_MS = 100  # ~10fps (TkAgg + Tcl/Tk 9 needs ~100ms per frame on x86)
     PLAYBACK_CHECK_MS = 50
-    PLAYBACK_STOP_DELAY_MS = 50  # Delay after stopping playback
+    PLAYBACK_STOP_DELAY_MS = 50  # Max wait for the playback process to stop
+    PLAYBACK_STOP_POLL_MS = 5  # Poll interval while waiting for it
     FOCUS_DELAY_MS = 100
     POST_RECORDING_DELAY_MS = 500
     INITIAL_DISPLAY_DELAY_MS = 500  # Delay before showing initial recording
@@ -208,7 +209,6 @@ class UIConstants:
     # Process timing (seconds)
     AUDIO_PROCESS_SLEEP = 0.1
     PROCESS_JOIN_TIMEOUT = 0.1
-    PLAYBACK_STOP_DELAY = 0.05  # Same as PLAYBACK_STOP_DELAY_MS but in seconds
 
     # Window layout ratios
     INFO_FRAME_HEIGHT_RATIO = 0.06
@@ -301,6 +301,8 @@ class FileConstants:
     DEFAULT_RECORDING_DIR = "recordings"
     AUDIO_FILE_EXTENSION = ".flac"
     LEGACY_AUDIO_FILE_EXTENSION = ".wav"
+    # Format type shared with audio processes (0=WAV, 1=FLAC)
+    AUDIO_FORMAT_TYPE = 1 if AUDIO_FILE_EXTENSION == ".flac" else 0
     NOT_FOUND_AUDIO = "not_found.wav"
 
     # File formats
@@ -1,5 +1,6 @@
 """Automatic ASR verification after recording."""
 
+import os
 import queue
 import threading
 from pathlib import Path
@@ -198,8 +199,6 @@ class ASRAutoController:
 
     def _load_api_key(self) -> Optional[str]:
         """Load API key from .env file or environment."""
-        import os
-
         env_file = Path.home() / ".revoxx" / ".env"
         if env_file.exists():
             for line in env_file.read_text().splitlines():
@@ -12,6 +12,7 @@ from typing import TYPE_CHECKING, Optional, Callable
 from ..constants import UIConstants, MsgType
 from ..utils.device_manager import get_device_manager
 from ..audio.audio_queue_processor import AudioQueueProcessor
+from ..audio.shared_state import PLAYBACK_STATUS_PLAYING, PLAYBACK_STATUS_FINISHING
 
 if TYPE_CHECKING:
     from ..app import Revoxx
@@ -55,8 +56,8 @@ class AudioController:
         """Refresh the audio device manager to detect any hardware changes.
 
         The device manager caches the list of available audio devices. This method
-        forces it to re-scan the system for any newly connected or disconnected
-        audio devices.
+        re-scans the system for newly connected or disconnected audio devices
+        unless the cached list was refreshed within the last few seconds.
 
         Returns:
             DeviceManager instance with refreshed device list, or None if the
@@ -64,7 +65,7 @@ class AudioController:
         """
         try:
             device_manager = get_device_manager()
-            device_manager.refresh()
+            device_manager.refresh_if_stale()
             return device_manager
         except (ImportError, RuntimeError):
             # Device manager might not be available or initialized
@@ -80,9 +81,8 @@ class AudioController:
             return
 
         # Check if device name is still available
-        available_names = [d["name"] for d in device_manager.get_output_devices()]
-
-        if self.app.config.audio.output_device not in available_names:
+        if not device_manager.has_output_device(self.app.config.audio.output_device):
+            available_names = [d["name"] for d in device_manager.get_output_devices()]
             # Device disappeared - this can happen on Linux with USB audio devices
             print(
                 f"ERROR: Output device '{self.app.config.audio.output_device}' disappeared from system"
@@ -104,8 +104,7 @@ class AudioController:
             return
 
         # Check if device name is still available
-        available_names = [d["name"] for d in device_manager.get_input_devices()]
-        if self.app.config.audio.input_device not in available_names:
+        if not device_manager.has_input_device(self.app.config.audio.input_device):
             self.app.display_controller.set_status(
                 "Selected input device not found. Using system default.", MsgType.ERROR
             )
@@ -129,30 +128,55 @@ class AudioController:
         self.stop_synchronized_playback()
         self.app.display_controller.stop_spectrogram_playback()
 
-        try:
-            self.app.shared_state.reset_level_meter()
-        except AttributeError:
-            pass
+        self.app.shared_state.reset_level_meter()
 
-        # Schedule clearing playback status after a short delay
+        # Clear playback status once the playback process has stopped
         def clear_and_callback():
-            try:
-                self.app.shared_state.stop_playback()
-            except AttributeError:
-                pass
+            self.app.shared_state.stop_playback()
 
             if callback:
                 callback()
 
-        # Use non-blocking delay if we have a window
-        if hasattr(self.app, "window") and self.app.window:
+        # Poll without blocking if we have a window
+        if self.app.window:
+            max_polls = (
+                UIConstants.PLAYBACK_STOP_DELAY_MS // UIConstants.PLAYBACK_STOP_POLL_MS
+            )
             self.app.window.window.after(
-                UIConstants.PLAYBACK_STOP_DELAY_MS, clear_and_callback
+                UIConstants.PLAYBACK_STOP_POLL_MS,
+                self._when_playback_stopped,
+                clear_and_callback,
+                max_polls,
             )
         else:
             # In tests or without window, execute immediately
             clear_and_callback()
 
+    def _when_playback_stopped(
+        self, callback: Callable[[], None], polls_left: int
+    ) -> None:
+        """Run callback once the playback process has acknowledged a stop.
+
+        The playback process sets the shared playback status to idle after
+        handling the stop command. Until then this re-schedules itself on
+        the Tk event loop, giving up after polls_left further checks.
+
+        Args:
+            callback: Function to call when playback has stopped
+            polls_left: Remaining number of polls before giving up
+        """
+        status = self.app.shared_state.get_playback_state()["status"]
+        stopping = status in (PLAYBACK_STATUS_PLAYING, PLAYBACK_STATUS_FINISHING)
+        if stopping and polls_left > 0:
+            self.app.window.window.after(
+                UIConstants.PLAYBACK_STOP_POLL_MS,
+                self._when_playback_stopped,
+                callback,
+                polls_left - 1,
+            )
+            return
+        callback()
+
     def toggle_recording(self) -> None:
         """Toggle recording state."""
         if self.app.state.recording.is_recording:
@@ -221,11 +245,11 @@ class AudioController:
                 # Marker active: prepare for insert recording
                 self.app.edit_controller.prepare_insert_recording()
 
-        self._start_audio_capture("recording")
+        self._start_recording_capture()
 
     def stop_recording(self) -> None:
         """Stop recording."""
-        self._stop_audio_capture("recording")
+        self._stop_recording_capture()
 
     def _get_selection_state(self):
         """Get selection state from spectrogram widget.
@@ -344,73 +368,56 @@ class AudioController:
 
     def start_monitoring_mode(self) -> None:
         """Start monitoring mode using record process without saving."""
-        self._start_audio_capture("monitoring")
+        self._start_monitoring_capture()
 
     def stop_monitoring_mode(self) -> None:
         """Stop monitoring mode - restore UI state."""
-        self._stop_audio_capture("monitoring")
+        self._stop_monitoring_capture()
 
-    def _start_audio_capture(self, mode: str) -> None:
-        """Start audio capture in recording or monitoring mode.
+    def _start_recording_capture(self) -> None:
+        """Start audio capture to a new take of the current utterance.
 
-        This method coordinates the startup of audio capture across multiple components:
-        1. Stops any conflicting audio operations (playback, other recordings)
-        2. Configures the UI for the selected mode (shows spectrogram, level meter)
-        3. Sends start command to the recording process via queue
-        4. Updates application state to reflect active capture
-
-        Recording mode: Captures audio to file for saving
-        Monitoring mode: Captures audio for level display only (no file saved)
-
-        Args:
-            mode: Must be either 'recording' or 'monitoring'
+        Stops monitoring and playback, which would conflict with the input
+        device, reserves the next take path and starts capturing once the
+        spectrograms are ready.
         """
-        if mode not in ("recording", "monitoring"):
-            raise ValueError(
-                f"Invalid mode: {mode}. Must be 'recording' or 'monitoring'"
-            )
-
-        # Prepare for audio capture
-        self._prepare_for_audio_capture(mode)
+        if self.is_monitoring:
+            self.stop_monitoring_mode()
+        self.stop_synchronized_playback()
 
-        # Mode-specific setup
-        if mode == "recording":
-            if not self._setup_recording_mode():
-                if self.app.debug:
-                    print(
-                        "[AudioController] _setup_recording_mode() returned False (no current label?)"
-                    )
-                return  # No current label, can't record
-        else:
-            self._setup_monitoring_mode()
+        if not self._setup_recording_mode():
+            if self.app.debug:
+                print(
+                    "[AudioController] _setup_recording_mode() returned False (no current label?)"
+                )
+            return  # No current label, can't record
 
         if self.app.debug:
             print(
-                f"[AudioController] _start_audio_capture({mode}) waiting for spectrograms..."
+                "[AudioController] _start_recording_capture waiting for spectrograms..."
             )
-
-        # Execute the actual audio capture start
-        # Ensure spectrograms are ready before starting (especially for monitoring)
         self.app.display_controller.when_spectrograms_ready(
-            lambda: self._do_start_audio_capture(mode)
+            self._do_start_recording_capture
         )
 
-    def _prepare_for_audio_capture(self, mode: str) -> None:
-        """Prepare system for audio capture by stopping conflicting operations.
+    def _start_monitoring_capture(self) -> None:
+        """Start audio capture for level display only (no file saved).
 
-        Audio capture requires exclusive access to the audio input device.
-        This method stops any operations that would conflict:
-        - Active monitoring (if starting recording)
-        - Active playback (can't record and play simultaneously)
-        - Previous recording sessions
-
-        This ensures clean state before starting new capture.
+        Shows the meters, remembering the previous UI state, and starts
+        capturing once the spectrograms are ready.
         """
         if self.is_monitoring:
             self.stop_monitoring_mode()
 
-        if mode == "recording":
-            self.stop_synchronized_playback()
+        self._setup_monitoring_mode()
+
+        if self.app.debug:
+            print(
+                "[AudioController] _start_monitoring_capture waiting for spectrograms..."
+            )
+        self.app.display_controller.when_spectrograms_ready(
+            self._do_start_monitoring_capture
+        )
 
     def _setup_recording_mode(self) -> bool:
         """Set up recording mode for capturing audio to file.
@@ -468,7 +475,7 @@ class AudioController:
         ends.
         """
         # Save current meters state from main window to restore later
-        if self.app.window and hasattr(self.app.window, "meters_visible"):
+        if self.app.window:
             self.saved_meters_state = self.app.window.meters_visible
         else:
             self.saved_meters_state = False
@@ -484,19 +491,31 @@ class AudioController:
         """Reset level meter when entering monitoring mode."""
         self.app.display_controller.reset_level_meters()
 
-    def _do_start_audio_capture(self, mode: str) -> None:
+    def _do_start_recording_capture(self) -> None:
+        """Begin capturing and show the take being recorded."""
+        self._begin_audio_capture()
+        self.app.display_controller.update_display()
+
+    def _do_start_monitoring_capture(self) -> None:
+        """Begin capturing and show the monitoring status."""
+        self._begin_audio_capture()
+        self.app.display_controller.set_status(
+            "Monitoring input levels...", MsgType.ACTIVE
+        )
+        self.app.display_controller.set_monitoring_var(True)
+
+    def _begin_audio_capture(self) -> None:
         """Execute the actual audio capture start.
 
-        This is the final step that actually begins audio capture by:
-        1. Clearing the spectrogram display for fresh data
-        2. Starting spectrogram recording at current sample rate
-        3. Sending start command to the recording process
-        4. Updating status message in UI
+        This is the final step shared by recording and monitoring:
+        1. Starting spectrogram recording at current sample rate
+           (which clears the display for fresh data)
+        2. Updating the info panels with the capture parameters
+        3. Verifying the input device
+        4. Sending start command to the recording process
         """
         if self.app.debug:
-            print(
-                f"[AudioController] _do_start_audio_capture({mode}) - spectrograms ready"
-            )
+            print("[AudioController] _begin_audio_capture - spectrograms ready")
             print(
                 f"[AudioController]   audio_queue_active={self.app.process_manager.is_audio_queue_active()}"
             )
@@ -508,7 +527,7 @@ class AudioController:
             self.app.config.audio.sample_rate
         )
 
-        self._update_info_panel_for_capture(mode)
+        self._update_info_panel_for_capture()
 
         # Handle device notifications and verify availability
         self.app.notify_if_default_device("input")
@@ -518,15 +537,7 @@ class AudioController:
         if self.app.debug:
             print("[AudioController]   start_recording command sent to record process")
 
-        if mode == "recording":
-            self.app.display_controller.update_display()
-        else:
-            self.app.display_controller.set_status(
-                "Monitoring input levels...", MsgType.ACTIVE
-            )
-            self.app.display_controller.set_monitoring_var(True)
-
-    def _update_info_panel_for_capture(self, mode: str) -> None:
+    def _update_info_panel_for_capture(self) -> None:
         """Update info panel for audio capture."""
         recording_params = {
             "sample_rate": self.app.config.audio.sample_rate,
@@ -536,25 +547,15 @@ class AudioController:
 
         self.app.display_controller.update_info_panels_with_params(recording_params)
 
-    def _stop_audio_capture(self, mode: str) -> None:
-        """Stop audio capture in recording or monitoring mode.
-
-        Args:
-            mode: Must be either 'recording' or 'monitoring'
-        """
-        if mode not in ("recording", "monitoring"):
-            raise ValueError(
-                f"Invalid mode: {mode}. Must be 'recording' or 'monitoring'"
-            )
-
-        # Execute the actual audio capture stop
+    def _stop_recording_capture(self) -> None:
+        """Stop recording and finalize the new take."""
         self._do_stop_audio_capture()
+        self._cleanup_recording_mode()
 
-        # Mode-specific cleanup
-        if mode == "recording":
-            self._cleanup_recording_mode()
-        else:
-            self._cleanup_monitoring_mode()
+    def _stop_monitoring_capture(self) -> None:
+        """Stop monitoring and restore the previous UI state."""
+        self._do_stop_audio_capture()
+        self._cleanup_monitoring_mode()
 
     def _do_stop_audio_capture(self) -> None:
         """Execute the actual audio capture stop."""
@@ -612,7 +613,6 @@ class AudioController:
         if (
             self.saved_meters_state is not None
             and self.app.window
-            and hasattr(self.app.window, "meters_visible")
             and self.saved_meters_state != self.app.window.meters_visible
         ):
             self.app.display_controller.toggle_meters()
@@ -709,8 +709,8 @@ class AudioController:
         Args:
             label: The label of the recording
         """
-        # Invalidate cache to ensure the new take is recognized
-        self.app.active_recordings.invalidate_cache()
+        # Re-scan the label to ensure the new take is recognized
+        self.app.active_recordings.invalidate_label(label)
 
         # Get the new take that was just recorded
         new_take = self.app.active_recordings.get_highest_take(label)
@@ -113,15 +113,12 @@ class DeviceController:
         # Update configuration with device NAME (not index)
         self.app.config.audio.input_device = device_name
 
-        # Update shared state with index for compatibility
-        try:
-            self.app.shared_state.set_input_device_index(index)
-        except AttributeError:
-            pass
-
         # Send device name to record process (will convert to index there)
         self.app.queue_manager.set_input_device(device_name)
 
+        # Verify the new selection against a fresh device list
+        device_manager.invalidate()
+
         # Update device status flags
         if device_name is None:
             self._default_input_in_effect = True
@@ -205,15 +202,12 @@ class DeviceController:
         # Update configuration with device NAME (not index)
         self.app.config.audio.output_device = device_name
 
-        # Update shared state with index for compatibility
-        try:
-            self.app.shared_state.set_output_device_index(index)
-        except AttributeError:
-            pass
-
         # Send device name to playback process (will convert to index there)
         self.app.queue_manager.set_output_device(device_name)
 
+        # Verify the new selection against a fresh device list
+        device_manager.invalidate()
+
         # Update device status flags
         if device_name is None:
             self._default_output_in_effect = True
@@ -269,17 +263,12 @@ class DeviceController:
     def update_audio_settings(self) -> None:
         """Update audio settings across all processes."""
         # Update shared state with current audio configuration
-        format_type = 1 if FileConstants.AUDIO_FILE_EXTENSION == ".flac" else 0
-
-        try:
-            self.app.shared_state.update_audio_settings(
-                sample_rate=self.app.config.audio.sample_rate,
-                bit_depth=self.app.config.audio.bit_depth,
-                channels=self.app.config.audio.channels,
-                format_type=format_type,
-            )
-        except AttributeError:
-            pass
+        self.app.shared_state.update_audio_settings(
+            sample_rate=self.app.config.audio.sample_rate,
+            bit_depth=self.app.config.audio.bit_depth,
+            channels=self.app.config.audio.channels,
+            format_type=FileConstants.AUDIO_FORMAT_TYPE,
+        )
 
     @staticmethod
     def get_available_input_devices() -> List[Dict[str, Any]]:
@@ -410,6 +399,27 @@ class DeviceController:
         """Mark that user has been notified about default output."""
         self._notified_default_output = True
 
+    def claim_default_device_notice(self, device_type: str) -> bool:
+        """Check once whether the user should be told about a default device.
+
+        Args:
+            device_type: Either 'output' or 'input'
+
+        Returns:
+            True if the default device is in effect and the user has not been
+            notified yet; the notification is marked as shown.
+        """
+        if device_type == "output":
+            if not self._default_output_in_effect or self._notified_default_output:
+                return False
+            self._notified_default_output = True
+            return True
+
+        if not self._default_input_in_effect or self._notified_default_input:
+            return False
+        self._notified_default_input = True
+        return True
+
     def _get_device_name_from_index(self, index: Optional[int]) -> str:
         """Convert device index to device name.
 
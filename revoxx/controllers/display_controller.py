@@ -1,8 +1,7 @@
 """Display controller for managing UI updates and visualization."""
 
+from bisect import bisect_left
 from typing import Optional, Dict, Any, TYPE_CHECKING, Callable, List
-from pathlib import Path
-import soundfile as sf
 
 from ..constants import MsgType
 from ..ui.widget_initializer import WidgetInitializer
@@ -34,30 +33,56 @@ class DisplayController:
         self.app = app
         self.window_manager = window_manager
         self._spectrogram_callbacks: List[Callable] = []
+        # What the windows currently show, to skip identical redraws
+        self._displayed_state: Optional[tuple] = None
+        self._info_panel_update_pending = False
 
     def update_display(self) -> None:
-        """Update the main display with current utterance information."""
-        if not self.app.state.recording.utterances:
+        """Update the main display with current utterance information.
+
+        Does nothing if the windows already show the same utterance,
+        position and recording state, e.g. on key repeat at the end of
+        the list. Call invalidate_display() to force the next update.
+        """
+        utterances = self.app.state.recording.utterances
+        windows = self._get_active_windows()
+        if not utterances:
+            state = (None, tuple(id(w) for w in windows))
+            if state == self._displayed_state:
+                return
             # No utterances loaded - show empty state
             self._for_each_window(lambda w: w.update_display(0, False, 0))
+            self._displayed_state = state
             return
 
         current_index = self.app.state.recording.current_index
         is_recording = self.app.state.recording.is_recording
         display_pos = self.app.navigation_controller.get_display_position(current_index)
 
+        state = (
+            id(utterances),
+            len(utterances),
+            current_index,
+            is_recording,
+            display_pos,
+            tuple(id(w) for w in windows),
+        )
+        if state == self._displayed_state:
+            return
+
         self._for_each_window(
             lambda w: w.update_display(current_index, is_recording, display_pos)
         )
+        self._displayed_state = state
+
+    def invalidate_display(self) -> None:
+        """Make the next update_display() redraw all windows."""
+        self._displayed_state = None
 
     def show_saved_recording_when_ready(self) -> None:
         """Show saved recording when spectrogram widget is ready."""
         # Check if spectrogram exists and is ready
-        if (
-            self.app.window
-            and hasattr(self.app.window, "mel_spectrogram")
-            and self.app.window.mel_spectrogram is not None
-        ):
+        if self.app.window and self.app.window.mel_spectrogram is not None:
             # Already ready, show immediately
             self.show_saved_recording()
         elif self.app.window:
@@ -76,28 +101,32 @@ class DisplayController:
         if current_take == 0:
             # No recording exists, clear display
             self.clear_spectrograms()
-            self.update_info_panel()
+            self.schedule_info_panel_update()
             return
 
         # Load the recording
         filepath = self.app.file_manager.get_recording_path(current_label, current_take)
-        if filepath.exists():
-            # Guard against 0-byte / corrupt files (e.g. from a previous crash)
-            if filepath.stat().st_size == 0:
-                filepath.unlink()
-                self.clear_spectrograms()
-                self.update_info_panel()
-                return
+        try:
+            stat = filepath.stat()
+        except FileNotFoundError:
+            return
 
-            try:
-                audio_data, sr = self.app.file_manager.load_audio(filepath)
+        # Guard against 0-byte / corrupt files (e.g. from a previous crash)
+        if stat.st_size == 0:
+            filepath.unlink()
+            self.clear_spectrograms()
+            self.schedule_info_panel_update()
+            return
 
-                # Display in all spectrograms
-                self.show_recording_in_spectrograms(audio_data, sr)
-                self.update_info_panel()
-            except (OSError, ValueError) as e:
-                # OSError for file operations, ValueError for invalid audio data
-                self.set_status(f"Error loading recording: {e}", MsgType.ERROR)
+        try:
+            audio_data, sr = self.app.file_manager.load_audio(filepath, stat)
+
+            # Display in all spectrograms
+            self.show_recording_in_spectrograms(audio_data, sr)
+            self.schedule_info_panel_update()
+        except (OSError, ValueError) as e:
+            # OSError for file operations, ValueError for invalid audio data
+            self.set_status(f"Error loading recording: {e}", MsgType.ERROR)
 
     def refresh_recording_preserving_zoom(self) -> None:
         """Reload and display the current recording while preserving zoom state.
@@ -147,10 +176,7 @@ class DisplayController:
             # Toggle specific window
             window = self._get_window_by_id(window_id)
             if window:
-                current = (
-                    window.meters_visible if hasattr(window, "ui_state") else False
-                )
-                window.set_meters_visibility(not current)
+                window.set_meters_visibility(not window.meters_visible)
         else:
             # Toggle all windows - each toggles its own state
             self._for_each_window(
@@ -168,11 +194,7 @@ class DisplayController:
 
         # Show current recording if available - but only if not currently recording/monitoring
         # Check if any window has meters visible
-        any_meters_visible = any(
-            w.meters_visible
-            for w in self._get_active_windows()
-            if hasattr(w, "meters_visible")
-        )
+        any_meters_visible = any(w.meters_visible for w in self._get_active_windows())
 
         if any_meters_visible:
             if (
@@ -195,7 +217,7 @@ class DisplayController:
                 )
 
         # Save the main window's meters state as the global preference
-        if self.app.window and hasattr(self.app.window, "meters_visible"):
+        if self.app.window:
             self.app.settings_manager.update_setting(
                 "show_meters", self.app.window.meters_visible
             )
@@ -216,19 +238,34 @@ class DisplayController:
             filepath = self.app.file_manager.get_recording_path(
                 current_label, current_take
             )
-            if filepath.exists():
-                try:
-                    file_info = self._get_file_info(filepath)
-                    recording_params.update(file_info)
-                except (OSError, ValueError):
-                    # Error reading file
-                    pass
+            try:
+                file_info = self.app.file_manager.get_recording_info(filepath)
+                recording_params.update(file_info)
+            except (OSError, ValueError):
+                # Missing or unreadable file
+                pass
         else:
             # No recordings for this utterance
             recording_params["no_recordings"] = True
 
         self._for_each_window(lambda w: w.update_info_panel(recording_params))
 
+    def schedule_info_panel_update(self) -> None:
+        """Update the info panels once Tk is idle.
+
+        Calls made before the update runs, e.g. while navigating with key
+        repeat, are coalesced into a single update.
+        """
+        if self._info_panel_update_pending:
+            return
+        self._info_panel_update_pending = True
+        self.app.window.window.after_idle(self._run_scheduled_info_panel_update)
+
+    def _run_scheduled_info_panel_update(self) -> None:
+        """Run the info panel update requested by schedule_info_panel_update()."""
+        self._info_panel_update_pending = False
+        self.update_info_panel()
+
     def update_recording_timer(self, elapsed_time: float) -> None:
         """Update the recording timer display.
 
@@ -289,9 +326,13 @@ class DisplayController:
             current_take = self.app.state.recording.get_current_take(label)
             existing_takes = self.app.active_recordings.get_existing_takes(label)
 
-            if existing_takes and current_take in existing_takes:
-                position = existing_takes.index(current_take) + 1
-                status = f"{label} - Take {position}/{len(existing_takes)}"
+            # Takes are sorted, so the position is found by bisection
+            position = bisect_left(existing_takes, current_take)
+            if (
+                position < len(existing_takes)
+                and existing_takes[position] == current_take
+            ):
+                status = f"{label} - Take {position + 1}/{len(existing_takes)}"
             else:
                 status = label
 
@@ -348,25 +389,6 @@ class DisplayController:
             "channels": self.app.config.audio.channels,
         }
 
-    @staticmethod
-    def _get_file_info(filepath: Path) -> Dict[str, Any]:
-        """Get information about an audio file.
-
-        Args:
-            filepath: Path to the audio file
-
-        Returns:
-            Dictionary of file information
-        """
-        info = {}
-        with sf.SoundFile(filepath) as f:
-            info["duration"] = len(f) / f.samplerate
-            info["actual_sample_rate"] = f.samplerate
-            info["actual_channels"] = f.channels
-            info["size"] = filepath.stat().st_size  # Changed from file_size to size
-
-        return info
-
     # ============= Window Management Methods =============
 
     def _get_active_windows(self) -> List["WindowBase"]:
@@ -600,7 +622,7 @@ class DisplayController:
         windows_needing_spectrograms = [
             w
             for w in self._get_active_windows()
-            if not w.mel_spectrogram and getattr(w, "meters_visible", False)
+            if not w.mel_spectrogram and w.meters_visible
         ]
 
         if not windows_needing_spectrograms:
@@ -612,11 +634,7 @@ class DisplayController:
             callback()
         else:
             # wait for all spectrograms
-            spec_frames = [
-                w.spec_frame
-                for w in windows_needing_spectrograms
-                if hasattr(w, "spec_frame")
-            ]
+            spec_frames = [w.spec_frame for w in windows_needing_spectrograms]
 
             if self.app.debug:
                 print(
@@ -733,6 +751,7 @@ class DisplayController:
         """
         window = self._get_window_by_id(window_id)
         if window and window.is_active:
+            self.invalidate_display()
             self.update_display()
 
             if window.info_panel_visible:
@@ -792,5 +811,5 @@ class DisplayController:
 
         window._invalidate_layout_cache()
 
-        if hasattr(window, "text_var") and window.text_var.get():
+        if window.text_var.get():
             window.window.after_idle(window.refresh_text_layout)
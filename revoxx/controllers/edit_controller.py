@@ -12,7 +12,7 @@ from ..constants import MsgType, FileConstants, AudioConstants
 from ..audio.editor import AudioEditor
 from ..audio.undo_stack import UndoStack
 from ..audio.edit_commands import (
-    AudioSnapshotCommand,
+    AudioDiffCommand,
     TrashClipCommand,
     RestoreFromTrashCommand,
 )
@@ -147,13 +147,13 @@ class EditController:
             subtype = self._get_audio_subtype()
             self.app.file_manager.save_audio(filepath, audio_after, sr, subtype)
 
-            # Create and push undo command with complete snapshots
+            # Create and push undo command with the changed region
             duration = (end_sample - start_sample) / sr
-            cmd = AudioSnapshotCommand(
+            cmd = AudioDiffCommand.from_snapshots(
                 filepath=filepath,
                 sample_rate=sr,
-                audio_before=audio_before.copy(),
-                audio_after=audio_after.copy(),
+                audio_before=audio_before,
+                audio_after=audio_after,
                 subtype=subtype,
                 selection_start_time=sel_start,
                 selection_end_time=sel_end,
@@ -284,12 +284,12 @@ class EditController:
                 filepath, audio_after, original_sr, subtype
             )
 
-            # Create and push undo command with complete snapshots
-            cmd = AudioSnapshotCommand(
+            # Create and push undo command with the changed region
+            cmd = AudioDiffCommand.from_snapshots(
                 filepath=filepath,
                 sample_rate=original_sr,
-                audio_before=audio_before.copy(),
-                audio_after=audio_after.copy(),
+                audio_before=audio_before,
+                audio_after=audio_after,
                 subtype=subtype,
                 operation_description=f"Insert ({insert_duration:.2f}s)",
             )
@@ -361,13 +361,13 @@ class EditController:
                 filepath, audio_after, original_sr, subtype
             )
 
-            # Create and push undo command with complete snapshots
+            # Create and push undo command with the changed region
             original_duration = (end_sample - start_sample) / original_sr
-            cmd = AudioSnapshotCommand(
+            cmd = AudioDiffCommand.from_snapshots(
                 filepath=filepath,
                 sample_rate=original_sr,
-                audio_before=audio_before.copy(),
-                audio_after=audio_after.copy(),
+                audio_before=audio_before,
+                audio_after=audio_after,
                 subtype=subtype,
                 operation_description=f"Replace Range ({original_duration:.2f}s)",
             )
@@ -609,17 +609,17 @@ class EditController:
 
             # Update takes from active recordings
             self.app.state.recording.takes = self.app.active_recordings.get_all_takes()
-            existing_takes = self.app.active_recordings.get_existing_takes(label)
+            highest_take = self.app.active_recordings.get_highest_take(label)
         else:
-            existing_takes = []
+            highest_take = 0
 
         # Update displayed take
         if isinstance(cmd, RestoreFromTrashCommand):
             # Show the restored take
             self.app.state.recording.set_displayed_take(label, take)
-        elif existing_takes:
+        elif highest_take:
             # Show highest remaining take
-            self.app.state.recording.set_displayed_take(label, existing_takes[-1])
+            self.app.state.recording.set_displayed_take(label, highest_take)
         else:
             # No takes left
             self.app.state.recording.set_displayed_take(label, 0)
@@ -687,11 +687,11 @@ class EditController:
             self.app.file_manager.save_audio(filepath, audio_after, sr, subtype)
 
             duration_sec = selection_samples / sr
-            cmd = AudioSnapshotCommand(
+            cmd = AudioDiffCommand.from_snapshots(
                 filepath=filepath,
                 sample_rate=sr,
-                audio_before=audio_before.copy(),
-                audio_after=audio_after.copy(),
+                audio_before=audio_before,
+                audio_after=audio_after,
                 subtype=subtype,
                 selection_start_time=sel_start,
                 selection_end_time=sel_end,
@@ -77,23 +77,14 @@ class FileOperationsController:
                 self.app.state.recording.takes = (
                     self.app.active_recordings.get_all_takes()
                 )
-                # Find next available take
-                existing_takes = self.app.active_recordings.get_existing_takes(
-                    current_label
-                )
-            else:
-                existing_takes = []
-
-            if existing_takes:
-                # Set to the highest remaining take
-                new_take = existing_takes[-1]
-                self.app.state.recording.set_displayed_take(current_label, new_take)
+                # Show the highest remaining take, 0 if none are left
+                new_take = self.app.active_recordings.get_highest_take(current_label)
             else:
-                # No more takes, reset to 0
-                self.app.state.recording.set_displayed_take(current_label, 0)
+                new_take = 0
+            self.app.state.recording.set_displayed_take(current_label, new_take)
 
             # Clear mel spectrogram
-            if hasattr(self.app.window, "mel_spectrogram"):
+            if self.app.window.mel_spectrogram is not None:
                 self.app.window.mel_spectrogram.clear()
 
             # Show the current recording if one exists
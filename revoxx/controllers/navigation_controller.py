@@ -1,5 +1,6 @@
 """Navigation controller for utterance and take management."""
 
+from bisect import bisect_right
 from typing import TYPE_CHECKING
 
 from ..constants import FileConstants, MsgType
@@ -81,7 +82,7 @@ class NavigationController:
 
         # Update info panel if visible
         if self.app.window.info_panel_visible:
-            self.app.display_controller.update_info_panel()
+            self.app.display_controller.schedule_info_panel_update()
 
         # Recalculate font size after navigation
         self.app.display_controller.recalculate_window_font("main")
@@ -114,18 +115,9 @@ class NavigationController:
         if not existing_takes:
             return
 
-        # Find current position in the list
-        try:
-            current_index = existing_takes.index(current_take)
-        except ValueError:
-            # Current take not in list, find nearest
-            current_index = 0
-            for i, take in enumerate(existing_takes):
-                if take > current_take:
-                    current_index = max(0, i - 1)
-                    break
-                else:
-                    current_index = i
+        # Find current position in the sorted list, or the nearest lower
+        # take if the current one does not exist
+        current_index = max(0, bisect_right(existing_takes, current_take) - 1)
 
         # Calculate new index
         new_index = current_index + direction
@@ -140,7 +132,7 @@ class NavigationController:
 
             # Update info overlay if visible
             if self.app.window.info_panel_visible:
-                self.app.display_controller.update_info_panel()
+                self.app.display_controller.schedule_info_panel_update()
 
     def find_utterance(self, index: int) -> None:
         """Navigate directly to a specific utterance by index.
@@ -164,11 +156,7 @@ class NavigationController:
                 second.mel_spectrogram.stop_playback()
 
         # Reset level meter and selections
-        try:
-            self.app.shared_state.reset_level_meter()
-        except AttributeError:
-            # Shared state or method might not exist
-            pass
+        self.app.shared_state.reset_level_meter()
 
         self.app.display_controller.clear_selections()
 
@@ -195,7 +183,7 @@ class NavigationController:
 
             # Update info overlay if visible
             if self.app.window.info_panel_visible:
-                self.app.display_controller.update_info_panel()
+                self.app.display_controller.schedule_info_panel_update()
 
     def resume_session_position(self) -> None:
         """Resume at the last viewed position, falling back to last recorded."""
@@ -354,4 +342,4 @@ class NavigationController:
 
         # Update info panel if visible
         if self.app.window.info_panel_visible:
-            self.app.display_controller.update_info_panel()
+            self.app.display_controller.schedule_info_panel_update()
@@ -1,9 +1,11 @@
 """Process manager for handling background processes and inter-process communication."""
 
 import multiprocessing as mp
+import sys
 import threading
-from typing import Optional, TYPE_CHECKING
-from multiprocessing.managers import SyncManager
+import time
+from multiprocessing.context import BaseContext
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 
 from ..audio.recorder import record_process
 from ..audio.player import playback_process
@@ -13,6 +15,22 @@ if TYPE_CHECKING:
     from ..app import Revoxx
 
 
+def _process_context() -> BaseContext:
+    """Get the multiprocessing context used for the audio processes.
+
+    On Linux the audio processes are forked, so they start without
+    re-importing the application and unpickling their arguments. Other
+    platforms keep their default start method, since forking is not safe
+    with the macOS audio frameworks.
+
+    Returns:
+        Multiprocessing context for processes, queues and events
+    """
+    if sys.platform.startswith("linux"):
+        return mp.get_context("fork")
+    return mp.get_context()
+
+
 class ProcessManager:
     """Manages background processes and inter-process communication.
 
@@ -30,19 +48,17 @@ class ProcessManager:
             app: Reference to the main application instance
         """
         self.app = app
+        self.mp_context = _process_context()
 
         # Process references
         self.record_process: Optional[mp.Process] = None
         self.playback_process: Optional[mp.Process] = None
         self.transfer_thread: Optional[threading.Thread] = None
-        self.manager_watchdog_thread: Optional[threading.Thread] = None
 
-        # Manager and shared resources
-        self.manager: Optional[SyncManager] = None
-        self.manager_pid: Optional[int] = None
+        # Shared resources
         self.shutdown_event: Optional[mp.Event] = None
-        self.manager_dict: Optional[dict] = None
-        self.audio_queue: Optional[mp.Queue] = None
+        self.data_ready: Optional[mp.Event] = None
+        self.vad_availability: Dict[str, bool] = {}
         self.record_queue: Optional[mp.Queue] = None
         self.playback_queue: Optional[mp.Queue] = None
         self.queue_manager: Optional[AudioQueueManager] = None
@@ -51,34 +67,27 @@ class ProcessManager:
         self._initialize_resources()
 
     def _initialize_resources(self) -> None:
-        """Initialize multiprocessing resources."""
-        if self.app.debug:
-            print("[ProcessManager] Creating mp.Manager()...")
+        """Initialize multiprocessing resources.
 
-        # Create manager directly and manually call shutdown() in cleanup
-        self.manager = mp.Manager()
+        Flags shared with the audio processes live in SharedState, so no
+        multiprocessing manager process is needed.
+        """
+        self.shutdown_event = self.mp_context.Event()
 
-        # Shared resources
-        self.shutdown_event = mp.Event()
-        self.manager_dict = self.manager.dict()
+        # Signaled by the record process when new visualization audio is ready
+        self.data_ready = self.mp_context.Event()
 
         # Create queue manager and queues
-        self.queue_manager = AudioQueueManager()
-        self.audio_queue = self.queue_manager.audio_queue
+        self.queue_manager = AudioQueueManager(context=self.mp_context)
         self.record_queue = self.queue_manager.record_queue
         self.playback_queue = self.queue_manager.playback_queue
 
         # Store references in app for other controllers
         self.app.shutdown_event = self.shutdown_event
-        self.app.manager_dict = self.manager_dict
         self.app.queue_manager = self.queue_manager
 
-        # Initialize shared state in self.manager_dict
-        self.set_audio_queue_active(False)
-        self.set_save_path(None)
-
-        # Check for VAD availability
-        self._check_vad_availability()
+        # VAD availability is only needed in the main process
+        self.vad_availability = self._check_vad_availability()
 
     def start_processes(self) -> None:
         """Start background recording and playback processes."""
@@ -86,15 +95,15 @@ class ProcessManager:
             print("[ProcessManager] Starting background processes...")
 
         # Start recording process
-        self.record_process = mp.Process(
+        self.record_process = self.mp_context.Process(
             target=record_process,
             args=(
                 self.app.config.audio,
-                self.audio_queue,
                 self.app.shared_state.name,
                 self.record_queue,
-                self.manager_dict,
                 self.shutdown_event,
+                self.app.audio_ring.name,
+                self.data_ready,
             ),
         )
         self.record_process.daemon = True  # Ensure process terminates with parent
@@ -105,13 +114,12 @@ class ProcessManager:
             )
 
         # Start playback process
-        self.playback_process = mp.Process(
+        self.playback_process = self.mp_context.Process(
             target=playback_process,
             args=(
                 self.app.config.audio,
                 self.playback_queue,
                 self.app.shared_state.name,
-                self.manager_dict,
                 self.shutdown_event,
             ),
         )
@@ -160,12 +168,7 @@ class ProcessManager:
         Returns:
             Path to save recording or None
         """
-        if self.manager_dict:
-            try:
-                return self.manager_dict.get("save_path")
-            except (AttributeError, KeyError):
-                return None
-        return None
+        return self.app.shared_state.get_save_path()
 
     def set_save_path(self, path: Optional[str]) -> None:
         """Set the save path for recording.
@@ -173,8 +176,7 @@ class ProcessManager:
         Args:
             path: Path to save recording or None
         """
-        if self.manager_dict:
-            self.manager_dict["save_path"] = path
+        self.app.shared_state.set_save_path(path)
 
     def shutdown(self) -> None:
         """Shutdown all processes and cleanup resources."""
@@ -196,9 +198,15 @@ class ProcessManager:
             print("[ProcessManager] Shutdown complete.")
 
     def _terminate_all_processes(self) -> None:
-        """Terminate recording and playback processes gracefully."""
+        """Terminate recording and playback processes gracefully.
+
+        All processes are signalled first and then waited for against a
+        shared deadline, so the shutdown takes as long as the slowest
+        process rather than the sum of all.
+        """
         if self.app.debug:
             print("[ProcessManager] Terminating all processes...")
+        terminated = []
         for process_name, process in [
             ("record", self.record_process),
             ("playback", self.playback_process),
@@ -219,37 +227,57 @@ class ProcessManager:
                 )
             # Try graceful termination first
             process.terminate()
-            process.join(timeout=0.5)
-
-            # Force kill if still alive
-            if process.is_alive():
-                if self.app.debug:
-                    print(
-                        f"[ProcessManager] Force killing {process_name} process (PID: {process.pid})..."
-                    )
-                process.kill()
-                process.join(timeout=0.2)
+            terminated.append((process_name, process))
 
-                if process.is_alive():
-                    if self.app.debug:
-                        print(
-                            f"[ProcessManager] WARNING: {process_name} process still alive after kill!"
-                        )
-            else:
-                if self.app.debug:
+        stuck = self._join_all(terminated, timeout=0.5)
+        if self.app.debug:
+            for process_name, process in terminated:
+                if (process_name, process) not in stuck:
                     print(
                         f"[ProcessManager] {process_name} process terminated gracefully."
                     )
 
-    def _cleanup_ipc_resources(self) -> None:
-        """Close queues and shutdown multiprocessing manager."""
+        # Force kill the ones still alive
+        for process_name, process in stuck:
+            if self.app.debug:
+                print(
+                    f"[ProcessManager] Force killing {process_name} process (PID: {process.pid})..."
+                )
+            process.kill()
+
+        for process_name, _ in self._join_all(stuck, timeout=0.2):
+            if self.app.debug:
+                print(
+                    f"[ProcessManager] WARNING: {process_name} process still alive after kill!"
+                )
 
+    @staticmethod
+    def _join_all(
+        processes: List[Tuple[str, mp.Process]], timeout: float
+    ) -> List[Tuple[str, mp.Process]]:
+        """Wait for several processes to exit within one common timeout.
+
+        Args:
+            processes: (name, process) pairs to wait for
+            timeout: Total time in seconds to wait for all of them
+
+        Returns:
+            The (name, process) pairs still alive afterwards
+        """
+        deadline = time.monotonic() + timeout
+        for _, process in processes:
+            process.join(timeout=max(0.0, deadline - time.monotonic()))
+        return [(name, process) for name, process in processes if process.is_alive()]
+
+    def _cleanup_ipc_resources(self) -> None:
+        """Close the process command queues."""
         if self.app.debug:
             print("[ProcessManager] Cleaning up IPC resources...")
 
-        # Close all queues
+        # Close all queues. Their readers are gone by now, so commands still
+        # buffered in the feeder thread are dropped; waiting for them to be
+        # flushed into a pipe nobody reads could block shutdown.
         for queue_name, queue_obj in [
-            ("audio", self.audio_queue),
             ("record", self.record_queue),
             ("playback", self.playback_queue),
         ]:
@@ -257,25 +285,12 @@ class ProcessManager:
                 try:
                     if self.app.debug:
                         print(f"[ProcessManager] Closing {queue_name} queue...")
+                    queue_obj.cancel_join_thread()
                     queue_obj.close()
-                    queue_obj.join_thread()
                 except (AttributeError, OSError) as e:
                     if self.app.debug:
                         print(f"[ProcessManager] Error closing {queue_name} queue: {e}")
 
-        # Shutdown multiprocessing manager
-        if self.manager:
-            try:
-                if self.app.debug:
-                    print("[ProcessManager] Shutting down multiprocessing manager...")
-                self.manager.shutdown()
-                if self.app.debug:
-                    print("[ProcessManager] Manager shutdown complete.")
-
-            except (BrokenPipeError, OSError) as e:
-                if self.app.debug:
-                    print(f"[ProcessManager] Error shutting down manager: {e}")
-
     def _clear_all_references(self) -> None:
         """Clear all object references to allow garbage collection."""
         if self.app.debug:
@@ -283,10 +298,8 @@ class ProcessManager:
         self.record_process = None
         self.playback_process = None
         self.transfer_thread = None
-        self.manager = None
         self.shutdown_event = None
-        self.manager_dict = None
-        self.audio_queue = None
+        self.data_ready = None
         self.record_queue = None
         self.playback_queue = None
 
@@ -296,13 +309,7 @@ class ProcessManager:
         Returns:
             True if audio queue is active
         """
-        if self.manager_dict:
-            try:
-                active = self.manager_dict.get("audio_queue_active", False)
-                return active
-            except (AttributeError, KeyError):
-                return False
-        return False
+        return self.app.shared_state.is_audio_queue_active()
 
     def set_audio_queue_active(self, active: bool) -> None:
         """Set audio queue processing state.
@@ -310,8 +317,7 @@ class ProcessManager:
         Args:
             active: Whether audio queue should be active
         """
-        if self.manager_dict:
-            self.manager_dict["audio_queue_active"] = active
+        self.app.shared_state.set_audio_queue_active(active)
 
     def are_processes_running(self) -> bool:
         """Check if background processes are running.
@@ -326,8 +332,12 @@ class ProcessManager:
             and self.playback_process.is_alive()
         )
 
-    def _check_vad_availability(self) -> None:
-        """Check if VAD backends are available and store in manager_dict."""
+    def _check_vad_availability(self) -> Dict[str, bool]:
+        """Check which VAD backends are available.
+
+        Returns:
+            Flags describing VAD availability
+        """
         # OmniVAD (default, always installed)
         try:
             from omnivad import OmniVAD  # noqa: F401
@@ -350,35 +360,21 @@ class ProcessManager:
                 f"[ProcessManager] OmniVAD: {omnivad_available}, Silero: {silero_available}"
             )
 
-        if self.manager_dict is not None:
-            self.manager_dict["omnivad_available"] = omnivad_available
-            self.manager_dict["silero_vad_available"] = silero_available
+        return {
+            "omnivad_available": omnivad_available,
+            "silero_vad_available": silero_available,
             # Legacy key for backwards compatibility
-            self.manager_dict["vad_available"] = omnivad_available or silero_available
+            "vad_available": omnivad_available or silero_available,
+        }
 
     def is_vad_available(self) -> bool:
         """Check if any VAD backend is available."""
-        if self.manager_dict:
-            try:
-                return self.manager_dict.get("vad_available", False)
-            except (AttributeError, KeyError):
-                return False
-        return False
+        return self.vad_availability.get("vad_available", False)
 
     def is_omnivad_available(self) -> bool:
         """Check if OmniVAD is available."""
-        if self.manager_dict:
-            try:
-                return self.manager_dict.get("omnivad_available", False)
-            except (AttributeError, KeyError):
-                return False
-        return False
+        return self.vad_availability.get("omnivad_available", False)
 
     def is_silero_vad_available(self) -> bool:
         """Check if Silero VAD is available (requires torch)."""
-        if self.manager_dict:
-            try:
-                return self.manager_dict.get("silero_vad_available", False)
-            except (AttributeError, KeyError):
-                return False
-        return False
+        return self.vad_availability.get("silero_vad_available", False)
@@ -1,6 +1,8 @@
 """Session controller for managing recording sessions."""
 
 import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -170,22 +172,36 @@ class SessionController:
         self.app.display_controller.show_saved_recording_when_ready()
 
         if session.audio_config:
-            self.app.config.audio.sample_rate = session.audio_config.sample_rate
-            self.app.config.audio.bit_depth = session.audio_config.bit_depth
-            self.app.config.audio.__post_init__()  # Update dtype and subtype
-
-            self.app.settings_manager.update_setting(
-                "sample_rate", self.app.config.audio.sample_rate
-            )
-            self.app.settings_manager.update_setting(
-                "bit_depth", self.app.config.audio.bit_depth
+            session_format = (
+                session.audio_config.sample_rate,
+                session.audio_config.bit_depth,
             )
+            # Switching between sessions with the same format needs no
+            # reconfiguration of the config and settings
+            audio = self.app.config.audio
+            if (audio.sample_rate, audio.bit_depth) != session_format:
+                # replace() derives dtype and subtype once
+                self.app.config.audio = replace(
+                    audio,
+                    sample_rate=session_format[0],
+                    bit_depth=session_format[1],
+                )
+                self.app.settings_manager.update_settings(
+                    {"sample_rate": session_format[0], "bit_depth": session_format[1]}
+                )
 
             if self.app.window.info_panel_visible:
                 self.app.display_controller.update_info_panel()
 
-            # Reinitialize audio if needed
-            if self.app.device_controller:
+            # The audio processes are compared separately: at startup the
+            # config already holds the saved format while the shared state
+            # still has the defaults it was created with
+            shared = self.app.shared_state.get_audio_settings()
+            processes_match = (
+                shared["sample_rate"],
+                shared["bit_depth"],
+            ) == session_format
+            if not processes_match and self.app.device_controller:
                 self.app.device_controller.update_audio_settings()
 
             self.app.device_controller.apply_session_audio_settings(
@@ -228,10 +244,15 @@ class SessionController:
             return
 
         try:
-            # Parse script file
-            labels, utterances = self.app.script_manager.load_script(
-                self.app.script_file
-            )
+            # Scan the recording directory while the script file is parsed
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                takes_future = executor.submit(
+                    self.app.file_manager.scan_take_files_by_label
+                )
+                labels, utterances = self.app.script_manager.load_script(
+                    self.app.script_file
+                )
+                take_files = takes_future.result()
 
             # Insert Reference Silence as first utterance (Index 0)
             labels.insert(0, REFERENCE_SILENCE_LABEL)
@@ -241,6 +262,7 @@ class SessionController:
             self.app.state.recording.utterances = utterances
 
             self.app.active_recordings.set_data(labels, utterances)
+            self.app.active_recordings.set_take_files(take_files)
             self.app.state.recording.takes = self.app.active_recordings.get_all_takes()
 
         except (OSError, ValueError, KeyError) as e:
@@ -249,3 +271,6 @@ class SessionController:
             self.app.state.recording.labels = []
             self.app.state.recording.utterances = []
             self.app.state.recording.takes = {}
+
+        # The new script must be drawn even if the position is unchanged
+        self.app.display_controller.invalidate_display()
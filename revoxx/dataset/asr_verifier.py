@@ -5,6 +5,7 @@ the result against the expected script text. Utterances where the ASR
 transcription diverges beyond a configurable threshold are flagged.
 """
 
+import json
 import re
 import unicodedata
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -81,8 +82,6 @@ class ASRClient:
         text = response.text.strip()
         if text.startswith("{"):
             try:
-                import json
-
                 data = json.loads(text)
                 return data.get("text", text).strip()
             except (json.JSONDecodeError, AttributeError):
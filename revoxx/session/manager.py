@@ -5,13 +5,13 @@ loading, and managing recording sessions.
 """
 
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
 import json
 import shutil
-import sounddevice as sd
 
 from .models import Session, SessionConfig, SpeakerInfo
+from ..utils.device_manager import get_device_manager
 
 
 class SessionManager:
@@ -33,6 +33,8 @@ class SessionManager:
         """
         self.settings_file = settings_file or Path.home() / ".revoxx" / "settings.json"
         self.current_session: Optional[Session] = None
+        # (mtime_ns, size) of the settings file and its recent session paths
+        self._recent_cache: Optional[Tuple[Tuple[int, int], List[str]]] = None
 
     def create_session(
         self,
@@ -193,19 +195,38 @@ class SessionManager:
         Returns:
             List of session paths
         """
-        if not self.settings_file.exists():
+        recent = self._load_recent_session_paths()
+        # Filter out non-existent paths
+        return [Path(p) for p in recent[:max_count] if Path(p).exists()]
+
+    def _load_recent_session_paths(self) -> List[str]:
+        """Load recent session paths from the settings file.
+
+        The parsed list is cached and only re-read when the settings file
+        changes, so repeated menu queries don't re-parse the JSON.
+
+        Returns:
+            List of recent session path strings
+        """
+        try:
+            stat = self.settings_file.stat()
+        except OSError:
             return []
 
+        file_key = (stat.st_mtime_ns, stat.st_size)
+        if self._recent_cache is not None and self._recent_cache[0] == file_key:
+            return self._recent_cache[1]
+
         try:
             with open(self.settings_file, "r") as f:
                 settings = json.load(f)
-                recent = settings.get("recent_sessions", [])
-                # Filter out non-existent paths
-                valid_recent = [Path(p) for p in recent[:max_count] if Path(p).exists()]
-                return valid_recent
         except (json.JSONDecodeError, IOError):
             return []
 
+        recent = settings.get("recent_sessions", [])
+        self._recent_cache = (file_key, recent)
+        return recent
+
     def get_last_session(self) -> Optional[Path]:
         """Get the last used session path.
 
@@ -278,23 +299,20 @@ class SessionManager:
     ) -> List[Dict[str, Any]]:
         """Get list of compatible audio devices for given configuration.
 
+        Uses the device manager's cached device list instead of querying
+        PortAudio again.
+
         Args:
             audio_config: Audio configuration to check against
 
         Returns:
             List of compatible device info dictionaries
         """
-        compatible = []
-        devices = sd.query_devices()
-
-        for i, device in enumerate(devices):
-            if device["max_input_channels"] > 0:  # Input device
-                device_info = dict(device)
-                device_info["index"] = i
-                if audio_config.is_compatible_with_device(device_info):
-                    compatible.append(device_info)
-
-        return compatible
+        return [
+            device_info
+            for device_info in get_device_manager().get_input_devices()
+            if audio_config.is_compatible_with_device(device_info)
+        ]
 
     def _validate_audio_config(self, audio_config: SessionConfig) -> None:
         """Validate audio configuration against available devices.
@@ -361,6 +379,7 @@ class SessionManager:
         self.settings_file.parent.mkdir(parents=True, exist_ok=True)
         with open(self.settings_file, "w") as f:
             json.dump(settings, f, indent=2)
+        self._recent_cache = None
 
     def get_default_base_dir(self) -> Optional[Path]:
         """Get the default base directory for new sessions.
@@ -310,22 +310,24 @@ class ASRVerificationDialog:
             pass  # Dialog was destroyed
 
     def _save_settings(self):
+        updates = {}
         url = self.url_var.get().strip()
         if url:
-            self.settings.update_setting("asr_base_url", url)
+            updates["asr_base_url"] = url
         lang = self.lang_var.get().strip()
-        self.settings.update_setting("asr_language", lang if lang else None)
+        updates["asr_language"] = lang if lang else None
 
         try:
             threshold = int(self.threshold_var.get()) / 100.0
-            self.settings.update_setting("asr_similarity_threshold", threshold)
+            updates["asr_similarity_threshold"] = threshold
         except ValueError:
             pass
         try:
             concurrent = int(self.concurrent_var.get())
-            self.settings.update_setting("asr_max_concurrent", max(1, concurrent))
+            updates["asr_max_concurrent"] = max(1, concurrent)
         except ValueError:
             pass
+        self.settings.update_settings(updates)
 
         key = self.key_var.get().strip()
         if key:
@@ -869,31 +869,20 @@ class DatasetDialog:
         Args:
             output_dir: Output directory path
         """
-        self.settings_manager.update_setting("last_export_dir", str(output_dir))
-        self.settings_manager.update_setting("export_format", self.format_var.get())
-        self.settings_manager.update_setting(
-            "export_include_intensity", self.include_intensity_var.get()
-        )
-        self.settings_manager.update_setting(
-            "export_include_omnivad", self.include_omnivad_var.get()
-        )
-        self.settings_manager.update_setting(
-            "export_include_silero_vad", self.include_silero_var.get()
-        )
-        self.settings_manager.update_setting(
-            "export_skip_rejected", self.skip_rejected_var.get()
-        )
-        self.settings_manager.update_setting(
-            "export_omit_single_emotion", self.omit_single_emotion_var.get()
-        )
-        self.settings_manager.update_setting(
-            "export_loudness_enabled", self.loudness_enabled_var.get()
-        )
+        settings = {
+            "last_export_dir": str(output_dir),
+            "export_format": self.format_var.get(),
+            "export_include_intensity": self.include_intensity_var.get(),
+            "export_include_omnivad": self.include_omnivad_var.get(),
+            "export_include_silero_vad": self.include_silero_var.get(),
+            "export_skip_rejected": self.skip_rejected_var.get(),
+            "export_omit_single_emotion": self.omit_single_emotion_var.get(),
+            "export_loudness_enabled": self.loudness_enabled_var.get(),
+        }
         loudness_target = self._get_loudness_target()
         if loudness_target is not None:
-            self.settings_manager.update_setting(
-                "export_loudness_target", loudness_target
-            )
+            settings["export_loudness_target"] = loudness_target
+        self.settings_manager.update_settings(settings)
 
     def _run_export(
         self, session_paths: List[Path], output_dir: Path, dataset_name: Optional[str]
@@ -7,6 +7,9 @@ import tkinter as tk
 from ...constants import UIConstants
 from .dialog_utils import setup_dialog_window
 
+# Platform is fixed for the lifetime of the process
+_IS_MACOS = platform.system() == "Darwin"
+
 
 class HelpDialog:
     """Dialog for displaying keyboard shortcuts from file."""
@@ -63,7 +66,7 @@ class HelpDialog:
             with open(resources_path, "r", encoding="utf-8") as f:
                 help_text = f.read()
                 # Replace Ctrl with Cmd on macOS
-                if platform.system() == "Darwin":
+                if _IS_MACOS:
                     help_text = help_text.replace("Ctrl", "Cmd")
         except (OSError, ValueError):
             help_text = "Help file not found. Please check the installation."
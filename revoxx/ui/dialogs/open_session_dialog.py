@@ -1,7 +1,7 @@
 """Open Session Dialog for selecting existing sessions."""
 
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 from pathlib import Path
 from typing import Optional
 import json
@@ -167,8 +167,6 @@ class OpenSessionDialog:
 
     def _browse_directory(self):
         """Browse for a different directory."""
-        from tkinter import filedialog
-
         new_dir = filedialog.askdirectory(
             title="Select Directory", initialdir=self.current_dir, parent=self.dialog
         )
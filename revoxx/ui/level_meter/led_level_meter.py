@@ -165,9 +165,13 @@ class LEDLevelMeter(tk.Frame):
         # Peak-hold line
         self._peak_hold_line_id: Optional[int] = None
 
+        # Pending after() ids of the update loop and the delayed color refresh
+        self._update_id: Optional[str] = None
+        self._refresh_timer: Optional[str] = None
+
         # Control flag to stop scheduling when widget is destroyed
         self._running: bool = True
-        self.bind("<Destroy>", lambda e: setattr(self, "_running", False))
+        self.bind("<Destroy>", self._on_destroy)
 
         self._create_ui()
         self._schedule_update()
@@ -423,7 +427,7 @@ class LEDLevelMeter(tk.Frame):
         self._update_nested_backgrounds(self.label_frame, bg_color)
 
         # Schedule delayed refresh to ensure colors stick
-        if hasattr(self, "_refresh_timer"):
+        if self._refresh_timer is not None:
             self.after_cancel(self._refresh_timer)
         self._refresh_timer = self.after(20, self._refresh_all_colors)
 
@@ -720,13 +724,33 @@ class LEDLevelMeter(tk.Frame):
                 )
 
     def _schedule_update(self) -> None:
-        """Schedule periodic updates from shared state."""
+        """Schedule periodic updates from shared state.
+
+        Only one update loop runs at a time; its pending after() id is kept
+        so the loop can be cancelled when the widget is destroyed.
+        """
+        self._update_id = None
         try:
             self._update_from_shared_state()
         finally:
             # Schedule next update (30 Hz) only if widget is still alive and running
             if self._running and self.winfo_exists():
-                self.after(33, self._schedule_update)
+                self._update_id = self.after(33, self._schedule_update)
+
+    def _on_destroy(self, event: tk.Event) -> None:
+        """Stop the update loop when the widget is destroyed.
+
+        Args:
+            event: Tkinter destroy event
+        """
+        if event.widget is not self:
+            return
+        self._running = False
+        for timer_id in (self._update_id, self._refresh_timer):
+            if timer_id is not None:
+                self.after_cancel(timer_id)
+        self._update_id = None
+        self._refresh_timer = None
 
     def _update_from_shared_state(self) -> None:
         """Update level meter from shared state data."""
@@ -21,6 +21,9 @@ from ...utils.tk_compat import clear_menu
 if TYPE_CHECKING:
     from ...app import Revoxx
 
+# Platform is fixed for the lifetime of the process
+_ACCEL_MOD = "Cmd" if platform.system() == "Darwin" else "Ctrl"
+
 
 class ApplicationMenu:
     """Main application menu bar.
@@ -115,19 +118,16 @@ class ApplicationMenu:
         )
         self.menubar.add_cascade(label="File", menu=file_menu)
 
-        # Platform-specific accelerator display
-        accel_mod = "Cmd" if platform.system() == "Darwin" else "Ctrl"
-
         # Session management
         file_menu.add_command(
             label="New Session...",
             command=self._new_session,
-            accelerator=f"{accel_mod}+N",
+            accelerator=f"{_ACCEL_MOD}+N",
         )
         file_menu.add_command(
             label="Open Session...",
             command=self._open_session,
-            accelerator=f"{accel_mod}+O",
+            accelerator=f"{_ACCEL_MOD}+O",
         )
 
         file_menu.add_separator()
@@ -186,7 +186,7 @@ class ApplicationMenu:
         self.edit_menu = edit_menu
 
         # Undo (index 0)
-        undo_accel = "Cmd+Z" if platform.system() == "Darwin" else "Ctrl+Z"
+        undo_accel = f"{_ACCEL_MOD}+Z"
         edit_menu.add_command(
             label="Undo",
             command=self.app.edit_controller.undo,
@@ -194,7 +194,7 @@ class ApplicationMenu:
         )
 
         # Redo (index 1)
-        redo_accel = "Shift+Cmd+Z" if platform.system() == "Darwin" else "Shift+Ctrl+Z"
+        redo_accel = f"Shift+{_ACCEL_MOD}+Z"
         edit_menu.add_command(
             label="Redo",
             command=self.app.edit_controller.redo,
@@ -204,7 +204,7 @@ class ApplicationMenu:
         edit_menu.add_separator()
 
         # Find utterance
-        find_accel = "Cmd+F" if platform.system() == "Darwin" else "Ctrl+F"
+        find_accel = f"{_ACCEL_MOD}+F"
         edit_menu.add_command(
             label="Find Utterance...",
             command=self.app.dialog_controller.show_find_dialog,
@@ -212,27 +212,26 @@ class ApplicationMenu:
         )
 
         # Jump to flagged (grouped with Find)
-        jump_accel_mod = "Cmd" if platform.system() == "Darwin" else "Ctrl"
         edit_menu.add_command(
             label="Jump to Next Needs Edit",
             command=lambda: self.app.flag_controller.jump_to_next("needs_edit"),
-            accelerator=f"{jump_accel_mod}+E",
+            accelerator=f"{_ACCEL_MOD}+E",
         )
         edit_menu.add_command(
             label="Jump to Next Rejected",
             command=lambda: self.app.flag_controller.jump_to_next("rejected"),
-            accelerator=f"{jump_accel_mod}+X",
+            accelerator=f"{_ACCEL_MOD}+X",
         )
         edit_menu.add_command(
             label="Jump to Next ASR Mismatch",
             command=self.app.flag_controller.jump_to_next_asr_mismatch,
-            accelerator=f"{jump_accel_mod}+A",
+            accelerator=f"{_ACCEL_MOD}+A",
         )
 
         edit_menu.add_separator()
 
         # Delete recording
-        delete_accel = "Cmd+D" if platform.system() == "Darwin" else "Ctrl+D"
+        delete_accel = f"{_ACCEL_MOD}+D"
         edit_menu.add_command(
             label="Delete Recording",
             command=self.app.file_operations_controller.delete_current_recording,
@@ -260,7 +259,7 @@ class ApplicationMenu:
         edit_menu.add_command(
             label="Toggle ASR Match",
             command=self.app.flag_controller.toggle_asr_match,
-            accelerator=f"Shift+{jump_accel_mod}+A",
+            accelerator=f"Shift+{_ACCEL_MOD}+A",
         )
 
         # Auto-verify checkbox
@@ -276,7 +275,7 @@ class ApplicationMenu:
         edit_menu.add_separator()
 
         # Utterance Order
-        order_accel = "Cmd+U" if platform.system() == "Darwin" else "Ctrl+U"
+        order_accel = f"{_ACCEL_MOD}+U"
         edit_menu.add_command(
             label="Utterance Order...",
             command=self.app.dialog_controller.show_utterance_order_dialog,
@@ -297,7 +296,7 @@ class ApplicationMenu:
         self.menubar.add_cascade(label="View", menu=view_menu)
 
         # Session Settings
-        accel = "Cmd+I" if platform.system() == "Darwin" else "Ctrl+I"
+        accel = f"{_ACCEL_MOD}+I"
         view_menu.add_command(
             label="Session Settings...",
             command=self._show_session_settings,
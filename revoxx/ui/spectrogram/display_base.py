@@ -40,7 +40,7 @@ class SpectrogramDisplayBase:
         parent: tk.Widget,
         audio_config: AudioConfig,
         display_config: DisplayConfig,
-        manager_dict: dict = None,
+        debug: bool = False,
     ):
         """Initialize display base.
 
@@ -48,12 +48,12 @@ class SpectrogramDisplayBase:
             parent: Parent tkinter widget
             audio_config: Audio configuration
             display_config: Display configuration
-            manager_dict: Shared manager dictionary
+            debug: Whether to print debug output
         """
         self.parent = parent
         self.audio_config = audio_config
         self.display_config = display_config
-        self.manager_dict = manager_dict or {}
+        self.debug = debug
 
         # Display components (initialized in subclass)
         self.fig: Optional[Figure] = None
@@ -358,7 +358,7 @@ class SpectrogramDisplayBase:
                     # self.canvas.get_tk_widget().update_idletasks()
                 except (AttributeError, ValueError, tk.TclError) as e:
                     # Fallback to normal draw if blitting fails
-                    if self.manager_dict.get("debug_mode", False):
+                    if self.debug:
                         print(f"DEBUG: Blitting failed with {type(e).__name__}: {e}")
                         print(
                             "DEBUG: Disabling blitting and falling back to normal drawing"
@@ -5,6 +5,7 @@ import numpy as np
 from ...utils.spectrogram_utils import resample_spectrogram
 
 from ...constants import AudioConstants
+from ...utils.audio_utils import normalize_audio
 from ...audio.processors import ClippingDetector
 from ...audio.processors.mel_spectrogram import MelSpectrogramProcessor
 from .controllers import ClippingVisualizer, ZoomController
@@ -20,6 +21,9 @@ class RecordingDisplay:
     - Zoom and scroll for long recordings
     """
 
+    # Frames per batched FFT; bounds temporary memory for long recordings
+    FRAME_BATCH_SIZE = 1024
+
     def __init__(
         self,
         clipping_detector: ClippingDetector,
@@ -78,44 +82,35 @@ class RecordingDisplay:
             1 + (len(audio_data) - AudioConstants.N_FFT) // AudioConstants.HOP_LENGTH
         )
 
-        mel_min = float("inf")
-        mel_max = float("-inf")
-
-        # Compute mel spectrogram for entire recording
+        # Compute mel spectrogram for entire recording in batches of frames
         mel_spec = np.zeros((adaptive_n_mels, n_frames))
+        if n_frames > 0:
+            audio_norm = normalize_audio(audio_data)
+            frames = np.lib.stride_tricks.sliding_window_view(
+                audio_norm, AudioConstants.N_FFT
+            )[:: AudioConstants.HOP_LENGTH][:n_frames]
+            for start in range(0, n_frames, self.FRAME_BATCH_SIZE):
+                end = min(start + self.FRAME_BATCH_SIZE, n_frames)
+                mel_spec[:, start:end] = recording_mel_processor.process_frames(
+                    frames[start:end]
+                )
+
+        # Track maximum frequency over all frames
         self.max_detected_freq = 0.0
-
-        for i in range(n_frames):
-            start_idx = i * AudioConstants.HOP_LENGTH
-            end_idx = start_idx + AudioConstants.N_FFT
-
-            if end_idx <= len(audio_data):
-                frame = audio_data[start_idx:end_idx]
-                mel_db, _ = recording_mel_processor.process(frame)
-                mel_spec[:, i] = mel_db
-
-                # Update min/max tracking
-                mel_min = min(mel_min, np.min(mel_db))
-                mel_max = max(mel_max, np.max(mel_db))
-
-                # Track maximum frequency
-                freq_bins_with_energy = np.where(
-                    mel_db
-                    > (
-                        AudioConstants.DB_MIN
-                        + AudioConstants.MAX_FREQ_ENERGY_THRESHOLD_DB
-                    )
-                )[0]
-                if len(freq_bins_with_energy) > 0:
-                    max_bin = freq_bins_with_energy[-1]
-                    max_freq = recording_mel_processor.mel_frequencies[max_bin]
-                    # Limit to Nyquist frequency
-                    max_freq = min(max_freq, sample_rate / 2)
-                    self.max_detected_freq = max(self.max_detected_freq, max_freq)
+        bins_with_energy = np.flatnonzero(
+            np.any(
+                mel_spec
+                > AudioConstants.DB_MIN + AudioConstants.MAX_FREQ_ENERGY_THRESHOLD_DB,
+                axis=1,
+            )
+        )
+        if bins_with_energy.size > 0:
+            max_freq = recording_mel_processor.mel_frequencies[bins_with_energy[-1]]
+            # Limit to Nyquist frequency
+            self.max_detected_freq = min(max_freq, sample_rate / 2)
 
         # Store all frames for zoom
-        for i in range(n_frames):
-            self.all_spec_frames.append(mel_spec[:, i])
+        self.all_spec_frames = list(mel_spec.T)
 
         # Calculate duration
         duration = len(audio_data) / sample_rate
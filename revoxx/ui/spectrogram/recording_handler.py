@@ -123,6 +123,9 @@ class RecordingHandler:
             return False
 
         audio_chunk = ensure_mono_normalized(audio_chunk)
+        if len(audio_chunk) > self.buffer_size:
+            # Consumer fell behind; only the most recent audio can be shown
+            audio_chunk = audio_chunk[-self.buffer_size :]
         chunk_size = len(audio_chunk)
 
         # Add new audio to buffer
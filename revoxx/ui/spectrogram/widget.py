@@ -3,7 +3,6 @@
 from typing import Optional, List
 import numpy as np
 import tkinter as tk
-import queue
 
 from matplotlib.image import AxesImage
 
@@ -11,6 +10,7 @@ from ...constants import AudioConstants
 from ...constants import UIConstants
 from ...utils.adaptive_frame_rate import get_adaptive_frame_rate, DEBUG_FPS
 from ..themes import theme_manager
+from ...audio.audio_ring_buffer import AudioRingBuffer
 from ...audio.processors import ClippingDetector
 from ...audio.processors import MelSpectrogramProcessor, MEL_CONFIG
 from ...utils.config import AudioConfig, DisplayConfig
@@ -61,7 +61,6 @@ class MelSpectrogramWidget(SpectrogramDisplayBase):
         parent: tk.Widget,
         audio_config: AudioConfig,
         display_config: DisplayConfig,
-        manager_dict: dict = None,
         shared_audio_state=None,
     ):
         """Initialize the mel spectrogram widget.
@@ -70,9 +69,10 @@ class MelSpectrogramWidget(SpectrogramDisplayBase):
             parent: Parent tkinter widget
             audio_config: Audio configuration
             display_config: Display configuration
-            manager_dict: Shared application state
+            shared_audio_state: Shared audio state for synchronization
         """
-        super().__init__(parent, audio_config, display_config, manager_dict)
+        debug = shared_audio_state is not None and shared_audio_state.is_debug()
+        super().__init__(parent, audio_config, display_config, debug)
         self.shared_audio_state = shared_audio_state
 
         # Initialize mel processor
@@ -142,8 +142,11 @@ class MelSpectrogramWidget(SpectrogramDisplayBase):
         # Set up event bindings
         self._setup_event_bindings()
 
-        # Audio queue for thread-safe updates
-        self.audio_queue = queue.Queue(maxsize=100)
+        # Samples from the transfer thread are copied into a preallocated
+        # thread-local ring and drained into a reusable buffer on the UI
+        # thread, so live updates do not allocate per chunk
+        self._audio_ring = AudioRingBuffer(shared=False)
+        self._audio_buffer = np.empty(self._audio_ring.capacity, dtype=np.float32)
 
     # Properties for compatibility
     @property
@@ -255,19 +258,6 @@ class MelSpectrogramWidget(SpectrogramDisplayBase):
         # View state for playback restoration
         self._saved_view_state = SavedViewState()
 
-    @staticmethod
-    def _clear_queue(queue_to_clear: queue.Queue) -> None:
-        """Clear all items from a queue.
-
-        Args:
-            queue_to_clear: The queue to clear
-        """
-        while not queue_to_clear.empty():
-            try:
-                queue_to_clear.get_nowait()
-            except queue.Empty:
-                break
-
     def _initialize_spectrogram_display(self) -> None:
         """Initialize the spectrogram display with empty data and correct axis limits."""
         initial_data = self._create_empty_spectrogram()
@@ -284,32 +274,32 @@ class MelSpectrogramWidget(SpectrogramDisplayBase):
 
     def _setup_event_bindings(self) -> None:
         """Set up mouse and keyboard event bindings."""
-        # Mouse wheel for zoom
-        self.canvas_widget.bind("<MouseWheel>", self._on_mouse_wheel)
-        self.canvas_widget.bind("<Button-4>", self._on_mouse_wheel)  # Linux
-        self.canvas_widget.bind("<Button-5>", self._on_mouse_wheel)  # Linux
-
-        # Double-click to reset zoom
-        self.canvas_widget.bind("<Double-Button-1>", self._reset_zoom)
-
-        # Middle mouse button drag for panning
-        self.canvas_widget.bind("<ButtonPress-2>", self._on_middle_press)
-        self.canvas_widget.bind("<B2-Motion>", self._on_middle_drag)
-        self.canvas_widget.bind("<ButtonRelease-2>", self._on_middle_release)
-        # Fallback: some platforms report middle as Button-3
-        self.canvas_widget.bind("<ButtonPress-3>", self._on_middle_press)
-        self.canvas_widget.bind("<B3-Motion>", self._on_middle_drag)
-        self.canvas_widget.bind("<ButtonRelease-3>", self._on_middle_release)
-
-        # Left mouse button for marker/selection
-        self.canvas_widget.bind("<ButtonPress-1>", self.selection_handler.on_left_click)
-        self.canvas_widget.bind("<B1-Motion>", self.selection_handler.on_left_drag)
-        self.canvas_widget.bind(
-            "<ButtonRelease-1>", self.selection_handler.on_left_release
-        )
-
-        # Mouse motion for hover detection (resize cursor)
-        self.canvas_widget.bind("<Motion>", self.selection_handler.on_mouse_motion)
+        bindings = [
+            # Mouse wheel for zoom (Button-4/5 on Linux)
+            ("<MouseWheel>", self._on_mouse_wheel),
+            ("<Button-4>", self._on_mouse_wheel),
+            ("<Button-5>", self._on_mouse_wheel),
+            # Double-click to reset zoom
+            ("<Double-Button-1>", self._reset_zoom),
+            # Left mouse button for marker/selection
+            ("<ButtonPress-1>", self.selection_handler.on_left_click),
+            ("<B1-Motion>", self.selection_handler.on_left_drag),
+            ("<ButtonRelease-1>", self.selection_handler.on_left_release),
+            # Mouse motion for hover detection (resize cursor)
+            ("<Motion>", self.selection_handler.on_mouse_motion),
+        ]
+
+        # Middle mouse button drag for panning. Fallback: some platforms
+        # report middle as Button-3
+        for button in (2, 3):
+            bindings += [
+                (f"<ButtonPress-{button}>", self._on_middle_press),
+                (f"<B{button}-Motion>", self._on_middle_drag),
+                (f"<ButtonRelease-{button}>", self._on_middle_release),
+            ]
+
+        for sequence, handler in bindings:
+            self.canvas_widget.bind(sequence, handler)
 
     def _update_mel_processor(self, sample_rate: int) -> None:
         """Update mel processor if sample rate has changed.
@@ -397,7 +387,7 @@ class MelSpectrogramWidget(SpectrogramDisplayBase):
         """
         self._hide_no_data_message()
         get_adaptive_frame_rate().reset()
-        self._clear_queue(self.audio_queue)
+        self._audio_ring.discard()
 
         # Update mel processor if sample rate has changed
         self._update_mel_processor(sample_rate)
@@ -440,36 +430,28 @@ class MelSpectrogramWidget(SpectrogramDisplayBase):
         self._stop_recording_updates()
 
     def update_audio(self, audio_chunk: np.ndarray) -> None:
-        """Update with new audio data during recording."""
+        """Update with new audio data during recording.
+
+        Safe to call from the audio transfer thread. The samples are copied,
+        so the caller may reuse audio_chunk afterwards.
+
+        Args:
+            audio_chunk: Mono float32 samples
+        """
         # Let recording_handler decide - allows updates when meters toggled
-        try:
-            self.audio_queue.put_nowait(audio_chunk)
-        except queue.Full:
-            # Skip if queue is full
-            pass
+        self._audio_ring.write(audio_chunk)
 
     def _update_display(self) -> None:
-        """Update display from audio queue."""
-        # Process all pending audio chunks for real-time display
-        chunks_processed = 0
+        """Update display from pending live audio."""
         display_needs_update = False
 
-        # Process all available chunks to prevent queue buildup
-        while not self.audio_queue.empty():
-            try:
-                audio_chunk = self.audio_queue.get_nowait()
-                should_update = self.recording_handler.update_audio(audio_chunk)
-
-                if should_update:
-                    display_needs_update = True
-                    # Update time tracking
-                    self.current_time = self.recording_handler.current_time
-                    self.max_detected_freq = self.recording_handler.max_detected_freq
-
-                chunks_processed += 1
-
-            except queue.Empty:
-                break
+        # Process all pending samples at once to prevent buildup
+        count = self._audio_ring.read_into(self._audio_buffer)
+        if count and self.recording_handler.update_audio(self._audio_buffer[:count]):
+            display_needs_update = True
+            # Update time tracking
+            self.current_time = self.recording_handler.current_time
+            self.max_detected_freq = self.recording_handler.max_detected_freq
 
         # Update display once after processing all chunks
         if display_needs_update and self.recording_handler.is_recording:
@@ -673,7 +655,7 @@ class MelSpectrogramWidget(SpectrogramDisplayBase):
             self.playback_handler.stop_playback()
 
         # Clear the audio queue
-        self._clear_queue(self.audio_queue)
+        self._audio_ring.discard()
 
     def clear(self) -> None:
         """Clear the spectrogram display."""
@@ -40,7 +40,6 @@ class WindowBase:
         config: Optional[RecorderConfig] = None,
         recording_state: Optional[RecordingState] = None,
         ui_state: Optional[UIState] = None,
-        manager_dict: dict = None,
         app_callbacks: dict = None,
         settings_manager: Optional[SettingsManager] = None,
         shared_audio_state=None,
@@ -54,7 +53,6 @@ class WindowBase:
             config: Application configuration with display and UI settings
             recording_state: Recording state manager tracking current utterance
             ui_state: UI state manager for window properties
-            manager_dict: Shared state dictionary
             app_callbacks: Application callbacks
             settings_manager: Settings manager for persisting preferences
             shared_audio_state: Shared audio state for synchronization
@@ -75,12 +73,15 @@ class WindowBase:
         self.config = config
         self.recording_state = recording_state
         self.ui_state = ui_state
-        self.manager_dict = manager_dict
         self.app_callbacks = app_callbacks
         self.settings_manager = settings_manager
         self.shared_audio_state = shared_audio_state
         self.meters_visible = False
 
+        # Created once the spectrogram frame has real dimensions, and only
+        # for windows with a spectrogram
+        self.mel_spectrogram: Optional[MelSpectrogramWidget] = None
+
         # Initialize font manager
         self.font_manager = FontManager(self.ui_state, self.config)
 
@@ -90,6 +91,11 @@ class WindowBase:
         # Initialize saved status for restoration after temporary messages
         self._saved_status = ""
 
+        # Pending debounced text layout refresh after a resize
+        self._resize_timer: Optional[str] = None
+        # Set on the first resize, which fires <<FontsReady>>
+        self._fonts_initialized = False
+
     @property
     def window(self):
         """Get the underlying window object (Tk or Toplevel)."""
@@ -324,7 +330,6 @@ class WindowBase:
             self.spec_frame,
             self.config.audio,
             self.config.display,
-            self.manager_dict,
             self.shared_audio_state,
         )
 
@@ -1034,7 +1039,7 @@ class WindowBase:
         config = RECORDING_STANDARDS[standard_enum]
 
         # Apply to embedded level meter if it exists
-        if hasattr(self, "embedded_level_meter") and self.embedded_level_meter:
+        if self.embedded_level_meter:
             # Reset via shared state so producer/consumer are in Sync
             try:
                 self.shared_audio_state.reset_level_meter()
@@ -1123,7 +1128,7 @@ class WindowBase:
         if hasattr(self, "level_meter_frame"):
             self.level_meter_frame.configure(bg=UIConstants.COLOR_BACKGROUND_SECONDARY)
             # Level meter needs refresh for new theme colors
-            if hasattr(self, "embedded_level_meter") and self.embedded_level_meter:
+            if self.embedded_level_meter:
                 self.embedded_level_meter.refresh()
 
         # Update emotion indicator with new theme colors
@@ -1135,7 +1140,7 @@ class WindowBase:
         self.font_manager.clear_font_cache()
 
         # Update spectrogram if visible
-        if hasattr(self, "mel_spectrogram") and self.mel_spectrogram:
+        if self.mel_spectrogram is not None:
             # Update matplotlib figure colors
             self.mel_spectrogram.fig.set_facecolor(UIConstants.COLOR_BACKGROUND)
             self.mel_spectrogram.ax.set_facecolor(UIConstants.COLOR_BACKGROUND)
@@ -1235,8 +1240,6 @@ class WindowBase:
 
         if show_info_panel is not None:
             if show_info_panel and hasattr(self, "info_panel"):
-                from ..constants import UIConstants
-
                 self.info_panel.grid(
                     row=3, column=0, sticky="ew", pady=(UIConstants.FRAME_SPACING, 0)
                 )
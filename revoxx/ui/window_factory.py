@@ -4,6 +4,7 @@ This module implements the factory pattern for window creation,
 using configuration templates.
 """
 
+from functools import partial
 from typing import Dict, Optional, Any
 from pathlib import Path
 import tkinter as tk
@@ -82,7 +83,6 @@ class WindowFactory:
         config: RecorderConfig,
         recording_state: RecordingState,
         ui_state: UIState,
-        manager_dict: dict,
         app_callbacks: dict,
         settings_manager: Optional[SettingsManager],
         shared_audio_state: Any,
@@ -96,7 +96,6 @@ class WindowFactory:
             config: Application configuration
             recording_state: Recording state
             ui_state: UI state
-            manager_dict: Shared state dictionary
             app_callbacks: Application callbacks
             settings_manager: Settings manager
             shared_audio_state: Shared audio state
@@ -114,7 +113,6 @@ class WindowFactory:
             config=config,
             recording_state=recording_state,
             ui_state=ui_state,
-            manager_dict=manager_dict,
             app_callbacks=app_callbacks,
             settings_manager=settings_manager,
             shared_audio_state=shared_audio_state,
@@ -185,9 +183,6 @@ class WindowFactory:
         window._create_spectrogram_area()
         window._create_combined_info_panel()
 
-        # Mark that fonts haven't been initialized yet
-        window._fonts_initialized = False
-
     @classmethod
     def _apply_initial_visibility(cls, window: WindowBase, template: dict) -> None:
         """Apply initial panel visibility from template.
@@ -231,7 +226,7 @@ class WindowFactory:
             )
 
         # Bind resize event
-        window.window.bind("<Configure>", lambda e: cls._on_window_resize(window, e))
+        window.window.bind("<Configure>", partial(cls._on_window_resize, window))
 
     @classmethod
     def _set_window_icon(cls, window: WindowBase) -> None:
@@ -298,13 +293,13 @@ class WindowFactory:
                 window.settings_manager.update_setting(
                     f"{window.window_id}_geometry", geometry
                 )
-            except Exception:
+            except tk.TclError:
                 pass
 
         # Destroy window
         try:
             window.window.destroy()
-        except Exception:
+        except tk.TclError:
             pass
 
     @classmethod
@@ -323,16 +318,15 @@ class WindowFactory:
         window._update_fixed_ui_fonts()
 
         # Debounce text font recalculation
-        if hasattr(window, "_resize_timer"):
+        if window._resize_timer is not None:
             window.window.after_cancel(window._resize_timer)
-        if hasattr(window, "text_var") and window.text_var.get():
+            window._resize_timer = None
+        if window.text_var.get():
             window._invalidate_layout_cache()
-            window._resize_timer = window.window.after(
-                150, lambda: window.refresh_text_layout()
-            )
+            window._resize_timer = window.window.after(150, window.refresh_text_layout)
 
         # Fire FontsReady event on first resize
-        if hasattr(window, "_fonts_initialized") and not window._fonts_initialized:
+        if not window._fonts_initialized:
             window._fonts_initialized = True
             window.window.event_generate("<<FontsReady>>")
 
@@ -343,5 +337,5 @@ class WindowFactory:
                 window.settings_manager.update_setting(
                     f"{window.window_id}_geometry", geometry
                 )
-            except Exception:
+            except tk.TclError:
                 pass
@@ -109,7 +109,6 @@ class WindowManager:
             config=self.app.config,
             recording_state=self.app.state.recording,
             ui_state=self.app.state.ui,
-            manager_dict=self.app.manager_dict,
             app_callbacks=self._get_app_callbacks(),
             settings_manager=self.app.settings_manager,
             shared_audio_state=getattr(self.app, "shared_state", None),
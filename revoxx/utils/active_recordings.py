@@ -26,6 +26,8 @@ class ActiveRecordings:
         # Cache management
         self._takes_cache: Dict[str, List[str]] = {}  # label -> list of filenames
         self._cache_valid = False
+        # label -> sorted take numbers, derived lazily from _takes_cache
+        self._take_numbers: Dict[str, List[int]] = {}
 
         # Data
         self._labels: List[str] = []
@@ -55,6 +57,21 @@ class ActiveRecordings:
             self._cache_valid = False
             self._sort_valid = False
 
+    def set_take_files(self, takes_by_label: Dict[str, List[str]]) -> None:
+        """Fill the takes cache from an already scanned recording directory.
+
+        Args:
+            takes_by_label: Mapping of label to take filenames, as returned by
+                RecordingFileManager.scan_take_files_by_label()
+        """
+        self._takes_cache = {
+            label: takes_by_label.get(label, []) for label in self._labels
+        }
+        self._take_numbers = {}
+        self._cache_valid = True
+        if self.sort_column == "recordings":
+            self._sort_valid = False
+
     def set_sort(self, column: str, reverse: bool = False) -> None:
         """Update sort criteria.
 
@@ -86,6 +103,7 @@ class ActiveRecordings:
         - The recording directory structure changes
         """
         self._cache_valid = False
+        self._take_numbers = {}
         # Also invalidate sort if it depends on recordings
         if self.sort_column == "recordings":
             self._sort_valid = False
@@ -95,8 +113,26 @@ class ActiveRecordings:
         if not self._cache_valid and self._labels:
             # Cache actual filenames
             self._takes_cache = self.file_manager.scan_all_take_files(self._labels)
+            self._take_numbers = {}
             self._cache_valid = True
 
+    def invalidate_label(self, label: str) -> None:
+        """Re-scan the takes of a single label.
+
+        Cheaper than invalidate_cache() after an event that only touches
+        one utterance directory. Does nothing while the whole cache is
+        invalid, since the next access re-scans every label anyway.
+
+        Args:
+            label: Label whose takes changed
+        """
+        if not self._cache_valid:
+            return
+        self._takes_cache[label] = self.file_manager.scan_take_files(label)
+        self._take_numbers.pop(label, None)
+        if self.sort_column == "recordings":
+            self._sort_valid = False
+
     @staticmethod
     def _extract_take_number(filename: str) -> int:
         """Extract take number from a filename.
@@ -243,25 +279,28 @@ class ActiveRecordings:
         return {label: len(filenames) for label, filenames in self._takes_cache.items()}
 
     def _get_take_numbers_from_cache(self, label: str) -> List[int]:
-        """Extract take numbers from cached filenames for a label.
+        """Get the take numbers of a label from the cached filenames.
+
+        The parsed numbers are memoized until the label's takes change, so
+        repeated navigation does not re-parse the filenames.
 
         Args:
             label: The utterance label
 
         Returns:
-            List of take numbers (unsorted)
+            Sorted list of take numbers (shared, must not be modified)
         """
         self._ensure_cache()
-        filenames = self._takes_cache.get(label, [])
-        if not filenames:
-            return []
-
-        take_numbers = []
-        for filename in filenames:
-            take_num = self._extract_take_number(filename)
-            if take_num > 0:
-                take_numbers.append(take_num)
-
+        take_numbers = self._take_numbers.get(label)
+        if take_numbers is None:
+            take_numbers = sorted(
+                take_num
+                for take_num in map(
+                    self._extract_take_number, self._takes_cache.get(label, [])
+                )
+                if take_num > 0
+            )
+            self._take_numbers[label] = take_numbers
         return take_numbers
 
     def get_highest_take(self, label: str) -> int:
@@ -274,7 +313,7 @@ class ActiveRecordings:
             Highest take number for this label (0 if no takes)
         """
         take_numbers = self._get_take_numbers_from_cache(label)
-        return max(take_numbers) if take_numbers else 0
+        return take_numbers[-1] if take_numbers else 0
 
     def get_existing_takes(self, label: str) -> List[int]:
         """Get list of existing take numbers for a specific label (cached).
@@ -285,8 +324,7 @@ class ActiveRecordings:
         Returns:
             Sorted list of existing take numbers
         """
-        take_numbers = self._get_take_numbers_from_cache(label)
-        return sorted(take_numbers)
+        return list(self._get_take_numbers_from_cache(label))
 
     def find_next_best_take(self, label: str, current_take: int) -> int:
         """Find the next best take after deleting the current one.
@@ -407,7 +445,7 @@ class ActiveRecordings:
         Args:
             label: Label of the completed recording
         """
-        self.invalidate_cache()
+        self.invalidate_label(label)
 
     def on_recording_deleted(self, label: str, take: int) -> None:
         """Notify that a recording was deleted.
@@ -416,13 +454,22 @@ class ActiveRecordings:
             label: Label of the deleted recording
             take: Take number that was deleted
         """
-        self.invalidate_cache()
+        self.invalidate_label(label)
+
+    def on_recording_restored(self, label: str) -> None:
+        """Notify that a recording was restored from the trash.
+
+        Args:
+            label: Label of the restored recording
+        """
+        self.invalidate_label(label)
 
     def on_session_changed(self) -> None:
         """Notify that the session has changed."""
         self._labels = []
         self._utterances = []
         self._cache_valid = False
+        self._take_numbers = {}
         self._sort_valid = False
         self._sorted_indices = None
         self._takes_cache = {}
@@ -30,14 +30,18 @@ def normalize_audio(audio_data: np.ndarray, copy: bool = False) -> np.ndarray:
         return audio_data
 
     elif audio_data.dtype == np.int16:
-        # 16-bit PCM
-        return audio_data.astype(np.float32) / AudioConstants.NORM_FACTOR_16BIT
+        # 16-bit PCM, scaled in place to avoid a second float buffer
+        normalized = audio_data.astype(np.float32)
+        normalized /= AudioConstants.NORM_FACTOR_16BIT
+        return normalized
 
     elif audio_data.dtype == np.int32:
         # Most audio interfaces deliver 24-bit audio in 32-bit containers
         # The standard way is to use the full 32-bit range for normalization
         # This matches what soundfile does internally
-        return audio_data.astype(np.float32) / AudioConstants.NORM_FACTOR_32BIT
+        normalized = audio_data.astype(np.float32)
+        normalized /= AudioConstants.NORM_FACTOR_32BIT
+        return normalized
 
     else:
         # Unknown format, try to convert to float32
@@ -4,23 +4,48 @@ This module provides a DeviceManager class that handles all device-related
 operations including enumeration, capability checking, and name-to-index mapping.
 """
 
+import time
 from typing import List, Dict, Optional, Tuple
-import sounddevice as sd
+
+# sounddevice loads PortAudio on import, so it is only imported on first
+# use (see _sounddevice()). Modules that merely import this one, e.g. for
+# session handling, stay usable without an audio backend.
+sd = None
+
+
+def _sounddevice():
+    """Import sounddevice on first use.
+
+    Returns:
+        The sounddevice module
+    """
+    global sd
+    if sd is None:
+        import sounddevice
+
+        sd = sounddevice
+    return sd
 
 
 class DeviceManager:
     """Manages audio device operations and mappings."""
 
+    # Device lists younger than this are reused by refresh_if_stale()
+    REFRESH_MAX_AGE = 5.0
+
     def __init__(self):
         """Initialize the device manager."""
         self._refresh_cache()
 
     def _refresh_cache(self):
         """Refresh the internal device cache."""
-        self._devices = sd.query_devices()
+        self._devices = _sounddevice().query_devices()
         self._all_devices = []
         self._input_devices = []
         self._output_devices = []
+        self._devices_by_name: Dict[str, Dict] = {}
+        self._input_names = set()
+        self._output_names = set()
 
         for i, dev in enumerate(self._devices):
             device_info = {
@@ -36,25 +61,51 @@ class DeviceManager:
                 "hostapi": dev.get("hostapi"),
             }
             self._all_devices.append(device_info)
+            # Keep the first device when several share a name
+            self._devices_by_name.setdefault(device_info["name"], device_info)
 
             if dev.get("max_input_channels", 0) > 0:
                 self._input_devices.append(device_info)
+                self._input_names.add(device_info["name"])
 
             if dev.get("max_output_channels", 0) > 0:
                 self._output_devices.append(device_info)
+                self._output_names.add(device_info["name"])
+
+        self._last_refresh = time.monotonic()
 
     def refresh(self):
         """Force refresh of device list."""
         # Try to refresh PortAudio backend
         try:
-            if hasattr(sd, "_terminate"):
-                sd._terminate()
-            if hasattr(sd, "_initialize"):
-                sd._initialize()
+            if hasattr(_sounddevice(), "_terminate"):
+                _sounddevice()._terminate()
+            if hasattr(_sounddevice(), "_initialize"):
+                _sounddevice()._initialize()
         except (AttributeError, RuntimeError):
             pass
         self._refresh_cache()
 
+    def refresh_if_stale(self, max_age: float = REFRESH_MAX_AGE) -> None:
+        """Refresh the device list only if it is older than max_age.
+
+        Re-initializing PortAudio can take tens of milliseconds, so callers
+        on the record/monitor start path use this instead of refresh().
+
+        Args:
+            max_age: Maximum age of the cached device list in seconds
+        """
+        if time.monotonic() - self._last_refresh > max_age:
+            self.refresh()
+
+    def invalidate(self) -> None:
+        """Mark the device list as stale.
+
+        The next refresh_if_stale() call re-queries the system regardless
+        of the list's age.
+        """
+        self._last_refresh = float("-inf")
+
     def get_all_devices(self) -> List[Dict]:
         """Get list of all devices.
 
@@ -79,6 +130,28 @@ class DeviceManager:
         """
         return self._output_devices.copy()
 
+    def has_input_device(self, name: str) -> bool:
+        """Check whether an input device with the given name exists.
+
+        Args:
+            name: Device name to look up
+
+        Returns:
+            True if an input device with this name is available
+        """
+        return name in self._input_names
+
+    def has_output_device(self, name: str) -> bool:
+        """Check whether an output device with the given name exists.
+
+        Args:
+            name: Device name to look up
+
+        Returns:
+            True if an output device with this name is available
+        """
+        return name in self._output_names
+
     def get_device_by_name(self, name: str) -> Optional[Dict]:
         """Get device info by name.
 
@@ -88,10 +161,8 @@ class DeviceManager:
         Returns:
             Device info dict or None if not found
         """
-        for dev in self._all_devices:
-            if dev["name"] == name:
-                return dev.copy()
-        return None
+        device = self._devices_by_name.get(name)
+        return device.copy() if device else None
 
     def get_device_index_by_name(self, name: str) -> Optional[int]:
         """Get device index by name.
@@ -114,9 +185,8 @@ class DeviceManager:
         Returns:
             Device name or None if not found
         """
-        for dev in self._all_devices:
-            if dev["index"] == index:
-                return dev["name"]
+        if 0 <= index < len(self._all_devices):
+            return self._all_devices[index]["name"]
         return None
 
     def get_default_input_device(self) -> Optional[int]:
@@ -143,7 +213,7 @@ class DeviceManager:
 
         # Check user-configured defaults
         try:
-            default = sd.default.device
+            default = _sounddevice().default.device
             if isinstance(default, (list, tuple)) and len(default) == 2:
                 if default[0] is not None and int(default[0]) >= 0:
                     in_idx = int(default[0])
@@ -170,13 +240,13 @@ class DeviceManager:
             Device index or None if no default device exists
         """
         try:
-            default_info = sd.query_devices(kind=kind)
+            default_info = _sounddevice().query_devices(kind=kind)
             name = default_info.get("name")
             hostapi = default_info.get("hostapi")
             for dev in self._all_devices:
                 if dev["name"] == name and dev["hostapi"] == hostapi:
                     return dev["index"]
-        except (sd.PortAudioError, ValueError):
+        except (_sounddevice().PortAudioError, ValueError):
             pass
         return None
 
@@ -208,14 +278,14 @@ class DeviceManager:
         supported_rates = []
         for rate in standard_rates:
             try:
-                sd.check_input_settings(
+                _sounddevice().check_input_settings(
                     device=device_index,
                     channels=1,
                     dtype="float32",
                     samplerate=rate,
                 )
                 supported_rates.append(rate)
-            except sd.PortAudioError:
+            except _sounddevice().PortAudioError:
                 pass
         return supported_rates
 
@@ -307,26 +377,26 @@ class DeviceManager:
         try:
             # Test 16-bit
             try:
-                sd.check_input_settings(
+                _sounddevice().check_input_settings(
                     device=device_index,
                     channels=1,
                     dtype="int16",
                     samplerate=sample_rate,
                 )
                 supported_depths.append(16)
-            except sd.PortAudioError:
+            except _sounddevice().PortAudioError:
                 pass
 
             # Test 24-bit (using int32)
             try:
-                sd.check_input_settings(
+                _sounddevice().check_input_settings(
                     device=device_index,
                     channels=1,
                     dtype="int32",
                     samplerate=sample_rate,
                 )
                 supported_depths.append(24)
-            except sd.PortAudioError:
+            except _sounddevice().PortAudioError:
                 pass
 
         except Exception:
@@ -379,7 +449,11 @@ class DeviceManager:
 
         # Test the configuration
         try:
-            check_fn = sd.check_input_settings if is_input else sd.check_output_settings
+            check_fn = (
+                _sounddevice().check_input_settings
+                if is_input
+                else _sounddevice().check_output_settings
+            )
             check_fn(
                 device=device_index,
                 channels=channels,
@@ -387,7 +461,7 @@ class DeviceManager:
                 samplerate=sample_rate,
             )
             return True
-        except (sd.PortAudioError, ValueError):
+        except (_sounddevice().PortAudioError, ValueError):
             return False
 
     def find_compatible_device(
@@ -1,13 +1,31 @@
 """File management utilities for the recorder."""
 
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple, List, Set
+from typing import Any, Dict, Optional, Tuple, List, Set
 import soundfile as sf
 import numpy as np
 
 from ..constants import FileConstants
 
 
+def _remember(cache: OrderedDict, key: Path, entry: Tuple, limit: int) -> None:
+    """Store an entry as most recently used and evict beyond the limit.
+
+    Args:
+        cache: LRU cache to update
+        key: Cache key
+        entry: Value to store
+        limit: Maximum number of entries
+    """
+    cache[key] = entry
+    cache.move_to_end(key)
+    if len(cache) > limit:
+        cache.popitem(last=False)
+
+
 class RecordingFileManager:
     """Manages recording files and directory structure.
 
@@ -24,6 +42,16 @@ class RecordingFileManager:
         Example: recordings/utt_001/take_001.wav, recordings/utt_001/take_002.wav
     """
 
+    # Threads used to list utterance directories; listing is I/O bound and
+    # releases the GIL
+    SCAN_WORKERS = 8
+
+    # Decoded recordings kept by load_audio(), so browsing back and forth
+    # or replaying a take does not decode the same file again
+    AUDIO_CACHE_SIZE = 8
+    # Entries are small, so info for many more takes is kept
+    INFO_CACHE_SIZE = 256
+
     def __init__(self, recording_dir: Path):
         """Initialize the file manager.
 
@@ -32,6 +60,14 @@ class RecordingFileManager:
         """
         self.recording_dir = Path(recording_dir)
         self.recording_dir.mkdir(exist_ok=True, parents=True)
+        # path -> ((mtime_ns, size), audio_data, sample_rate), least recent first
+        self._audio_cache: OrderedDict[
+            Path, Tuple[Tuple[int, int], np.ndarray, int]
+        ] = OrderedDict()
+        # path -> ((mtime_ns, size), recording info), least recent first
+        self._info_cache: OrderedDict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = (
+            OrderedDict()
+        )
 
     @staticmethod
     def _extract_take_number(file_path: Path) -> Optional[int]:
@@ -162,8 +198,8 @@ class RecordingFileManager:
     def scan_all_take_files(self, labels: List[str]) -> dict[str, List[str]]:
         """Scan for all existing take filenames for given labels.
 
-        Efficiently scans the recording directory to find all take
-        filenames for each label in the provided list.
+        Lists the recording directory once via scan_take_files_by_label()
+        instead of globbing per label.
         Note: This excludes files in the trash directory.
 
         Args:
@@ -172,15 +208,66 @@ class RecordingFileManager:
         Returns:
             dict: Mapping of label to list of filenames (excluding trash)
         """
-        takes = {}
-        for label in labels:
-            files = self._get_take_files(label, include_trash=False)
-            # Extract just the filenames, not full paths
-            filenames = [
-                f.name for f in files if self._extract_take_number(f) is not None
-            ]
-            takes[label] = sorted(filenames)
-        return takes
+        takes_by_label = self.scan_take_files_by_label()
+        return {label: takes_by_label.get(label, []) for label in labels}
+
+    def scan_take_files_by_label(self) -> dict[str, List[str]]:
+        """Scan the recording directory for the take filenames of every label.
+
+        Unlike scan_all_take_files(), this does not need the script labels,
+        so it can run while the script is still being parsed. Each utterance
+        directory is listed once, on SCAN_WORKERS threads.
+        Note: This excludes files in the trash directory.
+
+        Returns:
+            dict: Mapping of directory label to list of filenames
+        """
+        with os.scandir(self.recording_dir) as entries:
+            utterance_dirs = [entry.path for entry in entries if entry.is_dir()]
+
+        with ThreadPoolExecutor(max_workers=self.SCAN_WORKERS) as executor:
+            listings = executor.map(self._list_take_filenames, utterance_dirs)
+            return {
+                os.path.basename(path): filenames
+                for path, filenames in zip(utterance_dirs, listings)
+            }
+
+    def scan_take_files(self, label: str) -> List[str]:
+        """Scan the take filenames of a single label.
+
+        Note: This excludes files in the trash directory.
+
+        Args:
+            label: Utterance label
+
+        Returns:
+            Sorted list of take filenames (empty if the label has no directory)
+        """
+        try:
+            return self._list_take_filenames(str(self.recording_dir / label))
+        except FileNotFoundError:
+            return []
+
+    def _list_take_filenames(self, utterance_dir: str) -> List[str]:
+        """List the take filenames in one utterance directory.
+
+        Args:
+            utterance_dir: Path of the utterance directory
+
+        Returns:
+            Sorted list of take filenames
+        """
+        extensions = (
+            FileConstants.AUDIO_FILE_EXTENSION,
+            FileConstants.LEGACY_AUDIO_FILE_EXTENSION,
+        )
+        return sorted(
+            name
+            for name in os.listdir(utterance_dir)
+            if name.startswith("take_")
+            and os.path.splitext(name)[1] in extensions
+            and self._extract_take_number(Path(name)) is not None
+        )
 
     @staticmethod
     def get_file_info(file_path: Path) -> Optional[Tuple[int, int, str, int, float]]:
@@ -216,15 +303,20 @@ class RecordingFileManager:
             print(f"Error reading file info: {e}")
             return None
 
-    @staticmethod
-    def load_audio(filepath: Path) -> Tuple[np.ndarray, int]:
+    def load_audio(
+        self, filepath: Path, stat_result: Optional[os.stat_result] = None
+    ) -> Tuple[np.ndarray, int]:
         """Load audio file and return data with sample rate.
 
         Loads audio data using soundfile, automatically converting
-        stereo to mono if necessary.
+        stereo to mono if necessary. The most recently loaded files are
+        cached and reused while their modification time and size are
+        unchanged.
 
         Args:
             filepath: Path to the audio file
+            stat_result: Result of a stat() the caller already made on
+                filepath, to avoid another system call
 
         Returns:
             Tuple[np.ndarray, int]: Audio data (normalized -1 to 1) and sample rate
@@ -234,25 +326,93 @@ class RecordingFileManager:
 
         Note:
             Audio data is returned normalized between -1 and 1,
-            regardless of the original bit depth.
+            regardless of the original bit depth. The array is shared
+            with the cache and therefore read-only.
         """
-        if not filepath.exists():
-            raise FileNotFoundError(f"Audio file not found: {filepath}")
+        stat = stat_result
+        if stat is None:
+            try:
+                stat = filepath.stat()
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Audio file not found: {filepath}") from None
+
+        file_key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._audio_cache.get(filepath)
+        if cached is not None and cached[0] == file_key:
+            self._audio_cache.move_to_end(filepath)
+            return cached[1], cached[2]
 
         data, sample_rate = sf.read(str(filepath))
+        channels = data.shape[1] if data.ndim > 1 else 1
 
         # Convert to mono if stereo
         if len(data.shape) > 1:
             data = np.mean(data, axis=1)
 
+        data.flags.writeable = False
+        _remember(
+            self._audio_cache,
+            filepath,
+            (file_key, data, sample_rate),
+            self.AUDIO_CACHE_SIZE,
+        )
+        # The decoded file also answers get_recording_info()
+        info = {
+            "duration": len(data) / sample_rate,
+            "actual_sample_rate": sample_rate,
+            "actual_channels": channels,
+            "size": stat.st_size,
+        }
+        _remember(self._info_cache, filepath, (file_key, info), self.INFO_CACHE_SIZE)
+
         return data, sample_rate
 
-    @staticmethod
+    def get_recording_info(
+        self, filepath: Path, stat_result: Optional[os.stat_result] = None
+    ) -> Dict[str, Any]:
+        """Get duration, sample rate, channels and size of a recording.
+
+        Reuses the information gathered by load_audio() or an earlier call
+        while the file's modification time and size are unchanged, so
+        navigating with the info panel open does not re-open the file.
+
+        Args:
+            filepath: Path to the audio file
+            stat_result: Result of a stat() the caller already made on
+                filepath, to avoid another system call
+
+        Returns:
+            Dictionary with duration, actual_sample_rate, actual_channels
+            and size (shared with the cache, must not be modified)
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        stat = stat_result if stat_result is not None else filepath.stat()
+        file_key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._info_cache.get(filepath)
+        if cached is not None and cached[0] == file_key:
+            self._info_cache.move_to_end(filepath)
+            return cached[1]
+
+        info = sf.info(str(filepath))
+        result = {
+            "duration": info.frames / info.samplerate,
+            "actual_sample_rate": info.samplerate,
+            "actual_channels": info.channels,
+            "size": stat.st_size,
+        }
+        _remember(self._info_cache, filepath, (file_key, result), self.INFO_CACHE_SIZE)
+        return result
+
     def save_audio(
-        filepath: Path, data: np.ndarray, sample_rate: int, subtype: str
+        self, filepath: Path, data: np.ndarray, sample_rate: int, subtype: str
     ) -> None:
         """Save audio data to file.
 
+        Cached data of the file is dropped, so a rewrite that keeps size and
+        mtime is not served stale.
+
         Args:
             filepath: Output file path
             data: Audio data array
@@ -265,6 +425,41 @@ class RecordingFileManager:
             # For FLAC, let soundfile determine format from extension
             sf.write(str(filepath), data, sample_rate)
 
+        self._audio_cache.pop(filepath, None)
+        self._info_cache.pop(filepath, None)
+
+    def write_audio_region(self, filepath: Path, start: int, data: np.ndarray) -> bool:
+        """Overwrite samples of an existing mono WAV file in place.
+
+        Only the given frames are written, the rest of the file is left
+        untouched. FLAC files and edits that change the length need
+        save_audio() instead.
+
+        Args:
+            filepath: Path to the audio file
+            start: First frame to overwrite
+            data: Samples to write, converted to the file's subtype
+
+        Returns:
+            True if written, False if the file cannot be edited in place
+        """
+        if filepath.suffix.lower() != FileConstants.LEGACY_AUDIO_FILE_EXTENSION:
+            return False
+
+        try:
+            with sf.SoundFile(str(filepath), "r+") as f:
+                if f.channels != 1 or start < 0 or start + len(data) > f.frames:
+                    return False
+                f.seek(start)
+                f.write(data)
+        except (OSError, RuntimeError):
+            return False
+
+        # Same size, so drop cached data instead of relying on the mtime
+        self._audio_cache.pop(filepath, None)
+        self._info_cache.pop(filepath, None)
+        return True
+
     def move_to_trash(self, label: str, take: int) -> bool:
         """Move a recording to the trash directory.
 
@@ -377,14 +572,26 @@ class ScriptFileManager:
     (label "utterance text")
     """
 
-    @staticmethod
-    def load_script(filepath: Path) -> Tuple[List[str], List[str]]:
+    # Parsed scripts kept by load_script(); a session uses one script
+    SCRIPT_CACHE_SIZE = 4
+
+    def __init__(self):
+        """Initialize the script manager."""
+        # path -> ((mtime_ns, size), labels, utterances), least recent first
+        self._script_cache: OrderedDict[
+            Path, Tuple[Tuple[int, int], List[str], List[str]]
+        ] = OrderedDict()
+
+    def load_script(self, filepath: Path) -> Tuple[List[str], List[str]]:
         """Load and parse script file in Festival data format.
 
         Parses files in the format:
         (label1 "utterance text 1")
         (label2 "utterance text 2")
 
+        The parsed result is cached and reused as long as the file's
+        modification time and size are unchanged.
+
         Args:
             filepath: Path to the script file
 
@@ -398,9 +605,40 @@ class ScriptFileManager:
         if not filepath:
             raise FileNotFoundError("No script file specified")
 
-        if not filepath.exists():
-            raise FileNotFoundError(f"Script file not found: {filepath}")
+        try:
+            stat = filepath.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Script file not found: {filepath}") from None
+
+        file_key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._script_cache.get(filepath)
+        if cached is not None and cached[0] == file_key:
+            self._script_cache.move_to_end(filepath)
+            # Callers modify the lists, so hand out copies
+            return list(cached[1]), list(cached[2])
+
+        labels, utterances = self._parse_script(filepath)
+        _remember(
+            self._script_cache,
+            filepath,
+            (file_key, labels, utterances),
+            self.SCRIPT_CACHE_SIZE,
+        )
+        return list(labels), list(utterances)
+
+    @staticmethod
+    def _parse_script(filepath: Path) -> Tuple[List[str], List[str]]:
+        """Parse a script file in Festival data format.
+
+        Args:
+            filepath: Path to the script file
 
+        Returns:
+            Tuple[List[str], List[str]]: Lists of labels and utterances
+
+        Raises:
+            ValueError: If file format is invalid
+        """
         labels = []
         utterances = []
 
@@ -442,8 +680,9 @@ class ScriptFileManager:
 
         return labels, utterances
 
-    @staticmethod
-    def save_script(filepath: Path, labels: List[str], utterances: List[str]) -> None:
+    def save_script(
+        self, filepath: Path, labels: List[str], utterances: List[str]
+    ) -> None:
         """Save script in Festival data format.
 
         Args:
@@ -461,6 +700,9 @@ class ScriptFileManager:
             for label, text in zip(labels, utterances):
                 f.write(f'({label} "{text}")\n')
 
+        # The rewrite may keep size and mtime, so do not rely on the key
+        self._script_cache.pop(filepath, None)
+
     @staticmethod
     def validate_script(filepath: Path) -> Tuple[bool, List[str]]:
         """Validate a script file without fully loading it.
@@ -477,7 +719,7 @@ class ScriptFileManager:
             return False, ["Script file does not exist"]
 
         try:
-            labels, utterances = ScriptFileManager.load_script(filepath)
+            labels, _ = ScriptFileManager._parse_script(filepath)
             if not labels:
                 errors.append("Script contains no valid utterances")
             return len(errors) == 0, errors
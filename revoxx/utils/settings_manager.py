@@ -125,7 +125,7 @@ class SettingsManager:
         try:
             with open(self.settings_file, "w") as f:
                 json.dump(self.settings.to_dict(), f, indent=2)
-        except Exception as e:
+        except (OSError, TypeError, ValueError) as e:
             print(f"Error saving settings: {e}")
 
     def update_setting(self, key: str, value: Any) -> None:
@@ -135,10 +135,24 @@ class SettingsManager:
             key: Setting name
             value: New value
         """
-        if hasattr(self.settings, key):
-            setattr(self.settings, key, value)
+        self.update_settings({key: value})
+
+    def update_settings(self, values: Dict[str, Any]) -> None:
+        """Update several settings and save them with a single write.
+
+        The settings file is only rewritten if a value actually changed.
+
+        Args:
+            values: Mapping of setting names to new values
+        """
+        changed = False
+        for key, value in values.items():
+            # Silently ignore unknown settings (already filtered in from_dict)
+            if hasattr(self.settings, key) and getattr(self.settings, key) != value:
+                setattr(self.settings, key, value)
+                changed = True
+        if changed:
             self.save_settings()
-        # Silently ignore unknown settings (already filtered in from_dict)
 
     def get_setting(self, key: str, default: Any = None) -> Any:
         """Get a setting value.
@@ -157,6 +171,9 @@ class SettingsManager:
     ) -> None:
         """Save settings for a specific window.
 
+        The settings file is only rewritten if a value actually changed,
+        e.g. the window was moved since its geometry was last saved.
+
         Args:
             window_id: Window identifier (e.g., 'main', 'monitor1')
             window_settings: Dictionary of window settings to save
@@ -164,8 +181,12 @@ class SettingsManager:
         if self.settings.windows is None:
             self.settings.windows = {}
 
-        if window_id not in self.settings.windows:
-            self.settings.windows[window_id] = {}
+        stored = self.settings.windows.setdefault(window_id, {})
+        if all(
+            key in stored and stored[key] == value
+            for key, value in window_settings.items()
+        ):
+            return
 
-        self.settings.windows[window_id].update(window_settings)
+        stored.update(window_settings)
         self.save_settings()
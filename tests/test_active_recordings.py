@@ -122,6 +122,19 @@ class TestActiveRecordings(unittest.TestCase):
         self.assertTrue(self.active_recordings._cache_valid)
         self.file_manager.scan_all_take_files.assert_called_once()
 
+    def test_set_take_files(self):
+        """Test filling the cache from a pre-scanned recording directory."""
+        self.active_recordings.set_data(self.labels, self.utterances)
+
+        self.active_recordings.set_take_files(
+            {"utt_001": ["take_001.flac"], "unknown": ["take_001.flac"]}
+        )
+
+        self.assertEqual(self.active_recordings.get_takes("utt_001"), 1)
+        self.assertEqual(self.active_recordings.get_takes("utt_002"), 0)
+        self.assertNotIn("unknown", self.active_recordings.get_all_takes())
+        self.file_manager.scan_all_take_files.assert_not_called()
+
     def test_get_existing_takes(self):
         """Test getting list of existing take numbers."""
         self.active_recordings.set_data(self.labels, self.utterances)
@@ -384,16 +397,33 @@ class TestActiveRecordings(unittest.TestCase):
         self.active_recordings.get_takes("utt_001")
         self.assertTrue(self.active_recordings._cache_valid)
 
-        # Recording completed should invalidate cache
+        # Recording completed should re-scan only that label
+        self.file_manager.scan_take_files.return_value = [
+            "take_001.flac",
+            "take_002.flac",
+        ]
         self.active_recordings.on_recording_completed("utt_001")
-        self.assertFalse(self.active_recordings._cache_valid)
-
-        # Re-populate cache
-        self.active_recordings.get_takes("utt_001")
+        self.file_manager.scan_take_files.assert_called_once_with("utt_001")
         self.assertTrue(self.active_recordings._cache_valid)
+        self.assertEqual(self.active_recordings.get_existing_takes("utt_001"), [1, 2])
+        self.assertEqual(self.file_manager.scan_all_take_files.call_count, 1)
 
-        # Recording deleted should invalidate cache
+        # Recording deleted should re-scan that label as well
+        self.file_manager.scan_take_files.return_value = ["take_002.flac"]
         self.active_recordings.on_recording_deleted("utt_001", 1)
+        self.assertEqual(self.active_recordings.get_highest_take("utt_001"), 2)
+        self.assertEqual(self.active_recordings.get_takes("utt_001"), 1)
+
+        # So should a restore from the trash
+        self.file_manager.scan_take_files.return_value = [
+            "take_001.flac",
+            "take_002.flac",
+        ]
+        self.active_recordings.on_recording_restored("utt_001")
+        self.assertEqual(self.active_recordings.get_existing_takes("utt_001"), [1, 2])
+
+        # A full invalidation is re-scanned on the next access
+        self.active_recordings.invalidate_cache()
         self.assertFalse(self.active_recordings._cache_valid)
 
         # Session change should clear everything
@@ -1,11 +1,11 @@
 """Tests for the AudioController."""
 
-import queue
 import unittest
 from unittest.mock import Mock, patch
 from pathlib import Path
 
 from revoxx.controllers.audio_controller import AudioController
+from revoxx.audio.shared_state import PLAYBACK_STATUS_IDLE, PLAYBACK_STATUS_PLAYING
 from revoxx.constants import MsgType
 
 
@@ -55,8 +55,6 @@ class TestAudioController(unittest.TestCase):
         self.mock_app.buffer_manager = Mock()
         self.mock_app.buffer_manager.create_buffer = Mock()
 
-        self.mock_app.manager_dict = {}
-
         # Mock process_manager for API methods
         self.mock_app.process_manager = Mock()
         self.mock_app.process_manager.set_save_path = Mock()
@@ -69,15 +67,10 @@ class TestAudioController(unittest.TestCase):
         self.mock_app.queue_manager.stop_playback = Mock()
         self.mock_app.queue_manager.set_input_device = Mock()
         self.mock_app.queue_manager.set_output_device = Mock()
-        self.mock_app.queue_manager.get_audio_data = Mock(side_effect=queue.Empty)
 
         self.mock_app.root = Mock()
         self.mock_app.settings_manager = Mock()
 
-        self.mock_app._default_input_in_effect = False
-        self.mock_app._default_output_in_effect = False
-        self.mock_app._notified_default_input = False
-        self.mock_app._notified_default_output = False
         self.mock_app.last_output_error = False
 
         # Add display_controller mock for new architecture
@@ -122,21 +115,23 @@ class TestAudioController(unittest.TestCase):
             self.controller.toggle_recording()
             mock_stop.assert_called_once()
 
-    def test_start_recording_calls_start_audio_capture(self):
-        """Test that start_recording calls _start_audio_capture with 'recording' mode."""
+    def test_start_recording_calls_start_recording_capture(self):
+        """Test that start_recording calls _start_recording_capture."""
         self.mock_app.state.recording.get_current_take = Mock(return_value=0)
         with patch.object(
             self.controller, "_check_recording_compatibility", return_value=True
         ):
-            with patch.object(self.controller, "_start_audio_capture") as mock_capture:
+            with patch.object(
+                self.controller, "_start_recording_capture"
+            ) as mock_capture:
                 self.controller.start_recording()
-                mock_capture.assert_called_once_with("recording")
+                mock_capture.assert_called_once_with()
 
-    def test_stop_recording_calls_stop_audio_capture(self):
-        """Test that stop_recording calls _stop_audio_capture with 'recording' mode."""
-        with patch.object(self.controller, "_stop_audio_capture") as mock_capture:
+    def test_stop_recording_calls_stop_recording_capture(self):
+        """Test that stop_recording calls _stop_recording_capture."""
+        with patch.object(self.controller, "_stop_recording_capture") as mock_capture:
             self.controller.stop_recording()
-            mock_capture.assert_called_once_with("recording")
+            mock_capture.assert_called_once_with()
 
     def test_play_current_with_no_recordings(self):
         """Test play_current when no recordings are available."""
@@ -202,21 +197,21 @@ class TestAudioController(unittest.TestCase):
             self.controller.toggle_monitoring()
             mock_stop.assert_called_once()
 
-    def test_start_monitoring_mode_calls_start_audio_capture(self):
-        """Test that start_monitoring_mode calls _start_audio_capture with 'monitoring' mode."""
-        with patch.object(self.controller, "_start_audio_capture") as mock_capture:
+    def test_start_monitoring_mode_calls_start_monitoring_capture(self):
+        """Test that start_monitoring_mode calls _start_monitoring_capture."""
+        with patch.object(self.controller, "_start_monitoring_capture") as mock_capture:
             self.controller.start_monitoring_mode()
-            mock_capture.assert_called_once_with("monitoring")
+            mock_capture.assert_called_once_with()
 
-    def test_stop_monitoring_mode_calls_stop_audio_capture(self):
-        """Test that stop_monitoring_mode calls _stop_audio_capture with 'monitoring' mode."""
-        with patch.object(self.controller, "_stop_audio_capture") as mock_capture:
+    def test_stop_monitoring_mode_calls_stop_monitoring_capture(self):
+        """Test that stop_monitoring_mode calls _stop_monitoring_capture."""
+        with patch.object(self.controller, "_stop_monitoring_capture") as mock_capture:
             self.controller.stop_monitoring_mode()
-            mock_capture.assert_called_once_with("monitoring")
+            mock_capture.assert_called_once_with()
 
     @patch("revoxx.controllers.audio_controller.get_device_manager")
-    def test_start_audio_capture_recording_mode(self, mock_get_dm):
-        """Test _start_audio_capture in recording mode."""
+    def test_start_recording_capture(self, mock_get_dm):
+        """Test _start_recording_capture."""
         # Setup
         mock_dm = Mock()
         mock_get_dm.return_value = mock_dm
@@ -226,7 +221,7 @@ class TestAudioController(unittest.TestCase):
             self.controller, "_refresh_device_manager", return_value=None
         ):
             # Execute
-            self.controller._start_audio_capture("recording")
+            self.controller._start_recording_capture()
 
         # Verify
         self.assertTrue(self.mock_app.state.recording.is_recording)
@@ -247,8 +242,8 @@ class TestAudioController(unittest.TestCase):
         self.mock_app.display_controller.update_display.assert_called_once()
 
     @patch("revoxx.controllers.audio_controller.get_device_manager")
-    def test_start_audio_capture_monitoring_mode(self, mock_get_dm):
-        """Test _start_audio_capture in monitoring mode."""
+    def test_start_monitoring_capture(self, mock_get_dm):
+        """Test _start_monitoring_capture."""
         # Setup
         mock_dm = Mock()
         mock_get_dm.return_value = mock_dm
@@ -260,7 +255,7 @@ class TestAudioController(unittest.TestCase):
             self.controller, "_refresh_device_manager", return_value=None
         ):
             # Execute
-            self.controller._start_audio_capture("monitoring")
+            self.controller._start_monitoring_capture()
 
         # Verify
         self.assertTrue(self.controller.is_monitoring)
@@ -275,17 +270,10 @@ class TestAudioController(unittest.TestCase):
             "Monitoring input levels...", MsgType.ACTIVE
         )
 
-    def test_start_audio_capture_invalid_mode(self):
-        """Test _start_audio_capture with invalid mode raises ValueError."""
-        with self.assertRaises(ValueError) as context:
-            self.controller._start_audio_capture("invalid")
-
-        self.assertIn("Invalid mode: invalid", str(context.exception))
-
-    def test_stop_audio_capture_recording_mode(self):
-        """Test _stop_audio_capture in recording mode."""
+    def test_stop_recording_capture(self):
+        """Test _stop_recording_capture."""
         # Execute
-        self.controller._stop_audio_capture("recording")
+        self.controller._stop_recording_capture()
 
         # Verify
         self.assertFalse(self.mock_app.state.recording.is_recording)
@@ -293,8 +281,8 @@ class TestAudioController(unittest.TestCase):
         self.mock_app.display_controller.stop_spectrogram_recording.assert_called_once()
         self.mock_app.display_controller.update_display.assert_called_once()
 
-    def test_stop_audio_capture_monitoring_mode(self):
-        """Test _stop_audio_capture in monitoring mode."""
+    def test_stop_monitoring_capture(self):
+        """Test _stop_monitoring_capture."""
         # Setup
         self.controller.is_monitoring = True
         self.controller.saved_meters_state = False
@@ -302,7 +290,7 @@ class TestAudioController(unittest.TestCase):
         self.mock_app.state.ui.meters_visible = True
 
         # Execute
-        self.controller._stop_audio_capture("monitoring")
+        self.controller._stop_monitoring_capture()
 
         # Verify
         self.assertFalse(self.controller.is_monitoring)
@@ -313,12 +301,36 @@ class TestAudioController(unittest.TestCase):
         )
         self.mock_app.display_controller.show_saved_recording.assert_called_once()
 
-    def test_stop_audio_capture_invalid_mode(self):
-        """Test _stop_audio_capture with invalid mode raises ValueError."""
-        with self.assertRaises(ValueError) as context:
-            self.controller._stop_audio_capture("invalid")
+    def test_stop_all_playback_waits_for_stop(self):
+        """The callback runs as soon as the playback process reports idle."""
+        self.mock_app.window.window.after.side_effect = lambda ms, func, *args: func(
+            *args
+        )
+        self.mock_app.shared_state.get_playback_state.side_effect = [
+            {"status": PLAYBACK_STATUS_PLAYING},
+            {"status": PLAYBACK_STATUS_IDLE},
+        ]
+        callback = Mock()
+
+        self.controller.stop_all_playback_activities(callback)
+
+        self.assertEqual(self.mock_app.shared_state.get_playback_state.call_count, 2)
+        self.mock_app.shared_state.stop_playback.assert_called_once()
+        callback.assert_called_once()
+
+    def test_stop_all_playback_gives_up_waiting(self):
+        """The callback still runs if the playback process never reports idle."""
+        self.mock_app.window.window.after.side_effect = lambda ms, func, *args: func(
+            *args
+        )
+        self.mock_app.shared_state.get_playback_state.return_value = {
+            "status": PLAYBACK_STATUS_PLAYING
+        }
+        callback = Mock()
+
+        self.controller.stop_all_playback_activities(callback)
 
-        self.assertIn("Invalid mode: invalid", str(context.exception))
+        callback.assert_called_once()
 
     def test_stop_synchronized_playback(self):
         """Test stop_synchronized_playback sends stop command and resets meter."""
@@ -401,11 +413,13 @@ class TestAudioController(unittest.TestCase):
         self.assertIn("System Default", message)
 
     def test_start_recording_blocked_by_compatibility(self):
-        """When compatibility check fails, _start_audio_capture is not called."""
+        """When compatibility check fails, _start_recording_capture is not called."""
         with patch.object(
             self.controller, "_check_recording_compatibility", return_value=False
         ):
-            with patch.object(self.controller, "_start_audio_capture") as mock_capture:
+            with patch.object(
+                self.controller, "_start_recording_capture"
+            ) as mock_capture:
                 self.controller.start_recording()
                 mock_capture.assert_not_called()
 
@@ -0,0 +1,70 @@
+"""Tests for the AudioEditor."""
+
+import unittest
+
+import numpy as np
+
+from revoxx.audio.editor import AudioEditor
+
+
+class TestAudioEditor(unittest.TestCase):
+    """Test cases for the AudioEditor range operations."""
+
+    def test_empty_edits_return_input(self):
+        """Test edits that change nothing hand back the input unchanged."""
+        audio = np.linspace(-1.0, 1.0, 1000)
+
+        self.assertIs(AudioEditor.delete_range(audio, 500, 500, 8000), audio)
+        self.assertIs(
+            AudioEditor.insert_at_position(audio, np.array([]), 500, 8000), audio
+        )
+        self.assertIs(
+            AudioEditor.replace_range(audio, np.ones(10), 600, 500, 8000), audio
+        )
+
+
+class TestLoopAudioForDuration(unittest.TestCase):
+    """Test cases for AudioEditor.loop_audio_for_duration."""
+
+    def setUp(self):
+        """Create a short source recording."""
+        self.sample_rate = 8000
+        self.audio = np.sin(np.linspace(0, 50, 1000))
+        self.fade_samples = AudioEditor._calculate_fade_samples(
+            self.sample_rate, len(self.audio)
+        )
+
+    def test_output_has_target_length(self):
+        """Test looped audio has exactly the requested number of samples."""
+        for target in (1001, 1800, 5000, 12345):
+            result = AudioEditor.loop_audio_for_duration(
+                self.audio, target, self.sample_rate
+            )
+            self.assertEqual(len(result), target)
+            self.assertEqual(result.dtype, np.float32)
+
+    def test_repetitions_are_crossfaded(self):
+        """Test every repetition starts with the same loop cross-fade."""
+        period = len(self.audio) - self.fade_samples
+        result = AudioEditor.loop_audio_for_duration(
+            self.audio, 5 * period, self.sample_rate
+        )
+
+        np.testing.assert_array_equal(
+            result[:period], self.audio[:period].astype(np.float32)
+        )
+        np.testing.assert_array_equal(
+            result[period : 2 * period], result[3 * period : 4 * period]
+        )
+        crossfade = AudioEditor._equal_power_crossfade(
+            self.audio[-self.fade_samples :],
+            self.audio[: self.fade_samples],
+            self.fade_samples,
+        )
+        np.testing.assert_allclose(
+            result[period : period + self.fade_samples], crossfade, rtol=1e-6
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -15,18 +15,16 @@ class TestAudioQueueManager(unittest.TestCase):
         # Create mock queues
         self.mock_record_queue = Mock()
         self.mock_playback_queue = Mock()
-        self.mock_audio_queue = Mock()
 
         # Create queue manager
         self.queue_manager = AudioQueueManager(
-            self.mock_record_queue, self.mock_playback_queue, self.mock_audio_queue
+            self.mock_record_queue, self.mock_playback_queue
         )
 
     def test_initialization(self):
         """Test queue manager initialization."""
         self.assertEqual(self.queue_manager._record_queue, self.mock_record_queue)
         self.assertEqual(self.queue_manager._playback_queue, self.mock_playback_queue)
-        self.assertEqual(self.queue_manager._audio_queue, self.mock_audio_queue)
 
     # ========== Playback Control Tests ==========
 
@@ -56,6 +54,16 @@ class TestAudioQueueManager(unittest.TestCase):
             {"action": "stop"}, block=False
         )
 
+    def test_repeated_stop_playback_is_coalesced(self):
+        """Test a stop is only queued again after a play command."""
+        self.queue_manager.stop_playback()
+        self.queue_manager.stop_playback()
+        self.assertEqual(self.mock_playback_queue.put.call_count, 1)
+
+        self.queue_manager.start_playback({"name": "test"}, 48000)
+        self.queue_manager.stop_playback()
+        self.assertEqual(self.mock_playback_queue.put.call_count, 3)
+
     def test_set_output_device_success(self):
         """Test setting output device successfully."""
         self.mock_playback_queue.put = Mock()
@@ -168,31 +176,6 @@ class TestAudioQueueManager(unittest.TestCase):
             {"action": "quit"}, block=False
         )
 
-    # ========== Audio Visualization Queue Tests ==========
-
-    def test_get_audio_data_success(self):
-        """Test getting audio data from queue."""
-        test_data = {"type": "audio", "data": [0.1, 0.2, 0.3]}
-        self.mock_audio_queue.get = Mock(return_value=test_data)
-
-        result = self.queue_manager.get_audio_data(timeout=0.5)
-
-        self.assertEqual(result, test_data)
-        self.mock_audio_queue.get.assert_called_once_with(timeout=0.5)
-
-    def test_get_audio_data_empty(self):
-        """Test getting audio data when queue is empty."""
-        self.mock_audio_queue.get = Mock(side_effect=queue.Empty)
-
-        with self.assertRaises(queue.Empty):
-            self.queue_manager.get_audio_data(timeout=0.1)
-
-    def test_audio_queue_property(self):
-        """Test audio_queue property returns the queue."""
-        result = self.queue_manager.audio_queue
-
-        self.assertEqual(result, self.mock_audio_queue)
-
 
 if __name__ == "__main__":
     unittest.main()
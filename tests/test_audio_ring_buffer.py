@@ -0,0 +1,121 @@
+"""Tests for the shared memory audio ring buffer."""
+
+import unittest
+
+import numpy as np
+
+from revoxx.audio.audio_ring_buffer import AudioRingBuffer
+
+
+class TestAudioRingBuffer(unittest.TestCase):
+    """Test cases for AudioRingBuffer."""
+
+    def setUp(self):
+        """Create a small ring and attach a second instance as consumer."""
+        self.producer = AudioRingBuffer(create=True, capacity=8)
+        self.consumer = AudioRingBuffer(create=False)
+        self.consumer.attach_to_existing(self.producer.name)
+
+    def tearDown(self):
+        """Release shared memory."""
+        self.consumer.close()
+        self.producer.close()
+        self.producer.unlink()
+
+    def _read_all(self) -> np.ndarray:
+        """Copy all pending samples out of the consumer."""
+        return np.concatenate(self.consumer.read_views() or (np.empty(0),))
+
+    def test_read_empty(self):
+        """Test reading with no pending data returns no views."""
+        self.assertEqual(self.consumer.read_views(), ())
+        self.assertEqual(self.consumer.read_into(np.zeros(4, dtype=np.float32)), 0)
+
+    def test_attach_reads_capacity(self):
+        """Test capacity is taken from the shared header."""
+        self.assertEqual(self.consumer.capacity, 8)
+
+    def test_write_then_read(self):
+        """Test samples written by the producer reach the consumer."""
+        self.producer.write(np.array([0.1, 0.2, 0.3], dtype=np.float32))
+
+        result = self._read_all()
+
+        np.testing.assert_allclose(result, [0.1, 0.2, 0.3], rtol=1e-6)
+        self.assertEqual(self.consumer.read_views(), ())
+
+    def test_wraparound(self):
+        """Test reads into a caller buffer spanning the end of the ring."""
+        self.producer.write(np.arange(6, dtype=np.float32))
+        self.consumer.discard()
+        self.producer.write(np.arange(6, 11, dtype=np.float32))
+        out = np.zeros(8, dtype=np.float32)
+
+        self.assertEqual(self.consumer.read_into(out), 5)
+        np.testing.assert_array_equal(out[:5], np.arange(6, 11, dtype=np.float32))
+
+    def test_overrun_keeps_latest_samples(self):
+        """Test a lagging consumer only gets the most recent capacity samples."""
+        self.producer.write(np.arange(5, dtype=np.float32))
+        self.producer.write(np.arange(5, 12, dtype=np.float32))
+
+        result = self._read_all()
+
+        np.testing.assert_array_equal(result, np.arange(4, 12, dtype=np.float32))
+
+    def test_write_larger_than_capacity(self):
+        """Test a single oversized write keeps its tail."""
+        self.producer.write(np.arange(20, dtype=np.float32))
+
+        result = self._read_all()
+
+        np.testing.assert_array_equal(result, np.arange(12, 20, dtype=np.float32))
+
+    def test_discard(self):
+        """Test discard skips pending samples."""
+        self.producer.write(np.ones(4, dtype=np.float32))
+
+        self.consumer.discard()
+
+        self.assertEqual(self.consumer.read_views(), ())
+
+    def test_read_into(self):
+        """Test reading into a caller buffer, including partial reads."""
+        self.producer.write(np.arange(6, dtype=np.float32))
+        out = np.zeros(4, dtype=np.float32)
+
+        self.assertEqual(self.consumer.read_into(out), 4)
+        np.testing.assert_array_equal(out, np.arange(4, dtype=np.float32))
+
+        self.assertEqual(self.consumer.read_into(out), 2)
+        np.testing.assert_array_equal(out[:2], [4, 5])
+        self.assertEqual(self.consumer.read_into(out), 0)
+
+    def test_read_views_wraparound(self):
+        """Test zero-copy reads return both segments of a wrapped range."""
+        self.producer.write(np.arange(6, dtype=np.float32))
+        self.consumer.read_views()
+        self.producer.write(np.arange(6, 11, dtype=np.float32))
+
+        views = self.consumer.read_views()
+
+        self.assertEqual(len(views), 2)
+        np.testing.assert_array_equal(
+            np.concatenate(views), np.arange(6, 11, dtype=np.float32)
+        )
+        self.assertEqual(self.consumer.read_views(), ())
+
+    def test_local_ring(self):
+        """Test a process-local ring passes samples without shared memory."""
+        ring = AudioRingBuffer(capacity=8, shared=False)
+        ring.write(np.arange(10, dtype=np.float32))
+        out = np.zeros(8, dtype=np.float32)
+
+        self.assertIsNone(ring.name)
+        self.assertEqual(ring.read_into(out), 8)
+        np.testing.assert_array_equal(out, np.arange(2, 10, dtype=np.float32))
+        ring.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
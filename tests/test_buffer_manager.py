@@ -0,0 +1,45 @@
+"""Tests for the shared memory BufferManager."""
+
+import unittest
+
+import numpy as np
+
+from revoxx.audio.buffer_manager import BufferManager
+
+
+class TestBufferManager(unittest.TestCase):
+    """Test cases for BufferManager."""
+
+    def setUp(self):
+        """Create a buffer manager."""
+        self.manager = BufferManager(max_buffers=2)
+
+    def tearDown(self):
+        """Release all shared memory."""
+        self.manager.cleanup_all(wait_time=0)
+
+    def test_read_only_source_reuses_buffer(self):
+        """Test a read-only array already in the ring is not copied again."""
+        audio = np.linspace(-1.0, 1.0, 100)
+        audio.flags.writeable = False
+
+        first = self.manager.create_buffer(audio)
+        second = self.manager.create_buffer(audio)
+
+        self.assertIs(first, second)
+        self.assertEqual(len(self.manager.buffers), 1)
+        np.testing.assert_array_equal(second.get_array(), audio)
+
+    def test_writeable_source_is_copied(self):
+        """Test writeable arrays always get a new buffer."""
+        audio = np.zeros(100)
+
+        first = self.manager.create_buffer(audio)
+        second = self.manager.create_buffer(audio)
+
+        self.assertIsNot(first, second)
+        self.assertEqual(len(self.manager.buffers), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -398,6 +398,15 @@ class TestDeviceController(unittest.TestCase):
         self.controller.mark_output_notified()
         self.assertTrue(self.controller.has_notified_default_output)
 
+    def test_claim_default_device_notice(self):
+        """Test the default device notice is claimed only once."""
+        self.assertFalse(self.controller.claim_default_device_notice("output"))
+
+        self.controller._default_output_in_effect = True
+        self.assertTrue(self.controller.claim_default_device_notice("output"))
+        self.assertFalse(self.controller.claim_default_device_notice("output"))
+        self.assertFalse(self.controller.claim_default_device_notice("input"))
+
     @patch("revoxx.controllers.device_controller.get_device_manager")
     def test_set_input_device_updates_session(self, mock_get_dm):
         """Test that setting input device updates session configuration."""
@@ -214,5 +214,56 @@ class TestGetDefaultDeviceIndices(unittest.TestCase):
         self.assertEqual(result, (None, None))
 
 
+@patch("revoxx.utils.device_manager.sd")
+class TestDeviceLookup(unittest.TestCase):
+    """Tests for DeviceManager name lookups and refresh gating."""
+
+    def _create_manager(self, mock_sd):
+        mock_sd.PortAudioError = PortAudioError
+        mock_sd.query_devices.side_effect = _make_query_devices(SAMPLE_DEVICES)
+        return DeviceManager()
+
+    def test_lookup_by_name_and_index(self, mock_sd):
+        """Name and index lookups agree with the device list."""
+        dm = self._create_manager(mock_sd)
+
+        self.assertEqual(dm.get_device_index_by_name("Scarlett 2i2"), 3)
+        self.assertIsNone(dm.get_device_index_by_name("Missing"))
+        self.assertEqual(dm.get_device_name_by_index(4), "HDMI Output")
+        self.assertIsNone(dm.get_device_name_by_index(len(SAMPLE_DEVICES)))
+
+    def test_has_device_by_direction(self, mock_sd):
+        """Input and output availability checks respect the device direction."""
+        dm = self._create_manager(mock_sd)
+
+        self.assertTrue(dm.has_input_device("USB Mic"))
+        self.assertFalse(dm.has_input_device("DAC Output"))
+        self.assertTrue(dm.has_output_device("DAC Output"))
+        self.assertFalse(dm.has_output_device("USB Mic"))
+
+    def test_refresh_if_stale(self, mock_sd):
+        """A recent device list is reused, an old one is re-queried."""
+        dm = self._create_manager(mock_sd)
+        calls = mock_sd.query_devices.call_count
+
+        dm.refresh_if_stale()
+        self.assertEqual(mock_sd.query_devices.call_count, calls)
+
+        dm.refresh_if_stale(max_age=-1.0)
+        self.assertEqual(mock_sd.query_devices.call_count, calls + 1)
+
+    def test_invalidate_forces_refresh(self, mock_sd):
+        """An invalidated device list is re-queried on the next check."""
+        dm = self._create_manager(mock_sd)
+        calls = mock_sd.query_devices.call_count
+
+        dm.invalidate()
+        dm.refresh_if_stale()
+        self.assertEqual(mock_sd.query_devices.call_count, calls + 1)
+
+        dm.refresh_if_stale()
+        self.assertEqual(mock_sd.query_devices.call_count, calls + 1)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,7 @@
 """Tests for the DisplayController."""
 
 import unittest
-from unittest.mock import Mock, MagicMock, patch
+from unittest.mock import Mock
 
 from revoxx.controllers.display_controller import DisplayController
 
@@ -41,6 +41,10 @@ class TestDisplayController(unittest.TestCase):
         self.mock_app.window.info_overlay.visible = False
         self.mock_app.window.recording_timer = Mock()
         self.mock_app.window.embedded_level_meter = Mock()
+        # Run idle callbacks right away
+        self.mock_app.window.window.after_idle = Mock(
+            side_effect=lambda callback: callback()
+        )
 
         # Mock navigation controller
         self.mock_app.navigation_controller = Mock()
@@ -60,6 +64,14 @@ class TestDisplayController(unittest.TestCase):
         self.mock_app.file_manager.load_audio = Mock(
             return_value=([0.1, 0.2, 0.3], 48000)
         )
+        self.mock_app.file_manager.get_recording_info = Mock(
+            return_value={
+                "duration": 1.0,
+                "actual_sample_rate": 48000,
+                "actual_channels": 1,
+                "size": 1024,
+            }
+        )
 
         # Mock settings manager
         self.mock_app.settings_manager = Mock()
@@ -101,6 +113,20 @@ class TestDisplayController(unittest.TestCase):
             1,  # display_position
         )
 
+    def test_update_display_skips_unchanged_state(self):
+        """Test an unchanged display is not redrawn until invalidated."""
+        self.controller.update_display()
+        self.controller.update_display()
+        self.assertEqual(self.mock_app.window.update_display.call_count, 1)
+
+        self.mock_app.state.recording.is_recording = True
+        self.controller.update_display()
+        self.assertEqual(self.mock_app.window.update_display.call_count, 2)
+
+        self.controller.invalidate_display()
+        self.controller.update_display()
+        self.assertEqual(self.mock_app.window.update_display.call_count, 3)
+
     def test_update_display_no_utterances(self):
         """Test updating display with no utterances."""
         self.mock_app.state.recording.utterances = []
@@ -146,18 +172,8 @@ class TestDisplayController(unittest.TestCase):
             1,  # display_position
         )
 
-    @patch("soundfile.SoundFile")
-    def test_show_saved_recording_exists(self, mock_soundfile):
+    def test_show_saved_recording_exists(self):
         """Test showing a saved recording that exists."""
-        # Setup soundfile mock for info panel update
-        mock_file = MagicMock()
-        mock_file.__enter__.return_value = mock_file
-        mock_file.__exit__.return_value = None
-        mock_file.samplerate = 48000
-        mock_file.channels = 1
-        mock_file.__len__.return_value = 48000
-        mock_soundfile.return_value = mock_file
-
         self.controller.show_saved_recording()
 
         # get_recording_path is called twice: once for loading, once for info panel
@@ -188,7 +204,7 @@ class TestDisplayController(unittest.TestCase):
     def test_show_saved_recording_file_not_exists(self):
         """Test showing saved recording when file doesn't exist."""
         mock_path = Mock()
-        mock_path.exists = Mock(return_value=False)
+        mock_path.stat = Mock(side_effect=FileNotFoundError)
         self.mock_app.file_manager.get_recording_path.return_value = mock_path
 
         self.controller.show_saved_recording()
@@ -248,18 +264,8 @@ class TestDisplayController(unittest.TestCase):
         # Method no longer exists - info panel toggling moved to window
         pass
 
-    @patch("soundfile.SoundFile")
-    def test_update_info_panel_with_recording(self, mock_soundfile):
+    def test_update_info_panel_with_recording(self):
         """Test updating info panel with a recording."""
-        # Setup soundfile mock
-        mock_file = MagicMock()
-        mock_file.__enter__.return_value = mock_file
-        mock_file.__exit__.return_value = None
-        mock_file.samplerate = 48000
-        mock_file.channels = 1
-        mock_file.__len__.return_value = 48000  # 1 second of audio
-        mock_soundfile.return_value = mock_file
-
         self.controller.update_info_panel()
 
         # Verify file info was retrieved
@@ -277,6 +283,23 @@ class TestDisplayController(unittest.TestCase):
         self.assertIn("duration", params)
         self.assertIn("size", params)
 
+    def test_schedule_info_panel_update_coalesces(self):
+        """Test repeated requests before Tk is idle update the panel once."""
+        self.mock_app.window.window.after_idle = Mock()
+
+        self.controller.schedule_info_panel_update()
+        self.controller.schedule_info_panel_update()
+
+        self.mock_app.window.window.after_idle.assert_called_once()
+        self.mock_app.window.update_info_panel.assert_not_called()
+
+        callback = self.mock_app.window.window.after_idle.call_args[0][0]
+        callback()
+        self.mock_app.window.update_info_panel.assert_called_once()
+
+        self.controller.schedule_info_panel_update()
+        self.assertEqual(self.mock_app.window.window.after_idle.call_count, 2)
+
     def test_update_info_panel_no_label(self):
         """Test updating info panel with no current label."""
         self.mock_app.state.recording.current_label = None
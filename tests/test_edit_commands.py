@@ -0,0 +1,92 @@
+"""Tests for the audio edit commands."""
+
+import unittest
+from pathlib import Path
+from unittest.mock import Mock
+
+import numpy as np
+
+from revoxx.audio.edit_commands import AudioDiffCommand
+from revoxx.audio.editor import AudioEditor
+
+
+class TestAudioDiffCommand(unittest.TestCase):
+    """Test cases for AudioDiffCommand."""
+
+    def setUp(self):
+        """Create a recording and a file manager holding it in memory."""
+        self.sample_rate = 8000
+        self.audio_before = np.sin(np.linspace(0, 200, self.sample_rate))
+        self.file_manager = Mock()
+        self.file_manager.load_audio.side_effect = lambda _: (
+            self.stored,
+            self.sample_rate,
+        )
+        self.file_manager.save_audio.side_effect = self._save
+        self.file_manager.write_audio_region.return_value = False
+
+    def _save(self, filepath, data, sample_rate, subtype):
+        """Keep saved audio in place of the file."""
+        self.stored = data
+
+    def _create_command(self, audio_after):
+        """Create a command for an edit of the test recording."""
+        return AudioDiffCommand.from_snapshots(
+            filepath=Path("take_001.wav"),
+            sample_rate=self.sample_rate,
+            audio_before=self.audio_before,
+            audio_after=audio_after,
+        )
+
+    def test_stores_only_changed_region(self):
+        """Test the command keeps the edited samples, not the recording."""
+        audio_after = AudioEditor.delete_range(
+            self.audio_before, 2000, 2400, self.sample_rate
+        )
+        cmd = self._create_command(audio_after)
+
+        self.assertLess(len(cmd.old_segment), len(self.audio_before) // 4)
+        self.assertEqual(
+            len(cmd.old_segment) - len(cmd.new_segment),
+            len(self.audio_before) - len(audio_after),
+        )
+
+    def test_undo_and_redo_restore_exact_audio(self):
+        """Test splicing the segments reproduces both versions."""
+        audio_after = AudioEditor.delete_range(
+            self.audio_before, 2000, 2400, self.sample_rate
+        )
+        cmd = self._create_command(audio_after)
+        self.stored = audio_after
+
+        self.assertTrue(cmd.inverse().execute(self.file_manager))
+        np.testing.assert_array_equal(self.stored, self.audio_before)
+
+        self.assertTrue(cmd.execute(self.file_manager))
+        np.testing.assert_array_equal(self.stored, audio_after)
+
+    def test_execute_fails_on_shorter_file(self):
+        """Test a file that no longer contains the region is left untouched."""
+        cmd = self._create_command(np.zeros_like(self.audio_before))
+        self.stored = self.audio_before[:100]
+
+        self.assertFalse(cmd.execute(self.file_manager))
+        self.file_manager.save_audio.assert_not_called()
+
+    def test_same_length_edit_is_written_in_place(self):
+        """Test a replacement of equal length only writes the changed frames."""
+        audio_after = self.audio_before.copy()
+        audio_after[3000:3100] = 0.0
+        cmd = self._create_command(audio_after)
+        self.file_manager.write_audio_region.return_value = True
+
+        self.assertTrue(cmd.inverse().execute(self.file_manager))
+
+        filepath, start, data = self.file_manager.write_audio_region.call_args[0]
+        self.assertEqual(start, 3000)
+        np.testing.assert_array_equal(data, self.audio_before[3000:3100])
+        self.file_manager.save_audio.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,6 @@
 """Tests for file management utilities."""
 
+import os
 import unittest
 import tempfile
 import shutil
@@ -83,6 +84,22 @@ class TestRecordingFileManager(unittest.TestCase):
         self.assertIn("take_002.flac", take_files["utt_001"])
         self.assertIn("take_001.wav", take_files["utt_002"])
 
+    def test_scan_take_files_by_label(self):
+        """Test scanning take files without a list of labels."""
+        utterance_dir = self.recording_dir / "utt_001"
+        utterance_dir.mkdir(parents=True)
+        (utterance_dir / "take_002.flac").touch()
+        (utterance_dir / "take_001.wav").touch()
+        (utterance_dir / "notes.txt").touch()
+        (self.recording_dir / "utt_002").mkdir()
+
+        take_files = self.manager.scan_take_files_by_label()
+
+        self.assertEqual(
+            take_files,
+            {"utt_001": ["take_001.wav", "take_002.flac"], "utt_002": []},
+        )
+
     def test_directory_structure(self):
         """Test that correct directory structure is created."""
         # Get path for recording - should create directory
@@ -122,6 +139,76 @@ class TestRecordingFileManager(unittest.TestCase):
         # Lower precision due to potential quantization
         np.testing.assert_array_almost_equal(loaded_data, audio_data, decimal=3)
 
+    def test_load_audio_cached(self):
+        """Test unchanged audio files are served from the cache."""
+        sample_rate = 16000
+        test_file = self.recording_dir / "cached.wav"
+        self.manager.save_audio(
+            test_file, np.zeros(1600, dtype=np.float32), sample_rate, "PCM_16"
+        )
+
+        first, _ = self.manager.load_audio(test_file)
+        second, _ = self.manager.load_audio(test_file)
+        self.assertIs(first, second)
+        self.assertFalse(first.flags.writeable)
+
+        # A rewritten file is decoded again
+        self.manager.save_audio(
+            test_file, np.zeros(3200, dtype=np.float32), sample_rate, "PCM_16"
+        )
+        reloaded, _ = self.manager.load_audio(test_file)
+        self.assertEqual(len(reloaded), 3200)
+
+    def test_save_audio_drops_cached_entry(self):
+        """Test saved audio is decoded again even if size and mtime match."""
+        sample_rate = 16000
+        test_file = self.recording_dir / "saved.wav"
+        self.manager.save_audio(test_file, np.zeros(1600), sample_rate, "PCM_16")
+        self.manager.load_audio(test_file)
+        self.manager.get_recording_info(test_file)
+        stat = test_file.stat()
+
+        self.manager.save_audio(test_file, np.full(1600, 0.5), sample_rate, "PCM_16")
+        os.utime(test_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        audio, _ = self.manager.load_audio(test_file)
+        np.testing.assert_allclose(audio, 0.5, atol=1e-4)
+
+    def test_get_recording_info(self):
+        """Test recording info is read from the file and cached."""
+        sample_rate = 16000
+        test_file = self.recording_dir / "info.wav"
+        self.manager.save_audio(
+            test_file, np.zeros(8000, dtype=np.float32), sample_rate, "PCM_16"
+        )
+
+        info = self.manager.get_recording_info(test_file)
+        self.assertAlmostEqual(info["duration"], 0.5)
+        self.assertEqual(info["actual_sample_rate"], sample_rate)
+        self.assertEqual(info["actual_channels"], 1)
+        self.assertEqual(info["size"], test_file.stat().st_size)
+        self.assertIs(self.manager.get_recording_info(test_file), info)
+
+    def test_write_audio_region(self):
+        """Test a WAV region is overwritten in place and FLAC is refused."""
+        sample_rate = 16000
+        test_file = self.recording_dir / "region.wav"
+        self.manager.save_audio(test_file, np.zeros(1000), sample_rate, "PCM_16")
+        self.manager.load_audio(test_file)
+
+        self.assertTrue(
+            self.manager.write_audio_region(test_file, 100, np.full(50, 0.5))
+        )
+        audio, _ = self.manager.load_audio(test_file)
+        self.assertEqual(len(audio), 1000)
+        np.testing.assert_allclose(audio[100:150], 0.5, atol=1e-4)
+        self.assertFalse(np.any(audio[:100]) or np.any(audio[150:]))
+
+        self.assertFalse(self.manager.write_audio_region(test_file, 990, np.zeros(50)))
+        flac_file = self.recording_dir / "region.flac"
+        self.manager.save_audio(flac_file, np.zeros(1000), sample_rate, None)
+        self.assertFalse(self.manager.write_audio_region(flac_file, 0, np.zeros(50)))
+
 
 class TestScriptFileManager(unittest.TestCase):
     """Test ScriptFileManager functionality."""
@@ -130,6 +217,7 @@ class TestScriptFileManager(unittest.TestCase):
         """Set up test environment."""
         self.temp_dir = tempfile.mkdtemp()
         self.test_dir = Path(self.temp_dir)
+        self.manager = ScriptFileManager()
 
     def tearDown(self):
         """Clean up test environment."""
@@ -147,7 +235,7 @@ class TestScriptFileManager(unittest.TestCase):
         script_file.write_text(script_content)
 
         # Load script
-        labels, utterances = ScriptFileManager.load_script(script_file)
+        labels, utterances = self.manager.load_script(script_file)
 
         self.assertEqual(len(labels), 3)
         self.assertEqual(labels[0], "utt_001")
@@ -161,7 +249,7 @@ class TestScriptFileManager(unittest.TestCase):
         utterances = ["First utterance", "Second utterance"]
 
         script_file = self.test_dir / "output.txt"
-        ScriptFileManager.save_script(script_file, labels, utterances)
+        self.manager.save_script(script_file, labels, utterances)
 
         # Read back and verify
         content = script_file.read_text()
@@ -206,13 +294,44 @@ Invalid line without parentheses
         script_file.write_text(script_content)
 
         # Should skip invalid lines but still parse lines with warnings
-        labels, utterances = ScriptFileManager.load_script(script_file)
+        labels, utterances = self.manager.load_script(script_file)
 
         self.assertEqual(len(labels), 3)  # Valid lines + line with warning
         self.assertEqual(labels[0], "utt_001")
         self.assertEqual(labels[1], "utt_002")  # Parsed despite warning
         self.assertEqual(labels[2], "utt_003")
 
+    def test_load_script_cached(self):
+        """Test unchanged scripts are served from the cache as copies."""
+        script_file = self.test_dir / "cached.txt"
+        script_file.write_text('(utt_001 "First")\n')
+
+        labels, utterances = self.manager.load_script(script_file)
+        labels.insert(0, "silence")
+
+        labels, utterances = self.manager.load_script(script_file)
+        self.assertEqual(labels, ["utt_001"])
+        self.assertEqual(utterances, ["First"])
+
+        # A changed file is parsed again
+        script_file.write_text('(utt_001 "First")\n(utt_002 "Second")\n')
+        labels, _ = self.manager.load_script(script_file)
+        self.assertEqual(labels, ["utt_001", "utt_002"])
+
+    def test_save_script_drops_cached_entry(self):
+        """Test a saved script is parsed again even if size and mtime match."""
+        script_file = self.test_dir / "saved.txt"
+        self.manager.save_script(script_file, ["utt_001"], ["First"])
+        self.manager.load_script(script_file)
+        stat = script_file.stat()
+
+        self.manager.save_script(script_file, ["utt_002"], ["Other"])
+        os.utime(script_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        labels, utterances = self.manager.load_script(script_file)
+        self.assertEqual(labels, ["utt_002"])
+        self.assertEqual(utterances, ["Other"])
+
 
 if __name__ == "__main__":
     unittest.main()
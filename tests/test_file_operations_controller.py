@@ -121,7 +121,7 @@ class TestFileOperationsController(unittest.TestCase):
     def test_delete_current_recording_last_take(self, mock_askyesno):
         """Test deleting the last take."""
         mock_askyesno.return_value = True
-        self.mock_app.active_recordings.get_existing_takes.return_value = []
+        self.mock_app.active_recordings.get_highest_take.return_value = 0
 
         self.controller.delete_current_recording()
 
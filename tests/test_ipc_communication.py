@@ -6,7 +6,6 @@ works correctly without mocking.
 
 import unittest
 import multiprocessing as mp
-import numpy as np
 
 from revoxx.audio.queue_manager import AudioQueueManager
 
@@ -15,7 +14,7 @@ def child_process_func(record_queue, playback_queue, result_queue):
     """Helper function for cross-process communication test."""
     # Create manager in child process mode
     child_manager = AudioQueueManager(
-        record_queue=record_queue, playback_queue=playback_queue, audio_queue=None
+        record_queue=record_queue, playback_queue=playback_queue
     )
 
     # Receive command
@@ -37,31 +36,26 @@ class TestIPCCommunication(unittest.TestCase):
         # Verify queues are created
         self.assertIsNotNone(manager.record_queue)
         self.assertIsNotNone(manager.playback_queue)
-        self.assertIsNotNone(manager.audio_queue)
 
         # Verify they are actual Queue objects
         self.assertIsInstance(manager.record_queue, mp.queues.Queue)
         self.assertIsInstance(manager.playback_queue, mp.queues.Queue)
-        self.assertIsInstance(manager.audio_queue, mp.queues.Queue)
 
     def test_queue_manager_child_process_uses_existing_queues(self):
         """Test that AudioQueueManager uses existing queues in child process mode."""
         # Create queues externally
         record_queue = mp.Queue()
         playback_queue = mp.Queue()
-        audio_queue = mp.Queue()
 
         # Create manager in child mode
         manager = AudioQueueManager(
             record_queue=record_queue,
             playback_queue=playback_queue,
-            audio_queue=audio_queue,
         )
 
         # Verify it uses the provided queues
         self.assertIs(manager.record_queue, record_queue)
         self.assertIs(manager.playback_queue, playback_queue)
-        self.assertIs(manager.audio_queue, audio_queue)
 
     def test_record_command_communication(self):
         """Test sending and receiving record commands through real queues."""
@@ -114,23 +108,6 @@ class TestIPCCommunication(unittest.TestCase):
         command = manager.get_playback_command(timeout=0.1)
         self.assertEqual(command["action"], "stop")
 
-    def test_audio_data_queue_communication(self):
-        """Test sending and receiving audio data through visualization queue."""
-        manager = AudioQueueManager()
-
-        # Create test audio data
-        audio_data = np.random.random((1024, 1)).astype(np.float32)
-
-        # Send data
-        success = manager.put_audio_data(audio_data)
-        self.assertTrue(success)
-
-        # Receive data
-        received_data = manager.get_audio_data(timeout=0.1)
-
-        # Verify data integrity
-        np.testing.assert_array_equal(received_data, audio_data)
-
     def test_queue_full_handling(self):
         """Test behavior when queue is full."""
         # Create manager with small queue
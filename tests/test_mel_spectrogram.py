@@ -0,0 +1,38 @@
+"""Tests for the mel spectrogram processor."""
+
+import unittest
+
+import numpy as np
+
+from revoxx.audio.processors.mel_spectrogram import MelSpectrogramProcessor
+from revoxx.constants import AudioConstants
+
+
+class TestMelSpectrogramProcessor(unittest.TestCase):
+    """Test cases for MelSpectrogramProcessor."""
+
+    def setUp(self):
+        """Create a processor and a short test signal."""
+        self.processor, self.n_mels = MelSpectrogramProcessor.create_for(48000)
+        rng = np.random.default_rng(0)
+        self.audio = (rng.standard_normal(48000) * 0.1).astype(np.float32)
+
+    def test_process_frames_matches_process(self):
+        """Test batched frames give the same result as per-frame processing."""
+        n_fft = AudioConstants.N_FFT
+        hop = AudioConstants.HOP_LENGTH
+        n_frames = 1 + (len(self.audio) - n_fft) // hop
+        frames = np.stack(
+            [self.audio[i * hop : i * hop + n_fft] for i in range(n_frames)]
+        )
+
+        batched = self.processor.process_frames(frames)
+
+        self.assertEqual(batched.shape, (self.n_mels, n_frames))
+        for i in (0, n_frames // 2, n_frames - 1):
+            expected, _ = self.processor.process(frames[i])
+            np.testing.assert_allclose(batched[:, i], expected, atol=1e-9)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -155,6 +155,17 @@ class TestNavigationController(unittest.TestCase):
             "test_label", 1
         )
 
+    def test_browse_takes_from_missing_take(self):
+        """Test browsing starts from the nearest lower take if the current one is gone."""
+        self.mock_app.active_recordings.get_existing_takes.return_value = [1, 4, 7]
+        self.mock_app.state.recording.get_current_take.return_value = 5
+
+        self.controller.browse_takes(1)
+
+        self.mock_app.state.recording.set_displayed_take.assert_called_once_with(
+            "test_label", 7
+        )
+
     def test_browse_takes_no_more_forward(self):
         """Test browsing when no more takes forward."""
         self.mock_app.state.recording.get_current_take.return_value = 3
@@ -2,9 +2,9 @@
 
 import unittest
 from unittest.mock import Mock, patch
-import queue
 
-from revoxx.controllers.process_manager import ProcessManager
+from revoxx.audio.shared_state import SharedState
+from revoxx.controllers.process_manager import ProcessManager, _process_context
 
 
 class TestProcessManager(unittest.TestCase):
@@ -15,44 +15,39 @@ class TestProcessManager(unittest.TestCase):
         # Create mock app with minimal required attributes
         self.mock_app = Mock()
         self.mock_app.config.audio = Mock()
-        self.mock_app.shared_state.name = "test_shared_state"
+        self.shared_state = SharedState(create=True)
+        self.mock_app.shared_state = self.shared_state
         self.mock_app.window.ui_state.spectrogram_visible = False
 
         # Create controller with mocked initialization
         with patch.object(ProcessManager, "_initialize_resources"):
             self.controller = ProcessManager(self.mock_app)
 
-        self.controller.manager = Mock()
         self.controller.shutdown_event = Mock()
-        self.controller.manager_dict = {"save_path": None}
-        self.controller.audio_queue = Mock()
         self.controller.record_queue = Mock()
         self.controller.playback_queue = Mock()
         self.controller.queue_manager = Mock()
-        self.controller.queue_manager.get_audio_data = Mock(side_effect=queue.Empty)
+
+    def tearDown(self):
+        """Release shared memory."""
+        self.shared_state.close()
+        self.shared_state.unlink()
 
     @patch("revoxx.controllers.process_manager.AudioQueueManager")
-    @patch("revoxx.controllers.process_manager.mp.Manager")
-    @patch("revoxx.controllers.process_manager.mp.Event")
-    def test_initialize_resources(
-        self, mock_event_class, mock_manager_class, mock_queue_manager_class
-    ):
+    @patch("revoxx.controllers.process_manager._process_context")
+    def test_initialize_resources(self, mock_context_func, mock_queue_manager_class):
         """Test initializing multiprocessing resources."""
         # Setup mocks
-        mock_manager = Mock()
-        mock_dict = {}  # Use real dict instead of Mock
-        mock_manager.dict = Mock(return_value=mock_dict)
-        mock_manager_class.return_value = mock_manager
-
+        mock_context = Mock()
+        mock_context_func.return_value = mock_context
         mock_event = Mock()
+        mock_event_class = mock_context.Event
         mock_event_class.return_value = mock_event
 
         # Mock AudioQueueManager
         mock_queue_manager = Mock()
-        mock_audio_queue = Mock()
         mock_record_queue = Mock()
         mock_playback_queue = Mock()
-        mock_queue_manager.audio_queue = mock_audio_queue
         mock_queue_manager.record_queue = mock_record_queue
         mock_queue_manager.playback_queue = mock_playback_queue
         mock_queue_manager_class.return_value = mock_queue_manager
@@ -60,31 +55,31 @@ class TestProcessManager(unittest.TestCase):
         # Create new controller to test initialization
         controller = ProcessManager(self.mock_app)
 
-        # Verify manager creation
-        mock_manager_class.assert_called_once()
-        mock_event_class.assert_called_once()
-        mock_queue_manager_class.assert_called_once()
+        # Shutdown event and data-ready event
+        self.assertEqual(mock_event_class.call_count, 2)
+        mock_queue_manager_class.assert_called_once_with(context=mock_context)
 
         # Verify controller has correct references
-        self.assertEqual(controller.manager, mock_manager)
         self.assertEqual(controller.shutdown_event, mock_event)
-        self.assertEqual(controller.manager_dict, mock_dict)
+        self.assertEqual(controller.data_ready, mock_event)
         self.assertEqual(controller.queue_manager, mock_queue_manager)
-        self.assertEqual(controller.audio_queue, mock_audio_queue)
         self.assertEqual(controller.record_queue, mock_record_queue)
         self.assertEqual(controller.playback_queue, mock_playback_queue)
 
         # Verify app references set
         self.assertEqual(self.mock_app.shutdown_event, mock_event)
-        self.assertEqual(self.mock_app.manager_dict, mock_dict)
+
+        # Verify VAD availability is known without a manager process
+        self.assertIn("vad_available", controller.vad_availability)
         self.assertEqual(self.mock_app.queue_manager, mock_queue_manager)
         # Direct queue references are no longer set in app
         self.assertIsNotNone(self.mock_app.queue_manager)
 
-    @patch("revoxx.controllers.process_manager.mp.Process")
-    def test_start_processes(self, mock_process_class):
+    def test_start_processes(self):
         """Test starting background processes."""
         # Setup
+        self.controller.mp_context = Mock()
+        mock_process_class = self.controller.mp_context.Process
         mock_process = Mock()
         mock_process_class.return_value = mock_process
 
@@ -101,6 +96,13 @@ class TestProcessManager(unittest.TestCase):
         self.assertIsNotNone(self.controller.record_process)
         self.assertIsNotNone(self.controller.playback_process)
 
+    @patch("revoxx.controllers.process_manager.sys")
+    def test_process_context_uses_fork_on_linux(self, mock_sys):
+        """Test audio processes are forked on Linux."""
+        mock_sys.platform = "linux"
+
+        self.assertEqual(_process_context().get_start_method(), "fork")
+
     @patch("revoxx.controllers.process_manager.threading.Thread")
     def test_start_audio_queue_processing(self, mock_thread_class):
         """Test starting audio queue processing."""
@@ -183,17 +185,46 @@ class TestProcessManager(unittest.TestCase):
         mock_process.terminate.assert_called_once()
         mock_process.kill.assert_called_once()
 
+    def test_shutdown_terminates_processes_before_waiting(self):
+        """Test all processes are signalled before any of them is joined."""
+        calls = []
+        processes = []
+        for name in ("record", "playback"):
+            process = Mock()
+            process.is_alive = Mock(side_effect=[True, False])
+            process.terminate = Mock(side_effect=lambda n=name: calls.append(n))
+            process.join = Mock(side_effect=lambda timeout: calls.append("join"))
+            processes.append(process)
+        self.controller.record_process, self.controller.playback_process = processes
+
+        self.controller.shutdown()
+
+        self.assertEqual(calls, ["record", "playback", "join", "join"])
+        for process in processes:
+            process.kill.assert_not_called()
+
     def test_shutdown_with_broken_pipe(self):
         """Test shutdown with broken pipe errors."""
         # Ensure shutdown_event is set up
         self.controller.shutdown_event = Mock()
 
-        # Setup manager that raises BrokenPipeError
-        self.controller.manager.shutdown.side_effect = BrokenPipeError
+        # Setup queue that raises BrokenPipeError on close
+        self.controller.record_queue.close.side_effect = BrokenPipeError
 
         # Should not raise exception
         self.controller.shutdown()
 
+    def test_shutdown_does_not_wait_for_queue_feeders(self):
+        """Test queues are closed without joining their feeder threads."""
+        self.controller.shutdown_event = Mock()
+        record_queue = self.controller.record_queue
+
+        self.controller.shutdown()
+
+        record_queue.cancel_join_thread.assert_called_once()
+        record_queue.close.assert_called_once()
+        record_queue.join_thread.assert_not_called()
+
     def test_is_audio_queue_active_true(self):
         """Test checking if audio queue is active - true."""
         self.controller.set_audio_queue_active(True)
@@ -210,13 +241,18 @@ class TestProcessManager(unittest.TestCase):
 
         self.assertFalse(result)
 
-    def test_is_audio_queue_active_no_dict(self):
-        """Test checking audio queue when no dict."""
-        self.controller.manager_dict = None
-
-        result = self.controller.is_audio_queue_active()
-
-        self.assertFalse(result)
+    def test_flags_visible_to_attached_process(self):
+        """Test queue flag and save path are read from shared memory."""
+        attached = SharedState(create=False)
+        attached.attach_to_existing(self.shared_state.name)
+        try:
+            self.controller.set_audio_queue_active(True)
+            self.controller.set_save_path("/test/path.wav")
+
+            self.assertTrue(attached.is_audio_queue_active())
+            self.assertEqual(attached.get_save_path(), "/test/path.wav")
+        finally:
+            attached.close()
 
     def test_are_processes_running_true(self):
         """Test checking if processes are running - true."""
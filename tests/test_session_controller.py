@@ -4,6 +4,8 @@ import unittest
 from unittest.mock import Mock, patch
 from pathlib import Path
 
+from revoxx.utils.config import AudioConfig
+
 from revoxx.controllers.session_controller import (
     SessionController,
     REFERENCE_SILENCE_LABEL,
@@ -34,12 +36,7 @@ class TestSessionController(unittest.TestCase):
 
         # Mock config
         self.mock_app.config = Mock()
-        self.mock_app.config.audio = Mock()
-        self.mock_app.config.audio.sample_rate = 48000
-        self.mock_app.config.audio.bit_depth = 24
-        self.mock_app.config.audio.channels = 1
-        self.mock_app.config.audio.input_device = None
-        self.mock_app.config.audio.__post_init__ = Mock()
+        self.mock_app.config.audio = AudioConfig(sample_rate=48000, bit_depth=24)
 
         # Mock current session
         self.mock_app.current_session = None
@@ -62,8 +59,12 @@ class TestSessionController(unittest.TestCase):
         # Mock navigation controller
         self.mock_app.navigation_controller = Mock()
 
-        # Mock shared state
+        # Mock shared state, in sync with the config
         self.mock_app.shared_state = Mock()
+        self.mock_app.shared_state.get_audio_settings.return_value = {
+            "sample_rate": 48000,
+            "bit_depth": 24,
+        }
 
         # Mock settings manager
         self.mock_app.settings_manager = Mock()
@@ -275,6 +276,51 @@ class TestSessionController(unittest.TestCase):
             # resume_at_last_recording is called in app.py after load_session, not in the controller itself
             self.assertEqual(self.mock_app.config.audio.sample_rate, 44100)
             self.assertEqual(self.mock_app.config.audio.bit_depth, 16)
+            self.assertEqual(self.mock_app.config.audio.dtype, "int16")
+            self.mock_app.device_controller.update_audio_settings.assert_called_once()
+
+    @patch("revoxx.controllers.session_controller.RecordingFileManager")
+    @patch("revoxx.controllers.session_controller.ActiveRecordings")
+    def test_load_session_same_audio_format(self, mock_ar_class, mock_fm_class):
+        """Test a session with the current audio format skips reconfiguration."""
+        mock_session = Mock()
+        mock_session.session_dir = Path("/test/session.revoxx")
+        mock_session.audio_config.sample_rate = 48000
+        mock_session.audio_config.bit_depth = 24
+
+        audio = self.mock_app.config.audio
+        with patch.object(self.controller, "reload_script_and_recordings"):
+            self.controller.load_session(mock_session)
+
+        self.assertIs(self.mock_app.config.audio, audio)
+        self.mock_app.settings_manager.update_settings.assert_not_called()
+        self.mock_app.device_controller.update_audio_settings.assert_not_called()
+        self.mock_app.device_controller.apply_session_audio_settings.assert_called_once_with(
+            mock_session.audio_config
+        )
+
+    @patch("revoxx.controllers.session_controller.RecordingFileManager")
+    @patch("revoxx.controllers.session_controller.ActiveRecordings")
+    def test_load_session_syncs_stale_shared_state(self, mock_ar_class, mock_fm_class):
+        """Test the audio processes get the session format at startup.
+
+        The saved settings already match the session, but the shared state
+        still holds the defaults it was created with.
+        """
+        mock_session = Mock()
+        mock_session.session_dir = Path("/test/session.revoxx")
+        mock_session.audio_config.sample_rate = 48000
+        mock_session.audio_config.bit_depth = 24
+        self.mock_app.shared_state.get_audio_settings.return_value = {
+            "sample_rate": 44100,
+            "bit_depth": 16,
+        }
+
+        with patch.object(self.controller, "reload_script_and_recordings"):
+            self.controller.load_session(mock_session)
+
+        self.mock_app.settings_manager.update_settings.assert_not_called()
+        self.mock_app.device_controller.update_audio_settings.assert_called_once()
 
     def test_load_script_no_session(self):
         """Test loading script with no session."""
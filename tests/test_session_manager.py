@@ -362,19 +362,14 @@ class TestSessionManager(unittest.TestCase):
         self.assertFalse(result["valid"])
         self.assertIn("Missing session.json", result["errors"])
 
-    @patch("sounddevice.query_devices")
-    def test_get_compatible_devices(self, mock_query):
+    @patch("revoxx.session.manager.get_device_manager")
+    def test_get_compatible_devices(self, mock_manager_get_dm):
         """Test finding compatible audio devices."""
-        # Mock device list
-        mock_query.return_value = [
-            {"name": "Device1", "max_input_channels": 2, "default_samplerate": 44100},
-            {"name": "Device2", "max_input_channels": 2, "default_samplerate": 44100},
-            {
-                "name": "Device3",
-                "max_input_channels": 0,
-                "default_samplerate": 44100,
-            },  # Output only
-            {"name": "Device4", "max_input_channels": 1, "default_samplerate": 44100},
+        # Mock cached input device list
+        mock_manager_get_dm.return_value.get_input_devices.return_value = [
+            {"index": 0, "name": "Device1", "max_input_channels": 2},
+            {"index": 1, "name": "Device2", "max_input_channels": 2},
+            {"index": 3, "name": "Device4", "max_input_channels": 1},
         ]
 
         config = SessionConfig(
@@ -423,6 +418,26 @@ class TestSessionManager(unittest.TestCase):
         last = new_manager.get_last_session()
         self.assertEqual(last, session.session_dir)
 
+    def test_recent_sessions_sees_other_manager_writes(self):
+        """Test cached recent sessions refresh after another manager writes."""
+        script_file = self.base_dir / "test_script.txt"
+        script_file.write_text('(utt_001 "Test utterance")')
+
+        # Prime the cache before any session exists
+        observer = SessionManager(self.settings_file)
+        self.assertEqual(observer.get_recent_sessions(), [])
+
+        session = self.manager.create_session(
+            base_dir=self.base_dir,
+            speaker_name="Cached",
+            gender="F",
+            emotion="neutral",
+            audio_config=self.audio_config,
+            script_source=script_file,
+        )
+
+        self.assertEqual(observer.get_recent_sessions(), [session.session_dir])
+
     def test_settings_file_creation(self):
         """Test settings file is created if it doesn't exist."""
         # Create test script file
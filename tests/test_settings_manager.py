@@ -0,0 +1,70 @@
+"""Tests for the SettingsManager."""
+
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from revoxx.utils.settings_manager import SettingsManager
+
+
+class TestSettingsManager(unittest.TestCase):
+    """Test cases for SettingsManager."""
+
+    def setUp(self):
+        """Create a settings manager writing to a temporary home."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        with patch.object(Path, "home", return_value=self.temp_dir):
+            self.manager = SettingsManager()
+
+    def tearDown(self):
+        """Clean up the temporary home."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_update_settings_writes_once(self):
+        """Test several settings are saved with a single write."""
+        with patch.object(
+            self.manager, "save_settings", wraps=self.manager.save_settings
+        ) as save:
+            self.manager.update_settings(
+                {"sample_rate": 44100, "bit_depth": 16, "unknown_key": 1}
+            )
+
+        save.assert_called_once()
+        with open(self.manager.settings_file) as f:
+            data = json.load(f)
+        self.assertEqual(data["sample_rate"], 44100)
+        self.assertEqual(data["bit_depth"], 16)
+        self.assertNotIn("unknown_key", data)
+
+    def test_unchanged_setting_is_not_saved(self):
+        """Test the file is not rewritten when nothing changed."""
+        with patch.object(self.manager, "save_settings") as save:
+            self.manager.update_setting(
+                "sample_rate", self.manager.settings.sample_rate
+            )
+            self.manager.update_setting("unknown_key", 1)
+
+        save.assert_not_called()
+
+    def test_save_window_settings_skips_unchanged(self):
+        """Test unchanged window geometry does not rewrite the file."""
+        window_settings = {"geometry": "800x600+10+10", "fullscreen": False}
+        with patch.object(self.manager, "save_settings") as save:
+            self.manager.save_window_settings("main", window_settings)
+            self.manager.save_window_settings("main", dict(window_settings))
+            self.assertEqual(save.call_count, 1)
+
+            self.manager.save_window_settings("main", {"geometry": "800x600+20+10"})
+            self.assertEqual(save.call_count, 2)
+
+        self.assertEqual(
+            self.manager.settings.windows["main"],
+            {"geometry": "800x600+20+10", "fullscreen": False},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
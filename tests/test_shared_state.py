@@ -0,0 +1,87 @@
+"""Tests for the struct-based shared state."""
+
+import unittest
+
+from revoxx.audio.shared_state import (
+    SharedState,
+    PLAYBACK_STATUS_IDLE,
+    RECORDING_STATUS_STOPPED,
+    SETTINGS_STATUS_VALID,
+    SHARED_STATUS_INVALID,
+    SAVE_PATH_MAX_BYTES,
+)
+
+
+class TestSharedState(unittest.TestCase):
+    """Test cases for SharedState."""
+
+    def setUp(self):
+        """Create a fresh shared state."""
+        self.state = SharedState(create=True)
+
+    def tearDown(self):
+        """Release shared memory."""
+        self.state.close()
+        self.state.unlink()
+
+    def test_initialize(self):
+        """Test initialize writes playback, recording and settings at once."""
+        self.state.initialize(
+            sample_rate=48000, bit_depth=24, channels=1, format_type=1
+        )
+
+        self.assertEqual(
+            self.state.get_playback_state()["status"], PLAYBACK_STATUS_IDLE
+        )
+        self.assertEqual(
+            self.state.get_recording_state()["status"], RECORDING_STATUS_STOPPED
+        )
+        settings = self.state.get_audio_settings()
+        self.assertEqual(settings["status"], SETTINGS_STATUS_VALID)
+        self.assertEqual(settings["sample_rate"], 48000)
+        self.assertEqual(settings["bit_depth"], 24)
+        self.assertEqual(settings["channels"], 1)
+        self.assertEqual(settings["format_type"], 1)
+        self.assertEqual(settings["update_counter"], 1)
+
+    def test_initialize_leaves_level_meter(self):
+        """Test initialize does not touch the level meter block."""
+        self.state.initialize(sample_rate=44100, bit_depth=16)
+
+        level = self.state.get_level_meter_state()
+        self.assertEqual(level["status"], SHARED_STATUS_INVALID)
+
+    def test_control_flags(self):
+        """Test control flags default to off and can be toggled."""
+        self.assertFalse(self.state.is_audio_queue_active())
+        self.assertFalse(self.state.is_debug())
+
+        self.state.set_audio_queue_active(True)
+        self.state.set_debug(True)
+
+        self.assertTrue(self.state.is_audio_queue_active())
+        self.assertTrue(self.state.is_debug())
+
+    def test_save_path(self):
+        """Test save path round trip and clearing."""
+        self.assertIsNone(self.state.get_save_path())
+
+        self.state.set_save_path("/tmp/sessión/take_001.flac")
+        self.assertEqual(self.state.get_save_path(), "/tmp/sessión/take_001.flac")
+
+        self.state.set_save_path(None)
+        self.assertIsNone(self.state.get_save_path())
+
+    def test_save_path_too_long(self):
+        """Test overlong save paths are rejected."""
+        with self.assertRaises(ValueError):
+            self.state.set_save_path("x" * (SAVE_PATH_MAX_BYTES + 1))
+
+    def test_unlink_twice(self):
+        """Test unlinking again, e.g. from a second cleanup path, is a no-op."""
+        self.state.unlink()
+        self.state.unlink()
+
+
+if __name__ == "__main__":
+    unittest.main()
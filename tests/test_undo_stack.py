@@ -0,0 +1,29 @@
+"""Tests for the UndoStack."""
+
+import unittest
+from unittest.mock import Mock
+
+from revoxx.audio.undo_stack import UndoStack
+
+
+class TestUndoStack(unittest.TestCase):
+    """Test cases for UndoStack."""
+
+    def test_oldest_command_is_dropped(self):
+        """Test the stack keeps only the most recent max_size commands."""
+        stack = UndoStack(max_size=3)
+        commands = [Mock() for _ in range(5)]
+        for cmd in commands:
+            stack.push(cmd)
+
+        self.assertEqual(stack.undo_count, 3)
+        self.assertIs(stack.peek_undo(), commands[-1])
+
+        file_manager = Mock()
+        undone = [stack.undo(file_manager) for _ in range(4)]
+        self.assertEqual(undone, commands[:1:-1] + [None])
+        self.assertEqual(stack.redo_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()